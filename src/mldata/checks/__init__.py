@@ -1,16 +1,22 @@
 """Quality checks module."""
 
-from mldata.checks.base import BaseCheck, CheckResult
+from mldata.checks.base import BaseCheck, CheckResult, DatasetHandle
 from mldata.checks.duplicates import DuplicateCheck
 from mldata.checks.labels import LabelDistributionCheck
+from mldata.checks.leakage import LeakageCheck
 from mldata.checks.missing import MissingValueCheck
+from mldata.checks.runner import CheckRunner, discover_checks
 from mldata.checks.schema import SchemaConsistencyCheck
 
 __all__ = [
     "BaseCheck",
     "CheckResult",
+    "CheckRunner",
+    "DatasetHandle",
     "DuplicateCheck",
     "LabelDistributionCheck",
+    "LeakageCheck",
     "MissingValueCheck",
     "SchemaConsistencyCheck",
+    "discover_checks",
 ]
@@ -1,12 +1,16 @@
 """Base check interface."""
 
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import polars as pl
 from pydantic import BaseModel
 
+from mldata.core.normalize import NormalizeService
+
 
 class CheckSeverity(str, Enum):
     """Severity level of a quality check."""
@@ -37,6 +41,59 @@ class CheckResult(BaseModel):
     duration_ms: float | None = None
 
 
+class DatasetHandle:
+    """A dataset shared by the checks of one run.
+
+    Data files are found and the table is read on first use only, and at
+    most once however many checks (or threads) ask for it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        data_files: list[Path] | None = None,
+        frame: pl.DataFrame | None = None,
+        in_memory: bool = True,
+    ):
+        """Initialize the handle.
+
+        Args:
+            path: Dataset directory or data file
+            data_files: Data shards, when already known (found under path otherwise)
+            frame: Table already read from the shards, to share instead of reading again
+            in_memory: Serve lazy() from the loaded table; when False, lazy()
+                scans the files so checks can stream datasets larger than memory
+        """
+        self.path = path
+        self.in_memory = in_memory
+        self._data_files = data_files
+        self._frame = frame
+        self._lock = threading.Lock()
+
+    @property
+    def data_files(self) -> list[Path]:
+        """Data shards that make up the dataset."""
+        with self._lock:
+            if self._data_files is None:
+                self._data_files = NormalizeService().find_data_files(self.path)
+            return self._data_files
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        """The whole table, read on first access."""
+        data_files = self.data_files
+        with self._lock:
+            if self._frame is None:
+                self._frame = NormalizeService().read_dataset(data_files)
+            return self._frame
+
+    def lazy(self) -> pl.LazyFrame:
+        """LazyFrame over the dataset, backed by the loaded table when there is one."""
+        if self.in_memory or self._frame is not None:
+            return self.frame.lazy()
+        return NormalizeService().scan_dataset(self.data_files)
+
+
 class BaseCheck(ABC):
     """Abstract base class for quality checks."""
 
@@ -57,6 +114,21 @@ class BaseCheck(ABC):
         """
         ...
 
+    def run_on(self, dataset: DatasetHandle, config: dict | None = None) -> CheckResult:
+        """Execute the check against a dataset shared with other checks.
+
+        Checks that read the table override this to use the shared handle;
+        the default hands run() the dataset path.
+
+        Args:
+            dataset: Shared dataset handle
+            config: Check configuration
+
+        Returns:
+            CheckResult
+        """
+        return self.run(dataset.path, config)
+
     @property
     def configurable_params(self) -> dict:
         """Return configurable parameters with defaults."""
@@ -4,7 +4,8 @@ from pathlib import Path
 
 import polars as pl
 
-from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus, DatasetHandle
+from mldata.core.dedup import DuplicateService, NearDuplicateService
 
 
 class DuplicateCheck(BaseCheck):
@@ -18,51 +19,87 @@ class DuplicateCheck(BaseCheck):
         return {
             "threshold": 0.95,
             "hash_columns": None,
+            "memory_budget_mb": None,
+            "return_ids": False,
+            "text_column": None,
+            "workers": None,
         }
 
     def run(self, dataset_path: Path, config: dict | None = None) -> CheckResult:
-        # Find data files
-        data_files = list(dataset_path.glob("*.csv")) + list(dataset_path.glob("*.parquet"))
+        # Scanned, not loaded: duplicates are found from row hashes
+        return self.run_on(DatasetHandle(dataset_path, in_memory=False), config)
 
-        if not data_files:
+    def run_on(self, dataset: DatasetHandle, config: dict | None = None) -> CheckResult:
+        # All shards are checked as one table
+        if not dataset.data_files:
             return CheckResult(
                 check_name=self.name,
                 status=CheckStatus.SKIPPED,
                 message="No data files found",
             )
 
-        # Check first data file
-        data_file = data_files[0]
+        config = config or {}
+        hash_columns = config.get("hash_columns")
+        memory_budget_mb = config.get("memory_budget_mb")
+        return_ids = config.get("return_ids", False)
+        threshold = config.get("threshold", 0.95)
 
-        if data_file.suffix == ".csv":
-            df = pl.read_csv(data_file)
-        else:
-            df = pl.read_parquet(data_file)
+        lf = dataset.lazy()
 
-        # Exact duplicates
-        total = len(df)
-        unique = df.unique().height
-        exact_duplicates = total - unique
+        # Exact duplicates, found from row hashes
+        dedup = DuplicateService(memory_budget_mb=memory_budget_mb)
+        report = dedup.find_duplicates(lf, columns=hash_columns, return_ids=return_ids)
+        total = report.total_rows
+        unique = report.unique_rows
+        exact_duplicates = report.duplicate_rows
+
+        # Near duplicates of a text column, by MinHash/LSH at the configured similarity
+        text_column = config.get("text_column") or self._default_text_column(lf.collect_schema(), hash_columns)
+        near_report = None
+        if text_column is not None and threshold < 1:
+            near_dedup = NearDuplicateService(threshold=threshold, workers=config.get("workers"))
+            near_report = near_dedup.find_near_duplicates(lf, text_column)
+        near_duplicates = near_report.duplicate_rows if near_report else 0
+
+        details = {
+            "total_samples": total,
+            "unique_samples": unique,
+            "exact_duplicates": exact_duplicates,
+            "duplicate_ratio": exact_duplicates / total if total > 0 else 0,
+        }
+        if report.duplicate_ids is not None:
+            details["duplicate_ids"] = report.duplicate_ids.to_list()
+        if near_report is not None:
+            details["text_column"] = text_column
+            details["near_duplicates"] = near_duplicates
+            details["near_duplicate_ratio"] = near_duplicates / total if total > 0 else 0
+            if return_ids:
+                details["near_duplicate_pairs"] = near_report.pairs.select("row_index", "duplicate_of").rows()
+
+        if exact_duplicates > 0 or near_duplicates > 0:
+            found = [f"{exact_duplicates} exact duplicates"]
+            if near_report is not None:
+                found.append(f"{near_duplicates} near duplicates in '{text_column}' (similarity >= {threshold})")
 
-        if exact_duplicates > 0:
             return CheckResult(
                 check_name=self.name,
                 status=CheckStatus.FAILED,
                 severity=CheckSeverity.WARNING,
-                message=f"Found {exact_duplicates} exact duplicates",
-                details={
-                    "exact_duplicates": exact_duplicates,
-                    "duplicate_ratio": exact_duplicates / total if total > 0 else 0,
-                },
+                message=f"Found {' and '.join(found)}",
+                details=details,
                 suggestions=["Consider deduplicating the dataset before training"],
             )
 
         return CheckResult(
             check_name=self.name,
             status=CheckStatus.PASSED,
-            message="No exact duplicates found",
-            details={
-                "total_samples": total,
-                "unique_samples": unique,
-            },
+            message="No exact duplicates found" if near_report is None else "No exact or near duplicates found",
+            details=details,
         )
+
+    def _default_text_column(self, schema: pl.Schema, columns: list[str] | None) -> str | None:
+        """First string column (among the hashed columns, when given)."""
+        for name in columns or schema.names():
+            if schema[name] == pl.String:
+                return name
+        return None
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import polars as pl
 
-from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus, DatasetHandle
 
 
 class LabelDistributionCheck(BaseCheck):
@@ -21,26 +21,22 @@ class LabelDistributionCheck(BaseCheck):
         }
 
     def run(self, dataset_path: Path, config: dict | None = None) -> CheckResult:
+        return self.run_on(DatasetHandle(dataset_path), config)
+
+    def run_on(self, dataset: DatasetHandle, config: dict | None = None) -> CheckResult:
         config = config or {}
         label_column = config.get("label_column")
         imbalance_threshold = config.get("imbalance_threshold", 0.1)
 
-        # Find data files
-        data_files = list(dataset_path.glob("*.csv")) + list(dataset_path.glob("*.parquet"))
-
-        if not data_files:
+        # All shards are checked as one table
+        if not dataset.data_files:
             return CheckResult(
                 check_name=self.name,
                 status=CheckStatus.SKIPPED,
                 message="No data files found",
             )
 
-        data_file = data_files[0]
-
-        if data_file.suffix == ".csv":
-            df = pl.read_csv(data_file)
-        else:
-            df = pl.read_parquet(data_file)
+        df = dataset.frame
 
         # Auto-detect label column if not specified
         if label_column is None:
@@ -0,0 +1,75 @@
+"""Cross-split leakage check."""
+
+from pathlib import Path
+
+from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from mldata.core.normalize import NormalizeService
+from mldata.core.split import SplitService
+
+
+class LeakageCheck(BaseCheck):
+    """Check that no row appears in more than one split."""
+
+    name = "leakage"
+    description = "Detect identical rows shared between train/val/test splits"
+
+    @property
+    def configurable_params(self) -> dict:
+        return {
+            "columns": None,
+        }
+
+    def run(self, dataset_path: Path, config: dict | None = None) -> CheckResult:
+        config = config or {}
+        columns = config.get("columns")
+
+        splits_dir = dataset_path / "splits"
+        if not splits_dir.exists():
+            return CheckResult(
+                check_name=self.name,
+                status=CheckStatus.SKIPPED,
+                message="No splits directory found",
+            )
+
+        # Use the first format any split is stored in
+        split_service = SplitService()
+        split_format = next(
+            (
+                fmt
+                for fmt in NormalizeService.DATASET_FORMATS
+                if any(split_service.find_split_files(splits_dir, name, fmt) for name in ("train", "val", "test"))
+            ),
+            None,
+        )
+        if split_format is None:
+            return CheckResult(
+                check_name=self.name,
+                status=CheckStatus.SKIPPED,
+                message="No split files found",
+            )
+
+        report = split_service.check_leakage(splits_dir, split_format, columns=columns)
+        details = {
+            "split_rows": report.split_rows,
+            "pairs": report.pairs,
+        }
+
+        if report.leaked_rows > 0:
+            leaks = ", ".join(
+                f"{pair['splits'][0]}/{pair['splits'][1]}: {pair['shared_rows']}" for pair in report.pairs if pair["shared_rows"]
+            )
+            return CheckResult(
+                check_name=self.name,
+                status=CheckStatus.FAILED,
+                severity=CheckSeverity.ERROR,
+                message=f"Found rows shared between splits ({leaks})",
+                details=details,
+                suggestions=["Deduplicate the dataset before splitting, or split by a key column with --split-key"],
+            )
+
+        return CheckResult(
+            check_name=self.name,
+            status=CheckStatus.PASSED,
+            message="Splits are disjoint",
+            details=details,
+        )
@@ -2,9 +2,7 @@
 
 from pathlib import Path
 
-import polars as pl
-
-from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus, DatasetHandle
 
 
 class MissingValueCheck(BaseCheck):
@@ -21,26 +19,22 @@ class MissingValueCheck(BaseCheck):
         }
 
     def run(self, dataset_path: Path, config: dict | None = None) -> CheckResult:
+        return self.run_on(DatasetHandle(dataset_path), config)
+
+    def run_on(self, dataset: DatasetHandle, config: dict | None = None) -> CheckResult:
         config = config or {}
         max_missing_ratio = config.get("max_missing_ratio", 0.05)
         columns = config.get("columns")
 
-        # Find data files
-        data_files = list(dataset_path.glob("*.csv")) + list(dataset_path.glob("*.parquet"))
-
-        if not data_files:
+        # All shards are checked as one table
+        if not dataset.data_files:
             return CheckResult(
                 check_name=self.name,
                 status=CheckStatus.SKIPPED,
                 message="No data files found",
             )
 
-        data_file = data_files[0]
-
-        if data_file.suffix == ".csv":
-            df = pl.read_csv(data_file)
-        else:
-            df = pl.read_parquet(data_file)
+        df = dataset.frame
 
         total = len(df)
         issues = []
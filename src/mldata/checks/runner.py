@@ -0,0 +1,124 @@
+"""Check discovery and concurrent execution."""
+
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import entry_points
+from pathlib import Path
+
+from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus, DatasetHandle
+
+# Entry point group third-party packages register BaseCheck subclasses under
+ENTRY_POINT_GROUP = "mldata.checks"
+
+
+def discover_checks(include_plugins: bool = True) -> dict[str, type[BaseCheck]]:
+    """Find every available check class, keyed by check name.
+
+    Built-in checks are the loaded BaseCheck subclasses; plugins are the
+    classes registered under the ``mldata.checks`` entry point group, e.g.
+    ``[project.entry-points."mldata.checks"] pii = "my_pkg.checks:PIICheck"``.
+    A plugin that fails to load is skipped. When two classes share a name,
+    the one found first (built-ins before plugins) wins.
+
+    Args:
+        include_plugins: Also load checks registered by installed packages
+
+    Returns:
+        Mapping of check name to check class
+    """
+    # Importing the package registers the built-in subclasses
+    import mldata.checks  # noqa: F401
+
+    classes: list[type[BaseCheck]] = []
+    pending = list(BaseCheck.__subclasses__())
+    while pending:
+        cls = pending.pop(0)
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+
+    if include_plugins:
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                cls = entry_point.load()
+            except Exception:
+                continue
+            if isinstance(cls, type) and issubclass(cls, BaseCheck):
+                classes.append(cls)
+
+    registry: dict[str, type[BaseCheck]] = {}
+    for cls in classes:
+        if not inspect.isabstract(cls):
+            registry.setdefault(cls.name, cls)
+    return registry
+
+
+class CheckRunner:
+    """Run checks concurrently against one shared dataset."""
+
+    def __init__(self, checks: dict[str, type[BaseCheck]] | None = None, workers: int | None = None):
+        """Initialize the runner.
+
+        Args:
+            checks: Available checks by name (default: discover_checks())
+            workers: Checks run at the same time (default: one thread per check)
+        """
+        self.checks = checks if checks is not None else discover_checks()
+        self.workers = workers
+
+    @property
+    def default_checks(self) -> list[str]:
+        """Names of the checks enabled by default."""
+        return [name for name, cls in self.checks.items() if cls.default_enabled]
+
+    def run(
+        self,
+        dataset: DatasetHandle | Path,
+        names: list[str] | None = None,
+        config: dict[str, dict] | None = None,
+    ) -> list[CheckResult]:
+        """Run checks on threads that share one dataset handle.
+
+        The handle reads the data once, on behalf of whichever check asks
+        first; Polars releases the GIL while it works, so checks overlap.
+        Every result has duration_ms set, and a check that raises becomes
+        an ERROR result instead of aborting the others.
+
+        Args:
+            dataset: Shared handle, or dataset path to open one for
+            names: Checks to run (default: default_checks)
+            config: Per-check configuration, keyed by check name
+
+        Returns:
+            CheckResult per check, in the order of names
+        """
+        names = list(names) if names is not None else self.default_checks
+        unknown = [name for name in names if name not in self.checks]
+        if unknown:
+            raise ValueError(f"Unknown checks: {', '.join(unknown)}. Available: {', '.join(sorted(self.checks))}")
+
+        if not isinstance(dataset, DatasetHandle):
+            dataset = DatasetHandle(dataset)
+        config = config or {}
+
+        if not names:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.workers or len(names)) as pool:
+            futures = [pool.submit(self._run_check, self.checks[name](), dataset, config.get(name)) for name in names]
+            return [future.result() for future in futures]
+
+    def _run_check(self, check: BaseCheck, dataset: DatasetHandle, config: dict | None) -> CheckResult:
+        """Run one check, timing it and turning exceptions into results."""
+        start = time.perf_counter()
+        try:
+            result = check.run_on(dataset, config)
+        except Exception as e:
+            result = CheckResult(
+                check_name=check.name,
+                status=CheckStatus.ERROR,
+                severity=CheckSeverity.ERROR,
+                message=str(e),
+            )
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
@@ -2,9 +2,8 @@
 
 from pathlib import Path
 
-import polars as pl
-
 from mldata.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from mldata.core.normalize import NormalizeService
 
 
 class SchemaConsistencyCheck(BaseCheck):
@@ -23,7 +22,8 @@ class SchemaConsistencyCheck(BaseCheck):
                 message="No splits directory found",
             )
 
-        split_files = list(splits_dir.glob("*.csv")) + list(splits_dir.glob("*.parquet"))
+        normalize = NormalizeService()
+        split_files = normalize.find_data_files(splits_dir)
 
         if len(split_files) < 2:
             return CheckResult(
@@ -32,27 +32,19 @@ class SchemaConsistencyCheck(BaseCheck):
                 message="Need at least 2 splits to check consistency",
             )
 
-        # Load first split as reference
+        # Use first split as reference; only schemas are read, not the data
         first_file = split_files[0]
-        if first_file.suffix == ".csv":
-            ref_df = pl.read_csv(first_file)
-        else:
-            ref_df = pl.read_parquet(first_file)
-
-        ref_columns = set(ref_df.columns)
-        ref_schema = {col: ref_df[col].dtype for col in ref_df.columns}
+        ref_schema = normalize.scan_data(first_file).collect_schema()
+        ref_columns = set(ref_schema.names())
 
         issues = []
         consistent = True
 
         for split_file in split_files[1:]:
-            if split_file.suffix == ".csv":
-                df = pl.read_csv(split_file)
-            else:
-                df = pl.read_parquet(split_file)
+            schema = normalize.scan_data(split_file).collect_schema()
 
             # Check columns
-            split_columns = set(df.columns)
+            split_columns = set(schema.names())
             if split_columns != ref_columns:
                 missing = ref_columns - split_columns
                 extra = split_columns - ref_columns
@@ -67,15 +59,15 @@ class SchemaConsistencyCheck(BaseCheck):
                 consistent = False
 
             # Check types
-            for col in df.columns:
-                if col in ref_schema and df[col].dtype != ref_schema[col]:
+            for col, dtype in schema.items():
+                if col in ref_schema and dtype != ref_schema[col]:
                     issues.append(
                         {
                             "file": split_file.name,
                             "issue": "Type mismatch",
                             "column": col,
                             "expected": str(ref_schema[col]),
-                            "actual": str(df[col].dtype),
+                            "actual": str(dtype),
                         }
                     )
                     consistent = False
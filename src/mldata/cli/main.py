@@ -245,18 +245,27 @@ def pull_cmd(
 def build_cmd(
     uri: str = typer.Argument(..., help="Dataset URI"),
     output: str | None = typer.Option(None, "-o", "--output", help="Output directory"),
-    format: str = typer.Option("parquet", "-f", "--format", help="Output format (parquet, csv, jsonl)"),
+    format: str = typer.Option("parquet", "-f", "--format", help="Output format (parquet, csv, jsonl, arrow)"),
     split: str = typer.Option("0.8,0.1,0.1", "-s", "--split", help="Train/val/test split ratios"),
     seed: int | None = typer.Option(None, "--seed", help="Random seed for reproducibility"),
     stratify: str | None = typer.Option(None, "--stratify", help="Column to stratify on"),
     validate: bool = typer.Option(True, "--validate/--no-validate", help="Run quality validation"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Skip cache"),
     incremental: bool = typer.Option(False, "--incremental", help="Enable incremental builds (skip unchanged files)"),
+    streaming: bool = typer.Option(False, "--streaming", help="Run normalize, split and validate as one lazy scan/sink pipeline (bounded memory, approximate split sizes)"),
+    batch_size: int | None = typer.Option(None, "--batch-size", help="Rows per batch for --streaming (default: chosen by Polars)"),
+    row_group_size: int | None = typer.Option(None, "--row-group-size", help="Rows per Parquet row group when normalizing"),
+    memory_budget: int | None = typer.Option(None, "--memory-budget", help="Approximate memory cap in MB for streaming conversion"),
+    rng_backend: str | None = typer.Option(None, "--rng-backend", help="Shuffle generator for splits (polars, numpy, python)"),
+    split_key: str | None = typer.Option(None, "--split-key", help="Assign splits by a stable hash of this column (rows keep their split across builds)"),
 ) -> None:
     """Full pipeline: fetch, normalize, validate, split, and export a dataset."""
     import asyncio
     from pathlib import Path
 
+    import polars as pl
+
+    from mldata.core.config import Config
     from mldata.core.fetch import FetchService
     from mldata.core.incremental import IncrementalService
     from mldata.core.manifest import ManifestService
@@ -301,15 +310,20 @@ def build_cmd(
 
         # 2. Find and detect format
         console.print("[cyan]Detecting format...[/]")
-        normalize = NormalizeService()
-        # Look for data files recursively (handle split subdirs)
-        data_files = list(raw_dir.rglob("*.parquet")) + list(raw_dir.rglob("*.csv")) + list(raw_dir.rglob("*.jsonl"))
+        build_config = Config.load().build
+        normalize = NormalizeService(
+            row_group_size=row_group_size or build_config.row_group_size,
+            memory_budget_mb=memory_budget or build_config.memory_budget_mb,
+        )
+        # Look for data files recursively (handle split subdirs); all shards form one table
+        data_files = normalize.find_data_files(raw_dir)
         if not data_files:
             raise ValueError("No data files found")
 
-        # Use the first file found (e.g., train split)
-        data_file = data_files[0]
-        console.print(f"[cyan]Using: {data_file}[/]")
+        if len(data_files) == 1:
+            console.print(f"[cyan]Using: {data_files[0]}[/]")
+        else:
+            console.print(f"[cyan]Using {len(data_files)} shards under {raw_dir}[/]")
 
         # Normalize to target format
         artifacts_dir = output_dir / "artifacts"
@@ -319,17 +333,19 @@ def build_cmd(
 
         # Check for incremental skip on artifacts
         should_process = True
-        if incremental and output_file.exists():
+        if incremental and output_file.exists() and len(data_files) == 1:
             existing_hash = incremental_service.compute_file_hash(output_file)
-            new_hash = incremental_service.compute_file_hash(data_file)
+            new_hash = incremental_service.compute_file_hash(data_files[0])
             if existing_hash == new_hash:
                 console.print(f"[yellow]Skipping {output_file.name} (unchanged)[/]")
                 should_process = False
                 skipped_count += 1
 
         if should_process:
-            df = normalize.read_data(data_file)
-            normalize.convert_format(data_file, output_file, format)
+            if streaming or len(data_files) > 1:
+                normalize.sink_data(normalize.scan_dataset(data_files), output_file, format)
+            else:
+                normalize.convert_format(data_files[0], output_file, format)
             console.print(f"[green]Normalized to {format}[/]")
             processed_count += 1
 
@@ -339,12 +355,33 @@ def build_cmd(
             raise ValueError("Must provide 3 ratios (e.g., 0.8,0.1,0.1)")
 
         console.print("[cyan]Creating splits...[/]")
-        split_service = SplitService()
-        df = normalize.read_data(output_file)
-        splits = split_service.split(df, ratios=ratios, seed=seed, stratify_column=stratify)
-
+        split_backend = rng_backend or build_config.rng_backend
+        split_service = SplitService(rng_backend=split_backend)
         splits_dir = output_dir / "splits"
-        split_paths = split_service.save_splits(splits, splits_dir, format=format)
+
+        if streaming:
+            if stratify:
+                console.print("[yellow]--stratify is not supported with --streaming, using random assignment[/]")
+
+            # Each split is a lazy filter over the artifact, all sunk in one pass
+            df = normalize.scan_data(output_file)
+            split_paths = split_service.sink_splits(
+                df, splits_dir, format=format, ratios=ratios, seed=seed, key_column=split_key, normalize=normalize
+            )
+        else:
+            # Split and validate read a memory-mapped Arrow cache instead of decoding the artifact
+            if format != "arrow":
+                normalize.cache_intermediate(output_file, output_dir)
+            df = normalize.read_dataset(output_dir)
+            if split_key and incremental and splits_dir.is_dir():
+                # Keyed assignments never move, so only rows with unseen keys are written
+                split_paths = split_service.append_splits(df, splits_dir, split_key, ratios=ratios, seed=seed, format=format)
+                if not split_paths:
+                    console.print("[yellow]No new rows to split[/]")
+            else:
+                splits = split_service.split(df, ratios=ratios, seed=seed, stratify_column=stratify, key_column=split_key)
+                split_paths = split_service.save_splits(splits, splits_dir, format=format)
+
         for name, path in split_paths.items():
             console.print(f"  [green]{name}: {path}[/]")
 
@@ -352,15 +389,31 @@ def build_cmd(
         if validate:
             console.print("[cyan]Running quality checks...[/]")
             validate_service = ValidateService()
-            # Run basic checks
-            dup_result = validate_service.check_duplicates(df)
-            missing_result = validate_service.check_missing_values(df)
+            # Run basic checks in a single pass
+            run = validate_service.run_checks(df, ["duplicates", "missing"])
+            dup_result = run.results["duplicates"]
+            missing_result = run.results["missing"]
 
             console.print(f"  Duplicates: {dup_result['exact_duplicates']} found")
             console.print(f"  Missing values: {missing_result['total_missing']} found")
 
+            # Identical rows in two splits leak between train and evaluation
+            leakage = split_service.check_leakage(splits_dir, format)
+            console.print(f"  Split leakage: {leakage.leaked_rows} shared rows")
+            for pair in leakage.pairs:
+                if pair["shared_rows"]:
+                    first, second = pair["splits"]
+                    console.print(f"    [yellow]{first}/{second}: {pair['shared_rows']} rows[/]")
+
         # 5. Generate manifest
         console.print("[cyan]Generating manifest...[/]")
+        if streaming:
+            num_samples = df.select(pl.len()).collect(engine="streaming").item()
+            num_columns = len(df.collect_schema())
+        else:
+            num_samples = len(df)
+            num_columns = len(df.columns)
+
         manifest_service = ManifestService()
         artifact_hashes = manifest_service.compute_artifact_hashes(output_dir)
 
@@ -372,11 +425,13 @@ def build_cmd(
                 "split_ratios": ratios,
                 "seed": seed,
                 "stratify": stratify,
+                "rng_backend": split_backend,
+                "split_key": split_key,
             },
             dataset_info={
                 "name": dataset_name,
-                "num_samples": len(df),
-                "num_columns": len(df.columns),
+                "num_samples": num_samples,
+                "num_columns": num_columns,
             },
             artifact_hashes=artifact_hashes,
             tool_version=__version__,
@@ -393,7 +448,9 @@ def build_cmd(
         return output_dir
 
     try:
-        output_dir = asyncio.run(_build())
+        # Bound the rows held per batch by the streaming engine
+        with pl.Config(streaming_chunk_size=batch_size):
+            output_dir = asyncio.run(_build())
         console.print(f"\n[bold green]Build complete: {output_dir}[/]")
     except Exception as e:
         console.print(f"[red]Error: {e}[/]")
@@ -407,26 +464,39 @@ def build_cmd(
 @app.command("validate")
 def validate_cmd(
     path: Path = typer.Argument(..., help="Path to dataset directory or file"),
-    checks: str | None = typer.Option(None, "-c", "--checks", help="Comma-separated checks to run (duplicates, labels, missing, schema, files)"),
+    checks: str | None = typer.Option(None, "-c", "--checks", help="Comma-separated checks to run (duplicates, labels, missing, schema, files, or any registered check such as leakage)"),
     report: str | None = typer.Option(None, "-r", "--report", help="Output report path (auto-detect .md/.json)"),
     json_output: bool = typer.Option(False, "--json", help="Output JSON format"),
-    sample: float | None = typer.Option(None, "-s", "--sample", help="Sample percentage for file checks (10-100)"),
+    sample: float | None = typer.Option(None, "-s", "--sample", help="Sample percentage for file checks and tabular checks"),
+    memory_budget: int | None = typer.Option(
+        None, "--memory-budget", help="Memory cap in MB; scans lazily and spills duplicate hashes to disk when over it"
+    ),
+    workers: int | None = typer.Option(None, "-w", "--workers", help="Worker processes for file checks (default: build.workers or CPU count)"),
+    level: str = typer.Option("full", "--level", help="File check depth: header (containers only), sample (decode ~10%), full"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse results for files unchanged since the last run"),
+    content_hash: bool = typer.Option(False, "--content-hash", help="Detect unchanged files by content hash instead of size and mtime"),
+    duplicate_sampling: str = typer.Option(
+        "blocks", "--duplicate-sampling", help="With --sample: estimate duplicates from row blocks (fast) or by content hash (unbiased)"
+    ),
 ) -> None:
     """Run quality validation checks on a dataset."""
+    from mldata.checks.base import DatasetHandle
+    from mldata.checks.runner import CheckRunner
+    from mldata.core.cache import ValidationCache
+    from mldata.core.config import Config
     from mldata.core.normalize import NormalizeService
     from mldata.core.validate import FileIntegrityService, ValidateService
     from mldata.models.report import CheckResult, CheckStatus, QualityReport
 
     console.print(f"[bold]Validating: {path}[/]")
 
-    # Handle file path directly
-    data_files = []
-    if path.is_file():
-        if path.suffix.lower() in (".csv", ".parquet", ".jsonl", ".json"):
-            data_files = [path]
-    else:
-        # Find data files (look recursively in splits, artifacts, etc.)
-        data_files = list(path.rglob("*.csv")) + list(path.rglob("*.parquet")) + list(path.rglob("*.jsonl"))
+    config = Config.load()
+    validation_cache = ValidationCache(content_hash=content_hash) if cache else None
+
+    normalize = NormalizeService()
+
+    # Handle file path directly; directories resolve to all their data shards
+    data_files = normalize.find_data_files(path)
 
     # Check if this is a file integrity check (media files)
     file_integrity_files = []
@@ -460,7 +530,7 @@ def validate_cmd(
     if "files" in check_list and file_integrity_files:
         console.print("  [cyan]Running files...[/]")
 
-        integrity = FileIntegrityService()
+        integrity = FileIntegrityService(workers=workers or config.get_workers(), level=level, cache=validation_cache)
         sample_percent = sample if sample else 100.0
 
         try:
@@ -488,6 +558,17 @@ def validate_cmd(
                 if len(invalid_files) > 10:
                     console.print(f"        ... and {len(invalid_files) - 10} more")
 
+            # Near-duplicate images, from the perceptual hashes taken while decoding
+            image_duplicates = integrity.find_near_duplicate_images(results)
+            if image_duplicates.pairs:
+                cross_split = image_duplicates.cross_split_pairs
+                console.print(
+                    f"    [yellow]! near-duplicate images: {len(image_duplicates.pairs)} ({len(cross_split)} across splits)[/]"
+                )
+                for pair in (cross_split or image_duplicates.pairs)[:10]:
+                    split_note = f", {pair['split']} vs {pair['duplicate_split']}" if pair in cross_split else ""
+                    console.print(f"        - {pair['path'].name} ~ {pair['duplicate_of'].name} (distance {pair['distance']}{split_note})")
+
         except Exception as e:
             console.print(f"    [yellow]! files: ERROR - {e}[/]")
             all_passed = False
@@ -513,49 +594,85 @@ def validate_cmd(
             raise typer.Exit(2)
         raise typer.Exit(0)
 
-    normalize = NormalizeService()
-    validate = ValidateService()
+    validate = ValidateService(memory_budget_mb=memory_budget, cache=validation_cache)
 
-    # Read data
+    # Read data; scanned lazily under a memory budget or with the cache, so a
+    # dataset is never loaded whole and an unchanged one is not read at all
+    lazy = bool(memory_budget) or validation_cache is not None
     try:
-        df = normalize.read_data(data_files[0])
+        if lazy:
+            df = normalize.scan_dataset(data_files)
+            num_columns = len(df.collect_schema())
+        else:
+            df = normalize.read_dataset(data_files)
+            num_columns = len(df.columns)
     except Exception as e:
         console.print(f"[red]Failed to read data file: {e}[/]")
         console.print("[cyan]Tip: Check that the file is a valid CSV, Parquet, or JSONL file[/]")
         raise typer.Exit(2)
 
     report_obj = QualityReport.create(str(path))
-    report_obj.num_samples = len(df)
-    report_obj.num_columns = len(df.columns)
+    report_obj.num_columns = num_columns
+
+    # Registered checks (built-in BaseCheck subclasses and plugins); the fused
+    # engine already covers duplicates, labels and missing values
+    runner = CheckRunner()
+    registered_checks = [name for name in runner.checks if name not in ("duplicates", "label_distribution", "missing_values")]
 
     # Run checks
     if checks == "all":
-        check_list = ["duplicates", "labels", "missing", "schema"]
+        check_list = ["duplicates", "labels", "missing", "schema", *registered_checks]
     else:
-        check_list = checks.split(",") if checks else ["duplicates", "labels", "missing", "schema"]
+        check_list = [c.strip() for c in checks.split(",")] if checks else ["duplicates", "labels", "missing", "schema"]
+
+    unknown_checks = [c for c in check_list if c not in ValidateService.CHECKS and c not in runner.checks]
+    if unknown_checks:
+        console.print(f"[yellow]Unknown checks ignored: {', '.join(unknown_checks)}[/]")
+        check_list = [c for c in check_list if c not in unknown_checks]
 
     all_passed = True
     passed_count = 0
     failed_count = 0
 
+    # All data checks are evaluated together in one pass over the table
+    fused_checks = [c for c in check_list if c in ValidateService.CHECKS]
+    sampled = sample is not None and sample < 100
+    if fused_checks:
+        console.print(f"  [cyan]Running {', '.join(fused_checks)} {'on a ' + f'{sample:g}% sample' if sampled else 'in one pass'}...[/]")
+    try:
+        if sampled:
+            run = validate.run_sampled_checks(df, sample, fused_checks, label_column="label", duplicate_sampling=duplicate_sampling)
+        else:
+            run = validate.run_checks(df, fused_checks, label_column="label", source_files=data_files)
+        run_error = None
+        if run.cached:
+            console.print("    [dim]unchanged since last run, using cached results[/]")
+        elif sampled:
+            console.print(f"    [dim]sample: {run.timings_ms['sample']:.1f} ms, scan: {run.timings_ms['scan']:.1f} ms[/]")
+        else:
+            console.print(f"    [dim]scan: {run.timings_ms['scan']:.1f} ms[/]")
+    except Exception as e:
+        run = None
+        run_error = e
+
+    num_samples = run.num_rows if run is not None else (0 if lazy else len(df))
+    report_obj.num_samples = num_samples
+
     for check_name in check_list:
-        console.print(f"  [cyan]Running {check_name}...[/]")
+        if check_name not in ValidateService.CHECKS:
+            continue
 
         try:
-            if check_name == "duplicates":
-                result = validate.check_duplicates(df)
-            elif check_name == "labels":
-                result = validate.check_label_distribution(df, "label")
-            elif check_name == "missing":
-                result = validate.check_missing_values(df)
-            elif check_name == "schema":
-                result = validate.check_schema_consistency(df)
-            else:
-                continue
+            if run is None:
+                raise run_error
+            result = run.results[check_name]
+            duration_ms = run.timings_ms[check_name]
 
             status = "✓" if result["passed"] else "✗"
             style = "green" if result["passed"] else "red"
-            console.print(f"    [{style}]{status}[/{style}] {check_name}: {'PASS' if result['passed'] else 'FAIL'}")
+            console.print(
+                f"    [{style}]{status}[/{style}] {check_name}: {'PASS' if result['passed'] else 'FAIL'} [dim]({duration_ms:.1f} ms)[/]"
+            )
 
             # Add to report
             check_result = CheckResult(
@@ -563,6 +680,7 @@ def validate_cmd(
                 status=CheckStatus.PASSED if result["passed"] else CheckStatus.FAILED,
                 message=f"{check_name}: {'PASS' if result['passed'] else 'FAIL'}",
                 details=result,
+                duration_ms=duration_ms,
             )
             report_obj.checks.append(check_result)
 
@@ -586,13 +704,36 @@ def validate_cmd(
             )
             report_obj.checks.append(check_result)
 
+    # Remaining checks run concurrently on the table already read above
+    plugin_checks = [c for c in check_list if c not in ValidateService.CHECKS]
+    if plugin_checks:
+        console.print(f"  [cyan]Running {', '.join(plugin_checks)}...[/]")
+        dataset = DatasetHandle(path, data_files=data_files, frame=None if lazy else df, in_memory=not lazy)
+        for check_result in runner.run(dataset, plugin_checks):
+            report_obj.checks.append(CheckResult(**check_result.model_dump(mode="json")))
+            outcome = {"passed": "PASS", "failed": "FAIL", "skipped": "SKIP"}.get(check_result.status.value, "ERROR")
+            label = f"{check_result.check_name}: {outcome} [dim]({check_result.duration_ms:.1f} ms)[/]"
+            if check_result.status == CheckStatus.PASSED:
+                console.print(f"    [green]✓[/green] {label}")
+                passed_count += 1
+            elif check_result.status == CheckStatus.SKIPPED:
+                console.print(f"    [dim]- {label} {check_result.message}[/]")
+            else:
+                console.print(f"    [red]✗[/red] {label}")
+                console.print(f"      [yellow]{check_result.message}[/]")
+                for suggestion in check_result.suggestions:
+                    console.print(f"      [cyan]Suggestion: {suggestion}[/]")
+                all_passed = False
+                failed_count += 1
+
     # Update summary
     report_obj.summary = {
         "total_checks": len(check_list),
         "passed": passed_count,
         "failed": failed_count,
-        "num_samples": len(df),
-        "num_columns": len(df.columns),
+        "num_samples": num_samples,
+        "num_columns": num_columns,
+        "scan_ms": run.timings_ms["scan"] if run else None,
     }
 
     # Save report
@@ -623,7 +764,14 @@ def _show_validation_details(check_name: str, result: dict) -> None:
     if check_name == "duplicates":
         count = result.get("exact_duplicates", 0)
         ratio = result.get("duplicate_ratio", 0)
-        console.print(f"      [yellow]Found {count} duplicate rows ({ratio*100:.1f}%)[/]")
+        if result.get("sampled"):
+            low, high = result["duplicate_ratio_ci"]
+            console.print(
+                f"      [yellow]Estimated {result['estimated_duplicates']} duplicate rows ({ratio*100:.1f}%, "
+                f"{result['confidence']:.0%} CI {low*100:.1f}-{high*100:.1f}%) from {result['sample_rows']} sampled rows[/]"
+            )
+        else:
+            console.print(f"      [yellow]Found {count} duplicate rows ({ratio*100:.1f}%)[/]")
         console.print("      [cyan]Suggestion: Remove duplicates or investigate data source[/]")
 
     elif check_name == "labels":
@@ -635,13 +783,14 @@ def _show_validation_details(check_name: str, result: dict) -> None:
     elif check_name == "missing":
         issues = result.get("issues", [])
         total = result.get("total_missing", 0)
-        console.print(f"      [yellow]{total} missing values across {len(issues)} columns[/]")
+        sample_note = f" in {result['sample_rows']} sampled rows" if result.get("sampled") else ""
+        console.print(f"      [yellow]{total} missing values across {len(issues)} columns{sample_note}[/]")
 
         if issues:
             table = Table(show_header=True, header_style="bold")
             table.add_column("Column", style="cyan")
             table.add_column("Missing", justify="right", width=10)
-            table.add_column("Percent", justify="right", width=10)
+            table.add_column("Percent", justify="right", width=22 if result.get("sampled") else 10)
             table.add_column("Severity", width=10)
             table.add_column("Suggestion", style="dim")
 
@@ -661,7 +810,12 @@ def _show_validation_details(check_name: str, result: dict) -> None:
                     severity = "[blue]INFO[/]"
                     suggestion = "Impute"
 
-                table.add_row(col, str(count), f"{ratio:.1f}%", severity, suggestion)
+                percent = f"{ratio:.1f}%"
+                if result.get("sampled"):
+                    low, high = result["estimates"][col]["missing_ratio_ci"]
+                    percent += f" ({low * 100:.1f}-{high * 100:.1f})"
+
+                table.add_row(col, str(count), percent, severity, suggestion)
 
             console.print(table)
 
@@ -691,34 +845,35 @@ def drift_cmd(
     current: Path = typer.Argument(..., help="Current dataset (newer build)"),
     output: str | None = typer.Option(None, "-o", "--output", help="Output report path (.json or .md)"),
     detailed: bool = typer.Option(False, "-d", "--detailed", help="Show detailed statistics"),
+    profile: bool = typer.Option(
+        True, "--profile/--no-profile", help="Reuse the baseline's stored drift profile, saving it next to a build's manifest"
+    ),
+    backend: str = typer.Option("exact", "--backend", help="exact (reads datasets into memory) or sketch (streams in bounded memory)"),
+    workers: int | None = typer.Option(None, "-w", "--workers", help="Worker processes for the sketch backend (default: CPU count)"),
+    batch_size: int = typer.Option(100_000, "--batch-size", help="Rows per batch for the sketch backend"),
 ) -> None:
     """Detect data drift between two datasets using PSI and KL divergence."""
     from mldata.core.drift import DriftService
+    from mldata.core.normalize import NormalizeService
 
     console.print("[bold]Drift Detection[/]")
     console.print(f"  Baseline: {baseline}")
     console.print(f"  Current:  {current}")
 
-    # Find data files - handle both files and directories
-    def find_data_file(path: Path) -> Path | None:
-        if path.is_file():
-            if path.suffix.lower() in (".csv", ".parquet", ".jsonl", ".json"):
-                return path
-            return None
-        # Look in directory
-        files = list(path.rglob("*.parquet")) + list(path.rglob("*.csv")) + list(path.rglob("*.jsonl"))
-        return files[0] if files else None
-
-    baseline_file = find_data_file(baseline)
-    current_file = find_data_file(current)
-
-    if not baseline_file or not current_file:
+    # Find data files - handle both files and directories (all shards are compared)
+    normalize = NormalizeService()
+    try:
+        drift_service = DriftService(backend=backend, workers=workers, batch_size=batch_size)
+    except ValueError as e:
+        console.print(f"[red]{e}[/]")
+        raise typer.Exit(1)
+    baseline_found = drift_service.is_profile_file(baseline) or normalize.find_data_files(baseline)
+    if not baseline_found or not normalize.find_data_files(current):
         console.print("[red]Could not find data files in one or both paths[/]")
         raise typer.Exit(1)
 
     try:
-        drift_service = DriftService()
-        report = drift_service.detect_drift(baseline_file, current_file)
+        report = drift_service.detect_drift(baseline, current, use_profile=profile)
 
         # Display report
         if report.overall_drift_detected:
@@ -745,6 +900,8 @@ def drift_cmd(
                     b_stats = drift.get("baseline_stats", {})
                     c_stats = drift.get("current_stats", {})
                     console.print(f"       Mean: {b_stats.get('mean', 0):.2f} -> {c_stats.get('mean', 0):.2f}")
+                    if drift.get("kl_divergence") is not None:
+                        console.print(f"       KL divergence: {drift['kl_divergence']:.4f}")
 
         # Show categorical drift
         if report.categorical_drift:
@@ -887,7 +1044,11 @@ def split_cmd(
     seed: int | None = typer.Option(None, "--seed", help="Random seed"),
     stratify: str | None = typer.Option(None, "--stratify", help="Column to stratify on"),
     format: str = typer.Option("csv", "-f", "--format", help="Output format"),
-    indices: bool = typer.Option(False, "-i", "--indices", help="Save split indices"),
+    indices: bool = typer.Option(False, "-i", "--indices", help="Save sorted original row indices per split"),
+    indices_format: str = typer.Option("parquet", "--indices-format", help="Index file format (parquet, npy, csv)"),
+    rng_backend: str = typer.Option("polars", "--rng-backend", help="Shuffle generator (polars, numpy, python)"),
+    key: str | None = typer.Option(None, "--key", help="Assign splits by a stable hash of this column"),
+    streaming: bool = typer.Option(False, "--streaming", help="Assign and write splits lazily in bounded memory (approximate split sizes)"),
 ) -> None:
     """Split a dataset into train/val/test sets."""
     from mldata.core.normalize import NormalizeService
@@ -908,8 +1069,38 @@ def split_cmd(
     if stratify:
         console.print(f"Stratify: {stratify}")
 
-    # Read data
     normalize = NormalizeService()
+    try:
+        split_service = SplitService(rng_backend=rng_backend)
+    except ValueError as e:
+        console.print(f"[red]{e}[/]")
+        raise typer.Exit(1)
+
+    if streaming:
+        if stratify:
+            console.print("[yellow]--stratify is not supported with --streaming, using random assignment[/]")
+
+        split_paths = split_service.sink_splits(
+            normalize.scan_dataset(path),
+            output_dir,
+            format=format,
+            ratios=ratio_list,
+            seed=seed,
+            key_column=key,
+            normalize=normalize,
+            with_indices=indices,
+        )
+        console.print("\n[green]Splits created:[/]")
+        for name, p in split_paths.items():
+            console.print(f"  {name}: {p}")
+
+        if indices:
+            console.print("\n[green]Index files:[/]")
+            for name in split_paths:
+                console.print(f"  {name}: {output_dir / f'{name}_indices.parquet'}")
+        return
+
+    # Read data
     if path.is_dir():
         data_files = list(path.glob("*.csv")) + list(path.glob("*.parquet"))
         df = normalize.read_data(data_files[0])
@@ -917,8 +1108,8 @@ def split_cmd(
         df = normalize.read_data(path)
 
     # Split
-    split_service = SplitService()
-    splits = split_service.split(df, ratios=ratio_list, seed=seed, stratify_column=stratify)
+    split_indices = split_service.split_indices(df, ratios=ratio_list, seed=seed, stratify_column=stratify, key_column=key)
+    splits = {name: df[rows] for name, rows in split_indices.items()}
 
     # Save
     split_paths = split_service.save_splits(splits, output_dir, format=format)
@@ -928,7 +1119,7 @@ def split_cmd(
 
     # Save indices if requested
     if indices:
-        index_paths = split_service.save_split_indices(splits, output_dir)
+        index_paths = split_service.save_split_indices(split_indices, output_dir, format=indices_format)
         console.print("\n[green]Index files:[/]")
         for name, p in index_paths.items():
             console.print(f"  {name}: {p}")
@@ -941,7 +1132,7 @@ def split_cmd(
 @app.command("export")
 def export_cmd(
     path: Path = typer.Argument(..., help="Path to dataset"),
-    format: str | None = typer.Option(None, "-f", "--format", help="Export format (parquet, csv, jsonl)"),
+    format: str | None = typer.Option(None, "-f", "--format", help="Export format (parquet, csv, jsonl, arrow)"),
     formats: str | None = typer.Option(None, "--formats", help="Export to multiple formats (comma-separated: parquet,csv,jsonl)"),
     output: Path | None = typer.Option(None, "-o", "--output", help="Output directory"),
     compression: str | None = typer.Option(None, "--compression", help="Compression (snappy, gzip, zstd)"),
@@ -1093,6 +1284,9 @@ def rebuild_cmd(
     seed = build_params.get("seed")
     stratify = build_params.get("stratify")
     output_format = build_params.get("format", "parquet")
+    # Manifests written before vectorized shuffling used Python's random module
+    rng_backend = build_params.get("rng_backend", "python")
+    split_key = build_params.get("split_key")
 
     console.print("[bold]Rebuilding from manifest[/]")
     console.print(f"Source: {source_uri}")
@@ -1126,21 +1320,23 @@ def rebuild_cmd(
         # 2. Normalize
         console.print("[cyan]Normalizing...[/]")
         normalize = NormalizeService()
-        data_files = list(raw_dir.rglob("*.parquet")) + list(raw_dir.rglob("*.csv")) + list(raw_dir.rglob("*.jsonl"))
+        data_files = normalize.find_data_files(raw_dir)
         if not data_files:
             raise ValueError("No data files found after fetch")
 
-        data_file = data_files[0]
         artifacts_dir = output_dir / "artifacts"
         artifacts_dir.mkdir(parents=True, exist_ok=True)
         output_file = artifacts_dir / f"data.{output_format}"
-        normalize.convert_format(data_file, output_file, output_format)
+        if len(data_files) > 1:
+            normalize.sink_data(normalize.scan_dataset(data_files), output_file, output_format)
+        else:
+            normalize.convert_format(data_files[0], output_file, output_format)
 
         # 3. Split
         console.print("[cyan]Creating splits...[/]")
-        split_service = SplitService()
+        split_service = SplitService(rng_backend=rng_backend)
         df = normalize.read_data(output_file)
-        splits = split_service.split(df, ratios=split_ratios, seed=seed, stratify_column=stratify)
+        splits = split_service.split(df, ratios=split_ratios, seed=seed, stratify_column=stratify, key_column=split_key)
         splits_dir = output_dir / "splits"
         split_service.save_splits(splits, splits_dir, format=output_format)
 
@@ -1164,6 +1360,8 @@ def rebuild_cmd(
                 "split_ratios": split_ratios,
                 "seed": seed,
                 "stratify": stratify,
+                "rng_backend": rng_backend,
+                "split_key": split_key,
             },
             dataset_info={
                 "name": manifest_data.dataset.get("name", "dataset") if manifest_data.dataset else "dataset",
@@ -1258,11 +1456,13 @@ def diff_cmd(
     from mldata.core.diff import DiffService
     from mldata.core.drift import DriftService
     from mldata.core.manifest import ManifestService
+    from mldata.core.normalize import NormalizeService
     from mldata.core.schema import SchemaEvolutionService
 
     manifest_service = ManifestService()
     diff_service = DiffService()
     drift_service = DriftService()
+    normalize = NormalizeService()
 
     # Load manifests if paths exist
     m1 = None
@@ -1296,11 +1496,11 @@ def diff_cmd(
         console.print("\n[bold]Data Drift Detection[/]")
         try:
             # Find data files
-            data1 = list(path1.rglob("*.parquet")) + list(path1.rglob("*.csv")) + list(path1.rglob("*.jsonl"))
-            data2 = list(path2.rglob("*.parquet")) + list(path2.rglob("*.csv")) + list(path2.rglob("*.jsonl"))
+            data1 = normalize.find_data_files(path1)
+            data2 = normalize.find_data_files(path2)
 
             if data1 and data2:
-                drift_report = drift_service.detect_drift(data1[0], data2[0])
+                drift_report = drift_service.detect_drift(path1, path2)
                 _display_drift_report(drift_report, detailed)
             else:
                 console.print("[yellow]Could not find data files for drift detection[/]")
@@ -1750,10 +1950,13 @@ def config_cmd(
     console.print("  -S, --show       Show all configuration")
     console.print("")
     console.print("Common keys:")
-    console.print("  build.default_format    Default export format (parquet, csv, jsonl)")
+    console.print("  build.default_format    Default export format (parquet, csv, jsonl, arrow)")
     console.print("  build.default_split     Default split ratios (e.g., 0.8,0.1,0.1)")
     console.print("  build.workers           Parallel workers (default: CPU count)")
     console.print("  build.compression       Default compression (snappy, gzip, zstd)")
+    console.print("  build.row_group_size    Rows per Parquet row group when normalizing")
+    console.print("  build.memory_budget_mb  Memory cap in MB for streaming conversion")
+    console.print("  build.rng_backend       Shuffle generator for splits (polars, numpy, python)")
     console.print("  cache.max_size_gb       Cache size limit in GB")
     console.print("")
     console.print("Config file locations (in priority order):")
@@ -25,7 +25,7 @@ class LocalConnector(BaseConnector):
     uri_schemes = ["file://", "local://", None]  # None = bare path
 
     # Extensions supported for data files
-    SUPPORTED_EXTENSIONS = {".csv", ".parquet", ".json", ".jsonl", ".arrow"}
+    SUPPORTED_EXTENSIONS = {".csv", ".parquet", ".json", ".jsonl", ".arrow", ".arff"}
 
     def parse_uri(self, uri: str) -> tuple[str, dict[str, str]]:
         """Parse local URI/file path.
@@ -271,6 +271,8 @@ class LocalConnector(BaseConnector):
             return DataFormat.JSON
         if ext == ".arrow":
             return DataFormat.ARROW
+        if ext == ".arff":
+            return DataFormat.ARFF
         return DataFormat.UNKNOWN
 
     def _infer_modality(self, name: str, columns: list[ColumnInfo] | None = None) -> DataModality:
@@ -217,10 +217,10 @@ class OpenMLConnector(BaseConnector):
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        dataset = openml.datasets.get_dataset(int(dataset_id))
+        dataset = openml.datasets.get_dataset(int(dataset_id), download_data=True)
 
-        # Get the data file
-        data_path = dataset.get_data_path()
+        # Keep the raw ARFF file; it is converted to Parquet by streaming at normalize time
+        data_path = dataset.data_file
 
         # Copy to output directory
         import shutil
@@ -0,0 +1,245 @@
+"""Streaming ARFF reader built on Polars lazy CSV scans."""
+
+import csv
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import polars as pl
+
+_ATTRIBUTE_RE = re.compile(r"^@attribute\s+('[^']*'|\"[^\"]*\"|\S+)\s+(.+)$", re.IGNORECASE)
+
+# Java SimpleDateFormat tokens used by ARFF date attributes, longest first
+_JAVA_DATE_TOKENS = [
+    ("yyyy", "%Y"),
+    ("yy", "%y"),
+    ("MM", "%m"),
+    ("dd", "%d"),
+    ("HH", "%H"),
+    ("mm", "%M"),
+    ("ss", "%S"),
+    ("SSS", "%3f"),
+]
+
+# Separator that never occurs in text, used to scan rows as whole lines
+_LINE_SEPARATOR = "\x1f"
+
+# One dense value: a single- or double-quoted token, or a bare token up to the next comma
+_TOKEN_PATTERN = r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|[^,\s][^,]*"
+
+
+@dataclass
+class ArffAttribute:
+    """A single ARFF attribute declaration."""
+
+    name: str
+    type: str  # "numeric", "integer", "nominal", "string", "date"
+    categories: list[str] = field(default_factory=list)
+    date_format: str | None = None
+
+
+@dataclass
+class ArffHeader:
+    """Parsed ARFF header."""
+
+    relation: str
+    attributes: list[ArffAttribute]
+    data_line: int  # Number of lines up to and including @data
+    sparse: bool = False
+    quote_char: str = "'"
+    tokenize: bool = False  # Rows mix quote styles or pad quoted values, so the CSV reader cannot split them
+
+
+def _unquote(value: str) -> str:
+    """Strip surrounding ARFF quotes from a token."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def _parse_attribute(line: str) -> ArffAttribute:
+    """Parse an @attribute line."""
+    match = _ATTRIBUTE_RE.match(line)
+    if not match:
+        raise ValueError(f"Invalid ARFF attribute declaration: {line}")
+
+    name = _unquote(match.group(1))
+    type_spec = match.group(2).strip()
+
+    if type_spec.startswith("{"):
+        inner = type_spec[1 : type_spec.rindex("}")]
+        reader = csv.reader([inner], quotechar="'", skipinitialspace=True)
+        categories = [_unquote(v) for v in next(reader)]
+        return ArffAttribute(name=name, type="nominal", categories=categories)
+
+    keyword, _, rest = type_spec.partition(" ")
+    keyword = keyword.lower()
+
+    if keyword in ("numeric", "real"):
+        return ArffAttribute(name=name, type="numeric")
+    elif keyword == "integer":
+        return ArffAttribute(name=name, type="integer")
+    elif keyword == "string":
+        return ArffAttribute(name=name, type="string")
+    elif keyword == "date":
+        return ArffAttribute(name=name, type="date", date_format=_unquote(rest) if rest.strip() else None)
+    else:
+        raise ValueError(f"Unsupported ARFF attribute type for '{name}': {type_spec}")
+
+
+def parse_arff_header(path: Path) -> ArffHeader:
+    """Parse the header of an ARFF file without reading the data section.
+
+    Args:
+        path: Path to ARFF file
+
+    Returns:
+        ArffHeader describing the attributes and where the data starts
+    """
+    relation = ""
+    attributes: list[ArffAttribute] = []
+
+    with open(path, encoding="utf-8") as f:
+        line_number = 0
+        for raw_line in f:
+            line_number += 1
+            line = raw_line.strip()
+            if not line or line.startswith("%"):
+                continue
+
+            lower = line.lower()
+            if lower.startswith("@relation"):
+                relation = _unquote(line[len("@relation") :])
+            elif lower.startswith("@attribute"):
+                attributes.append(_parse_attribute(line))
+            elif lower.startswith("@data"):
+                break
+        else:
+            raise ValueError(f"No @data section found in {path}")
+
+        # Peek at the first data rows to detect sparse rows and the quote style
+        sample: list[str] = []
+        for raw_line in f:
+            line = raw_line.strip()
+            if line and not line.startswith("%"):
+                sample.append(line)
+            if len(sample) >= 100:
+                break
+
+    if not attributes:
+        raise ValueError(f"No attributes declared in {path}")
+
+    sample_text = "\n".join(sample)
+    mixed_quotes = '"' in sample_text and "'" in sample_text
+
+    return ArffHeader(
+        relation=relation,
+        attributes=attributes,
+        data_line=line_number,
+        sparse=bool(sample) and sample[0].startswith("{"),
+        quote_char='"' if '"' in sample_text and not mixed_quotes else "'",
+        tokenize=mixed_quotes or re.search(r",\s+['\"]", sample_text) is not None,
+    )
+
+
+def _java_to_strftime(java_format: str) -> str:
+    """Translate a Java SimpleDateFormat pattern to strftime."""
+    result = java_format.replace("'T'", "T")
+    for java_token, strftime_token in _JAVA_DATE_TOKENS:
+        result = result.replace(java_token, strftime_token)
+    return result
+
+
+def _cast_expr(raw: pl.Expr, attribute: ArffAttribute) -> pl.Expr:
+    """Convert a raw string column into the attribute's typed column."""
+    value = raw.str.strip_chars().str.strip_chars("'\"")
+    value = pl.when(value == "?").then(None).otherwise(value)
+
+    if attribute.type == "numeric":
+        expr = value.cast(pl.Float64)
+    elif attribute.type == "integer":
+        expr = value.cast(pl.Float64).cast(pl.Int64)
+    elif attribute.type == "nominal":
+        expr = value.cast(pl.Categorical)
+    elif attribute.type == "date":
+        date_format = _java_to_strftime(attribute.date_format) if attribute.date_format else None
+        expr = value.str.to_datetime(format=date_format, strict=False)
+    else:
+        expr = value
+
+    return expr.alias(attribute.name)
+
+
+def _sparse_default(attribute: ArffAttribute) -> str | None:
+    """Value of an attribute omitted from a sparse row (index 0)."""
+    if attribute.type in ("numeric", "integer"):
+        return "0"
+    if attribute.type == "nominal" and attribute.categories:
+        return attribute.categories[0]
+    return None
+
+
+def scan_arff(path: Path) -> pl.LazyFrame:
+    """Lazily scan an ARFF file into a typed LazyFrame.
+
+    The data section is scanned by the Polars CSV reader with every column
+    as text, then cast per attribute: numeric to Float64, integer to Int64,
+    nominal to Categorical, date to Datetime. Sparse rows are matched with
+    one regex per attribute, and dense rows the CSV reader cannot split
+    (mixed quote styles, spaces before quoted values) are tokenized per
+    line. Rows are never turned into Python objects, so the frame can be
+    sunk to Parquet in bounded memory.
+
+    Args:
+        path: Path to ARFF file
+
+    Returns:
+        Polars LazyFrame
+    """
+    header = parse_arff_header(path)
+
+    if header.sparse or header.tokenize:
+        lines = pl.scan_csv(
+            path,
+            has_header=False,
+            separator=_LINE_SEPARATOR,
+            quote_char=None,
+            comment_prefix="%",
+            skip_lines=header.data_line,
+            new_columns=["__line__"],
+            schema_overrides={"__line__": pl.String},
+        )
+
+    if header.tokenize and not header.sparse:
+        tokens = pl.col("__line__").str.extract_all(_TOKEN_PATTERN)
+        return lines.select(
+            [
+                _cast_expr(tokens.list.get(index, null_on_oob=True), attribute)
+                for index, attribute in enumerate(header.attributes)
+            ]
+        )
+
+    if header.sparse:
+        line = pl.col("__line__").str.strip_chars().str.strip_chars("{}")
+        columns = []
+        for index, attribute in enumerate(header.attributes):
+            raw = line.str.extract(rf"(?:^|,)\s*{index}\s+('[^']*'|\"[^\"]*\"|[^,]*)", 1)
+            default = _sparse_default(attribute)
+            if default is not None:
+                raw = raw.fill_null(pl.lit(default))
+            columns.append(_cast_expr(raw, attribute))
+        return lines.select(columns)
+
+    names = [attribute.name for attribute in header.attributes]
+    raw_frame = pl.scan_csv(
+        path,
+        has_header=False,
+        quote_char=header.quote_char,
+        comment_prefix="%",
+        skip_lines=header.data_line,
+        new_columns=names,
+        infer_schema=False,
+    )
+
+    return raw_frame.select([_cast_expr(pl.col(attribute.name), attribute) for attribute in header.attributes])
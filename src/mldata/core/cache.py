@@ -146,3 +146,93 @@ def get_cache() -> CacheService:
     if _cache_service is None:
         _cache_service = CacheService()
     return _cache_service
+
+
+class ValidationCache:
+    """Persistent cache of validation results for unchanged files.
+
+    Entries are keyed by the resolved path, a file fingerprint and a hash
+    of the check configuration. The default fingerprint is (size,
+    mtime_ns), so a lookup costs one stat call; with content_hash the
+    file's bytes are hashed instead, which survives touch/copy but reads
+    every file.
+    """
+
+    # Bump when validation logic changes, to invalidate older entries
+    VERSION = 1
+
+    def __init__(self, directory: Path | None = None, content_hash: bool = False):
+        """Initialize validation cache.
+
+        Args:
+            directory: Cache directory. Defaults to ~/.mldata/cache/validation.
+            content_hash: Fingerprint files by content (xxh3-128) instead of size and mtime
+        """
+        self.directory = directory or CacheConfig().directory / "validation"
+        self.content_hash = content_hash
+        self._cache: diskcache.Cache | None = None
+
+    @property
+    def cache(self) -> diskcache.Cache:
+        """Get the cache instance."""
+        if self._cache is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._cache = diskcache.Cache(str(self.directory))
+        return self._cache
+
+    def fingerprint(self, path: Path) -> str:
+        """Fingerprint a file's current state.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            Fingerprint string
+        """
+        if self.content_hash:
+            import xxhash
+
+            digest = xxhash.xxh3_128()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            return f"xxh3:{digest.hexdigest()}"
+
+        stat = path.stat()
+        return f"stat:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def key(self, paths: list[Path], config: dict[str, Any]) -> str:
+        """Build the cache key of a check over one or more files.
+
+        Args:
+            paths: Files the check reads
+            config: Check configuration that affects the result
+
+        Returns:
+            Cache key
+        """
+        key_data = {
+            "version": self.VERSION,
+            "files": [[str(path.resolve()), self.fingerprint(path)] for path in paths],
+            "config": config,
+        }
+        key_str = json.dumps(key_data, sort_keys=True, default=str)
+        return f"sha256:{hashlib.sha256(key_str.encode()).hexdigest()}"
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached result, or None."""
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result."""
+        self.cache[key] = value
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.cache.clear()
+
+    def close(self) -> None:
+        """Close the cache."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
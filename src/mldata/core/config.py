@@ -22,6 +22,9 @@ class BuildConfig(BaseModel):
     default_seed: int | None = None
     compression: str | None = None
     workers: int | None = None
+    row_group_size: int | None = None
+    memory_budget_mb: int | None = None
+    rng_backend: str = "polars"
 
 
 class AuthConfig(BaseModel):
@@ -0,0 +1,663 @@
+"""Out-of-core exact duplicate detection by row hashing."""
+
+import math
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from mldata.core.normalize import NormalizeService
+
+
+@dataclass
+class DuplicateReport:
+    """Result of a duplicate scan."""
+
+    total_rows: int
+    duplicate_rows: int  # Rows identical to an earlier row
+    duplicate_ids: pl.Series | None = None  # Row indices of those rows, when requested
+    partitions: int = 1  # Hash buckets the scan was split into (1 means nothing was spilled)
+
+    @property
+    def unique_rows(self) -> int:
+        return self.total_rows - self.duplicate_rows
+
+
+@dataclass
+class LeakageReport:
+    """Rows shared between splits."""
+
+    split_rows: dict[str, int]
+    pairs: list[dict[str, Any]]  # splits, shared_rows (distinct), rows_first/rows_second (with repeats)
+
+    @property
+    def leaked_rows(self) -> int:
+        """Distinct shared rows, summed over all pairs of splits."""
+        return sum(pair["shared_rows"] for pair in self.pairs)
+
+
+class DuplicateService:
+    """Service for finding exact duplicate rows without loading the dataset.
+
+    Every row is reduced to a 128-bit fingerprint (two differently seeded
+    64-bit row hashes) in a streaming pass, so only the fingerprints are ever
+    held in memory. When they would not fit in the memory budget they are
+    spilled to disk in buckets by hash, and each bucket is deduplicated on
+    its own: equal rows always land in the same bucket.
+    """
+
+    INDEX_COLUMN = "row_index"
+    HASH_COLUMNS = ("__hash_a__", "__hash_b__")
+
+    # Working memory per fingerprint: row index + two hashes, plus room for the distinct-set
+    BYTES_PER_ROW = 64
+
+    # Upper bound on spill buckets, which are all written by one streaming query
+    MAX_PARTITIONS = 256
+
+    def __init__(self, memory_budget_mb: int | None = None, spill_dir: Path | None = None):
+        """Initialize duplicate service.
+
+        Args:
+            memory_budget_mb: Approximate memory cap for the fingerprints; they are
+                spilled to disk in buckets when over it (None keeps them in memory)
+            spill_dir: Directory for spilled buckets (default: system temp dir)
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.spill_dir = spill_dir
+
+    def find_duplicates(
+        self,
+        data: pl.DataFrame | pl.LazyFrame,
+        columns: list[str] | None = None,
+        return_ids: bool = False,
+    ) -> DuplicateReport:
+        """Count rows that duplicate an earlier row.
+
+        Args:
+            data: Polars DataFrame, or LazyFrame to scan with the streaming engine
+            columns: Columns that define a duplicate row (None for all)
+            return_ids: Also return the row indices of the duplicate rows
+
+        Returns:
+            DuplicateReport with exact counts and optional duplicate row ids
+        """
+        lf = data.lazy()
+        fingerprints = lf.with_row_index(self.INDEX_COLUMN).select(pl.col(self.INDEX_COLUMN), *self.fingerprint(lf, columns))
+
+        partitions = self._partition_count(lf)
+        if partitions == 1:
+            hashes = fingerprints.collect(engine="streaming")
+            duplicates, ids = self._bucket_duplicates(hashes, return_ids)
+            return self._report(hashes.height, duplicates, [ids], partitions)
+
+        with tempfile.TemporaryDirectory(prefix="mldata-dedup-", dir=self.spill_dir) as tmp:
+            bucket = pl.col(self.HASH_COLUMNS[0]) % partitions
+            frames = {
+                Path(tmp) / f"bucket-{index:03d}.parquet": fingerprints.filter(bucket == index)
+                for index in range(partitions)
+            }
+            NormalizeService(memory_budget_mb=self.memory_budget_mb).sink_many(frames, "parquet")
+
+            duplicates = 0
+            id_parts = []
+            total_rows = 0
+            for bucket_path in frames:
+                hashes = pl.read_parquet(bucket_path)
+                total_rows += hashes.height
+                count, ids = self._bucket_duplicates(hashes, return_ids)
+                duplicates += count
+                id_parts.append(ids)
+
+        return self._report(total_rows, duplicates, id_parts, partitions)
+
+    def find_leakage(self, splits: dict[str, pl.LazyFrame], columns: list[str] | None = None) -> "LeakageReport":
+        """Count rows shared between splits.
+
+        Each split is reduced, in one streaming query, to its distinct row
+        fingerprints with their row counts; every pair of splits is then an
+        inner join of two fingerprint tables, so only one entry per distinct
+        row is ever held in memory.
+
+        Args:
+            splits: Mapping of split name to LazyFrame
+            columns: Columns that define a row's content, e.g. the features only (None for all)
+
+        Returns:
+            LeakageReport with one entry per pair of splits
+        """
+        names = list(splits)
+        if names and columns is None:
+            # One column order for every split, so equal rows hash equally
+            columns = splits[names[0]].collect_schema().names()
+
+        fingerprint_tables = pl.collect_all(
+            [
+                lf.select(self.fingerprint(lf, columns)).group_by(self.HASH_COLUMNS).agg(pl.len().alias("rows"))
+                for lf in splits.values()
+            ],
+            engine="streaming",
+        )
+        tables = dict(zip(names, fingerprint_tables))
+
+        pairs = []
+        for index, first in enumerate(names):
+            for second in names[index + 1 :]:
+                shared = tables[first].join(tables[second], on=self.HASH_COLUMNS, how="inner", suffix="_other")
+                pairs.append(
+                    {
+                        "splits": [first, second],
+                        "shared_rows": shared.height,
+                        "rows_first": int(shared["rows"].sum()),
+                        "rows_second": int(shared["rows_other"].sum()),
+                    }
+                )
+
+        return LeakageReport(
+            split_rows={name: int(table["rows"].sum()) for name, table in tables.items()},
+            pairs=pairs,
+        )
+
+    def fingerprint(self, lf: pl.LazyFrame, columns: list[str] | None = None) -> list[pl.Expr]:
+        """Two differently seeded row hashes that together fingerprint a row.
+
+        Args:
+            lf: LazyFrame the expressions will be evaluated on
+            columns: Columns that define a row's content (None for all)
+
+        Returns:
+            Expressions for the HASH_COLUMNS
+        """
+        key = pl.struct(columns or lf.collect_schema().names())
+        return [key.hash(seed).alias(name) for seed, name in enumerate(self.HASH_COLUMNS)]
+
+    def _partition_count(self, lf: pl.LazyFrame) -> int:
+        """Number of hash buckets needed to keep one bucket under the memory budget."""
+        if self.memory_budget_mb is None:
+            return 1
+
+        total_rows = lf.select(pl.len()).collect(engine="streaming").item()
+        needed = math.ceil(total_rows * self.BYTES_PER_ROW / (self.memory_budget_mb * 1024**2))
+        return min(max(1, needed), self.MAX_PARTITIONS)
+
+    def _bucket_duplicates(self, hashes: pl.DataFrame, return_ids: bool) -> tuple[int, pl.Series | None]:
+        """Count duplicate fingerprints in one bucket and optionally collect their row ids."""
+        fingerprint = pl.struct(self.HASH_COLUMNS)
+        unique = hashes.select(fingerprint.n_unique()).item() if hashes.height else 0
+        duplicates = hashes.height - unique
+
+        ids = None
+        if return_ids:
+            # The first occurrence (lowest row index) is kept, later ones are duplicates
+            ids = hashes.sort(self.INDEX_COLUMN).filter(~fingerprint.is_first_distinct())[self.INDEX_COLUMN]
+
+        return duplicates, ids
+
+    def _report(
+        self,
+        total_rows: int,
+        duplicates: int,
+        id_parts: list[pl.Series | None],
+        partitions: int,
+    ) -> DuplicateReport:
+        """Assemble the report from per-bucket results."""
+        duplicate_ids = None
+        if id_parts and id_parts[0] is not None:
+            duplicate_ids = pl.concat(id_parts).sort()
+
+        return DuplicateReport(
+            total_rows=total_rows,
+            duplicate_rows=duplicates,
+            duplicate_ids=duplicate_ids,
+            partitions=partitions,
+        )
+
+
+@dataclass
+class NearDuplicateReport:
+    """Result of a near-duplicate scan."""
+
+    total_rows: int
+    pairs: pl.DataFrame  # row_index, duplicate_of (an earlier row) and estimated Jaccard similarity
+    candidate_pairs: int = 0  # Pairs proposed by the LSH index before verification
+
+    @property
+    def duplicate_rows(self) -> int:
+        return self.pairs.height
+
+    @property
+    def duplicate_ids(self) -> pl.Series:
+        return self.pairs["row_index"]
+
+
+def _minhash_batch(texts: list[str], num_perm: int, shingle_size: int, seed: int) -> Any:
+    """MinHash signatures of a batch of texts (runs in a worker process).
+
+    Uses one-permutation hashing: each byte shingle is hashed once, the
+    high bits pick one of num_perm bins and the low 32 bits compete for
+    that bin's minimum. Bins a short text leaves empty are filled from the
+    next non-empty bin (rotation densification), so the fraction of equal
+    bins still estimates the Jaccard similarity of two texts.
+
+    Args:
+        texts: Normalized texts, each at least shingle_size bytes long
+        num_perm: Signature length
+        shingle_size: Shingle length in bytes (at most 8)
+        seed: Seed for the shingle hash, shared by all batches
+
+    Returns:
+        uint32 array of shape (len(texts), num_perm)
+    """
+    import numpy as np
+
+    empty = np.uint32(0xFFFFFFFF)
+    signatures = np.full((len(texts), num_perm), empty, dtype=np.uint32)
+    if not texts:
+        return signatures
+
+    encoded = [text.encode("utf-8") for text in texts]
+    lengths = np.fromiter((len(data) for data in encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+
+    # Pack each window of shingle_size bytes into one integer (exact for up to 8 bytes)
+    window_count = data.size - shingle_size + 1
+    packed = np.zeros(window_count, dtype=np.uint64)
+    for offset in range(shingle_size):
+        packed = (packed << np.uint64(8)) | data[offset : offset + window_count]
+
+    # Keep only windows that start and end inside the same text
+    windows = lengths - shingle_size + 1
+    text_ids = np.repeat(np.arange(len(texts)), windows)
+    window_starts = np.cumsum(windows) - windows
+    text_starts = np.cumsum(lengths) - lengths
+    hashed = _mix64(packed[np.repeat(text_starts - window_starts, windows) + np.arange(windows.sum())] ^ np.uint64(seed))
+
+    bins = ((hashed >> np.uint64(32)) % np.uint64(num_perm)).astype(np.int64)
+    np.minimum.at(signatures.reshape(-1), text_ids * num_perm + bins, (hashed & np.uint64(0xFFFFFFFF)).astype(np.uint32))
+
+    # Densify: an empty bin borrows the value of the next non-empty bin, offset by the distance
+    missing = signatures == empty
+    rows = np.flatnonzero(missing.any(axis=1))
+    if rows.size:
+        sparse = signatures[rows]
+        remaining = missing[rows]
+        filled = sparse.copy()
+        for step in range(1, num_perm):
+            take = remaining & ~np.roll(missing[rows], -step, axis=1)
+            filled[take] = np.roll(sparse, -step, axis=1)[take] + np.uint32(step * _DENSIFY_OFFSET % 2**32)
+            remaining &= ~take
+            if not remaining.any():
+                break
+        signatures[rows] = filled
+
+    return signatures
+
+
+def _mix64(values: Any) -> Any:
+    """MurmurHash3 fmix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    import numpy as np
+
+    values = values ^ (values >> np.uint64(33))
+    values = values * np.uint64(0xFF51AFD7ED558CCD)
+    values = values ^ (values >> np.uint64(33))
+    values = values * np.uint64(0xC4CEB9FE1A85EC53)
+    return values ^ (values >> np.uint64(33))
+
+
+def _odd_multipliers(count: int, seed: int) -> Any:
+    """Random odd uint64 multipliers, used to hash LSH bands."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2**64, size=count, dtype=np.uint64, endpoint=False) | np.uint64(1)
+
+
+# Odd constant separating values borrowed from bins at different distances
+_DENSIFY_OFFSET = 0x9E3779B1
+
+
+class NearDuplicateService:
+    """Service for finding near-duplicate texts with MinHash and LSH.
+
+    Texts are normalized (lowercased, whitespace collapsed) in Polars and
+    cut into character shingles. MinHash signatures are computed batch by
+    batch across a process pool, then an LSH banding index proposes
+    candidate pairs: rows whose signatures agree on a whole band land in
+    the same bucket, and each row is paired with the first row of its
+    bucket, so the work stays linear in the number of rows. Candidates
+    are kept when their estimated Jaccard similarity reaches the threshold.
+    """
+
+    INDEX_COLUMN = "row_index"
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        workers: int | None = None,
+        batch_size: int = 50_000,
+        seed: int = 0,
+    ):
+        """Initialize near-duplicate service.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of two near-duplicates
+            num_perm: MinHash signature length; 4 bytes of memory per row each
+            shingle_size: Shingle length in bytes (1-8)
+            workers: Processes computing signatures. Defaults to CPU count.
+            batch_size: Texts sent to a worker at a time
+            seed: Seed for the shingle and band hashes
+        """
+        import os
+
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Threshold must be in (0, 1], got {threshold}")
+        if not 1 <= shingle_size <= 8:
+            raise ValueError(f"Shingle size must be between 1 and 8, got {shingle_size}")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.seed = seed
+        self.bands, self.rows_per_band = self._band_layout(num_perm, threshold)
+
+    def find_near_duplicates(self, data: pl.DataFrame | pl.LazyFrame, text_column: str) -> NearDuplicateReport:
+        """Find rows whose text nearly duplicates an earlier row.
+
+        Args:
+            data: Polars DataFrame or LazyFrame
+            text_column: Column holding the text to compare; nulls are skipped
+
+        Returns:
+            NearDuplicateReport pairing every near-duplicate row with the earliest matching row
+        """
+        import numpy as np
+
+        texts = (
+            data.lazy()
+            .with_row_index(self.INDEX_COLUMN)
+            .select(
+                pl.col(self.INDEX_COLUMN),
+                pl.col(text_column)
+                .cast(pl.String)
+                .str.to_lowercase()
+                .str.replace_all(r"\s+", " ")
+                .str.strip_chars()
+                .str.pad_end(self.shingle_size)
+                .alias("__text__"),
+            )
+            .collect(engine="streaming")
+        )
+        total_rows = texts.height
+        texts = texts.drop_nulls("__text__")
+        row_ids = texts[self.INDEX_COLUMN].to_numpy()
+
+        signatures = self._signatures(texts["__text__"])
+
+        candidates = self._candidate_pairs(signatures)
+        similarity = np.empty(candidates.shape[0], dtype=np.float64)
+        for start in range(0, candidates.shape[0], self.batch_size):
+            block = candidates[start : start + self.batch_size]
+            similarity[start : start + self.batch_size] = (signatures[block[:, 0]] == signatures[block[:, 1]]).mean(axis=1)
+
+        matches = candidates[similarity >= self.threshold]
+        pairs = (
+            pl.DataFrame(
+                {
+                    self.INDEX_COLUMN: row_ids[matches[:, 0]],
+                    "duplicate_of": row_ids[matches[:, 1]],
+                    "similarity": similarity[similarity >= self.threshold],
+                }
+            )
+            .sort(self.INDEX_COLUMN, "duplicate_of")
+            .unique(self.INDEX_COLUMN, keep="first", maintain_order=True)
+        )
+
+        return NearDuplicateReport(total_rows=total_rows, pairs=pairs, candidate_pairs=candidates.shape[0])
+
+    def _signatures(self, texts: pl.Series) -> Any:
+        """Compute MinHash signatures for all texts, in batches across processes.
+
+        At most two batches per worker are in flight, so only those batches
+        exist as Python strings at any time.
+        """
+        import numpy as np
+
+        signatures = np.empty((texts.len(), self.num_perm), dtype=np.uint32)
+        starts = range(0, texts.len(), self.batch_size)
+        args = (self.num_perm, self.shingle_size, self.seed)
+
+        if self.workers <= 1 or len(starts) <= 1:
+            for start in starts:
+                signatures[start : start + self.batch_size] = _minhash_batch(texts.slice(start, self.batch_size).to_list(), *args)
+            return signatures
+
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = {}
+            for start in starts:
+                if len(pending) >= 2 * self.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        first = pending.pop(future)
+                        signatures[first : first + self.batch_size] = future.result()
+                batch = texts.slice(start, self.batch_size).to_list()
+                pending[executor.submit(_minhash_batch, batch, *args)] = start
+
+            for future, first in pending.items():
+                signatures[first : first + self.batch_size] = future.result()
+
+        return signatures
+
+    def _candidate_pairs(self, signatures: Any) -> Any:
+        """Propose (row, earlier row) pairs that share at least one LSH band."""
+        import numpy as np
+
+        positions = pl.Series("position", np.arange(signatures.shape[0]))
+        band_multipliers = _odd_multipliers(self.rows_per_band, self.seed)
+        pairs = []
+
+        for band in range(self.bands):
+            columns = signatures[:, band * self.rows_per_band : (band + 1) * self.rows_per_band].astype(np.uint64)
+            bucket = (columns * band_multipliers).sum(axis=1, dtype=np.uint64)
+            frame = pl.DataFrame({"position": positions, "bucket": bucket})
+            pairs.append(
+                frame.with_columns(pl.col("position").first().over("bucket").alias("first"))
+                .filter(pl.col("position") != pl.col("first"))
+                .select("position", "first")
+            )
+
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        return pl.concat(pairs).unique().to_numpy().astype(np.int64)
+
+    @staticmethod
+    def _band_layout(num_perm: int, threshold: float) -> tuple[int, int]:
+        """Choose bands x rows per band for the signature length.
+
+        Two rows become candidates with probability 1 - (1 - s^r)^b at
+        similarity s; the curve's midpoint (1/b)^(1/r) is put just below
+        the threshold so that true near-duplicates are rarely missed.
+        """
+        layouts = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+        below = [(bands, rows) for bands, rows in layouts if (1 / bands) ** (1 / rows) <= threshold]
+        return max(below, key=lambda layout: (1 / layout[0]) ** (1 / layout[1])) if below else layouts[0]
+
+
+# Perceptual hash methods for images; every hash is 64 bits
+IMAGE_HASH_METHODS = ("dhash", "phash")
+
+
+def perceptual_hash(image: Any, method: str = "dhash") -> int:
+    """Compute a 64-bit perceptual hash of a decoded PIL image.
+
+    dHash compares neighbouring pixels of a 9x8 grayscale thumbnail;
+    pHash thresholds the 8x8 lowest frequencies of the DCT of a 32x32
+    thumbnail at their median. Visually similar images get hashes a
+    small Hamming distance apart.
+
+    Args:
+        image: PIL image (already loaded)
+        method: Hash method (dhash, phash)
+
+    Returns:
+        Hash as an unsigned 64-bit integer
+    """
+    from PIL import Image
+
+    if method == "dhash":
+        pixels = image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+        bits = [pixels[row * 9 + col] > pixels[row * 9 + col + 1] for row in range(8) for col in range(8)]
+    elif method == "phash":
+        import numpy as np
+
+        pixels = np.asarray(image.convert("L").resize((32, 32), Image.Resampling.LANCZOS), dtype=np.float64)
+        n = np.arange(32)
+        basis = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / 64)
+        low = (basis @ pixels @ basis.T)[:8, :8].reshape(-1)
+        bits = list(low > np.median(low[1:]))
+    else:
+        raise ValueError(f"Unknown image hash method: {method}. Supported: {', '.join(IMAGE_HASH_METHODS)}")
+
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit hashes with the Hamming distance.
+
+    Children are keyed by their distance to the parent, so by the
+    triangle inequality a search within radius r only descends into
+    children keyed parent_distance - r .. parent_distance + r.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.root: list | None = None  # [hash, items, {distance: child}]
+
+    def add(self, value: int, item: Any) -> None:
+        """Insert an item under its hash.
+
+        Args:
+            value: 64-bit hash
+            item: Payload returned by searches
+        """
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+
+        node = self.root
+        while True:
+            distance = (node[0] ^ value).bit_count()
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, radius: int) -> list[tuple[int, Any]]:
+        """Find all items whose hash is within radius of value.
+
+        Args:
+            value: 64-bit hash
+            radius: Maximum Hamming distance
+
+        Returns:
+            List of (distance, item) pairs
+        """
+        if self.root is None:
+            return []
+
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = (node[0] ^ value).bit_count()
+            if distance <= radius:
+                found.extend((distance, item) for item in node[1])
+            for child_distance, child in node[2].items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+        return found
+
+
+@dataclass
+class ImageDuplicateReport:
+    """Result of a near-duplicate image search."""
+
+    pairs: list[dict[str, Any]]  # path, duplicate_of, distance, split, duplicate_split
+
+    @property
+    def cross_split_pairs(self) -> list[dict[str, Any]]:
+        """Pairs whose images sit in two different splits (train/val/test leakage)."""
+        return [
+            pair
+            for pair in self.pairs
+            if pair["split"] is not None and pair["duplicate_split"] is not None and pair["split"] != pair["duplicate_split"]
+        ]
+
+
+class ImageDuplicateService:
+    """Service for finding near-duplicate images from their perceptual hashes."""
+
+    # Directory names that identify a split
+    SPLIT_NAMES = {"train": "train", "val": "val", "valid": "val", "validation": "val", "test": "test"}
+
+    def __init__(self, max_distance: int = 6):
+        """Initialize image duplicate service.
+
+        Args:
+            max_distance: Maximum Hamming distance (of 64 bits) for two images to count as near-duplicates
+        """
+        self.max_distance = max_distance
+
+    def find_near_duplicates(self, hashes: dict[Path, int]) -> ImageDuplicateReport:
+        """Pair every image with the closest earlier image within max_distance.
+
+        Images are inserted into a BK-tree in path order and each one is
+        searched before it is inserted, so every pair is found once.
+
+        Args:
+            hashes: Mapping of image path to perceptual hash
+
+        Returns:
+            ImageDuplicateReport with one entry per near-duplicate image
+        """
+        tree = BKTree()
+        pairs = []
+
+        for path in sorted(hashes):
+            value = hashes[path]
+            matches = tree.search(value, self.max_distance)
+            if matches:
+                distance, original = min(matches, key=lambda match: (match[0], str(match[1])))
+                pairs.append(
+                    {
+                        "path": path,
+                        "duplicate_of": original,
+                        "distance": distance,
+                        "split": self.split_of(path),
+                        "duplicate_split": self.split_of(original),
+                    }
+                )
+            tree.add(value, path)
+
+        return ImageDuplicateReport(pairs=pairs)
+
+    def split_of(self, path: Path) -> str | None:
+        """Split an image belongs to, from its nearest train/val/test parent directory."""
+        for part in reversed(path.parent.parts):
+            if part.lower() in self.SPLIT_NAMES:
+                return self.SPLIT_NAMES[part.lower()]
+        return None
@@ -5,6 +5,8 @@ from typing import Any
 
 import polars as pl
 
+from mldata.core.normalize import NormalizeService
+
 
 class DiffService:
     """Service for comparing datasets."""
@@ -38,36 +40,43 @@ class DiffService:
                 "path2_files": data_files2,
             }
 
-        # Load first file from each
-        df1 = self._read_data(data_files1[0])
-        df2 = self._read_data(data_files2[0])
+        # Scan all shards of each dataset as one table
+        lf1 = self._scan_data(data_files1)
+        lf2 = self._scan_data(data_files2)
 
-        if df1 is None or df2 is None:
+        if lf1 is None or lf2 is None:
             return {"error": "Failed to read data files"}
 
+        schema1 = lf1.collect_schema()
+        schema2 = lf2.collect_schema()
+        rows1 = lf1.select(pl.len()).collect().item()
+        rows2 = lf2.select(pl.len()).collect().item()
+
         # Compare shapes
         shape_comparison = {
             "path1": {
-                "rows": len(df1),
-                "columns": len(df1.columns),
+                "rows": rows1,
+                "columns": len(schema1),
+                "files": len(data_files1),
             },
             "path2": {
-                "rows": len(df2),
-                "columns": len(df2.columns),
+                "rows": rows2,
+                "columns": len(schema2),
+                "files": len(data_files2),
             },
-            "rows_match": len(df1) == len(df2),
-            "columns_match": len(df1.columns) == len(df2.columns),
+            "rows_match": rows1 == rows2,
+            "columns_match": len(schema1) == len(schema2),
         }
 
         # Compare schemas
-        schema_comparison = self._compare_schema(df1, df2)
+        schema_comparison = self._compare_schema(schema1, schema2)
 
         # Compare checksums
-        checksum1 = self._compute_checksum(data_files1[0])
-        checksum2 = self._compute_checksum(data_files2[0])
+        checksum1 = self._compute_dataset_checksum(data_files1)
+        checksum2 = self._compute_dataset_checksum(data_files2)
 
         # Compare sample values (first 5 rows)
-        sample_comparison = self._compare_samples(df1, df2)
+        sample_comparison = self._compare_samples(lf1.head(5).collect(), lf2.head(5).collect())
 
         return {
             "shape": shape_comparison,
@@ -82,33 +91,21 @@ class DiffService:
 
     def _find_data_files(self, path: Path) -> list[Path]:
         """Find data files in directory."""
-        if path.is_file():
-            if path.suffix.lower() in (".csv", ".parquet", ".jsonl"):
-                return [path]
-            return []
-
-        files = []
-        for ext in [".parquet", ".csv", ".jsonl"]:
-            files.extend(sorted(path.rglob(f"*{ext}")))
-        return files
-
-    def _read_data(self, path: Path) -> pl.DataFrame | None:
-        """Read data file."""
+        return NormalizeService().find_data_files(path)
+
+    def _scan_data(self, files: list[Path]) -> pl.LazyFrame | None:
+        """Lazily scan data files as one table."""
         try:
-            if path.suffix == ".parquet":
-                return pl.read_parquet(path)
-            elif path.suffix == ".csv":
-                return pl.read_csv(path)
-            elif path.suffix == ".jsonl":
-                return pl.read_ndjson(path)
+            lf = NormalizeService().scan_dataset(files)
+            lf.collect_schema()
+            return lf
         except Exception:
-            pass
-        return None
+            return None
 
-    def _compare_schema(self, df1: pl.DataFrame, df2: pl.DataFrame) -> dict[str, Any]:
-        """Compare schemas of two DataFrames."""
-        cols1 = set(df1.columns)
-        cols2 = set(df2.columns)
+    def _compare_schema(self, schema1: pl.Schema, schema2: pl.Schema) -> dict[str, Any]:
+        """Compare schemas of two datasets."""
+        cols1 = set(schema1.names())
+        cols2 = set(schema2.names())
 
         common_cols = cols1 & cols2
         only_in_1 = cols1 - cols2
@@ -116,9 +113,9 @@ class DiffService:
 
         type_mismatches = []
         for col in common_cols:
-            if col in df1.columns and col in df2.columns:
-                dtype1 = df1[col].dtype
-                dtype2 = df2[col].dtype
+            if col in schema1 and col in schema2:
+                dtype1 = schema1[col]
+                dtype2 = schema2[col]
                 if dtype1 != dtype2:
                     type_mismatches.append(
                         {
@@ -147,6 +144,16 @@ class DiffService:
                 sha256.update(chunk)
         return sha256.hexdigest()[:16]  # First 16 chars
 
+    def _compute_dataset_checksum(self, paths: list[Path]) -> str:
+        """Compute checksum over all shards of a dataset."""
+        if len(paths) == 1:
+            return self._compute_checksum(paths[0])
+
+        import hashlib
+
+        combined = "|".join(self._compute_checksum(path) for path in paths)
+        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+
     def _compare_samples(self, df1: pl.DataFrame, df2: pl.DataFrame) -> dict[str, Any]:
         """Compare sample values."""
         sample1 = df1.head(5)
@@ -8,6 +8,8 @@ import numpy as np
 import polars as pl
 from pydantic import BaseModel, Field
 
+from mldata.core.sketch import DatasetSketch, QuantileSketch, SketchService, bin_counts
+
 
 class DriftSeverity(str, Enum):
     """Severity level of drift."""
@@ -119,6 +121,39 @@ class DriftReport(BaseModel):
         return output
 
 
+class DriftProfile(BaseModel):
+    """Reference profile of a baseline dataset.
+
+    Holds everything drift detection needs from the baseline, so it is
+    read once: per numeric column the histogram bin edges, per-bin counts
+    and moments, and per string column the category counts.
+    """
+
+    version: str = "1.0"
+    generated_at: datetime
+    source_path: str
+    source_fingerprint: str | None = None  # State of the source files the profile was built from
+    num_rows: int = 0
+    bins: int = 10
+    numeric: dict[str, dict] = Field(default_factory=dict)
+    categorical: dict[str, dict] = Field(default_factory=dict)
+
+    def to_json(self, path: Path) -> None:
+        """Write the profile to a JSON file."""
+        import json
+
+        with open(path, "w") as f:
+            json.dump(self.model_dump(mode="json"), f)
+
+    @classmethod
+    def from_json(cls, path: Path) -> "DriftProfile":
+        """Read a profile written by to_json."""
+        import json
+
+        with open(path) as f:
+            return cls.model_validate(json.load(f))
+
+
 class DriftService:
     """Service for detecting data drift between datasets."""
 
@@ -126,18 +161,62 @@ class DriftService:
     PSI_THRESHOLD_MEDIUM = 0.1
     PSI_THRESHOLD_HIGH = 0.25
 
-    def __init__(self, psi_bins: int = 10):
+    # Numeric types compared with PSI/KL
+    NUMERIC_DTYPES = frozenset(
+        {
+            pl.Float64,
+            pl.Float32,
+            pl.Int64,
+            pl.Int32,
+            pl.Int16,
+            pl.Int8,
+            pl.UInt64,
+            pl.UInt32,
+            pl.UInt16,
+            pl.UInt8,
+        }
+    )
+
+    # Values histogrammed per batch of columns (float64, so 128 MB)
+    HISTOGRAM_BATCH_VALUES = 1 << 24
+
+    # Baseline profile file, stored next to a build's manifest.yaml
+    PROFILE_FILE = "drift_profile.json"
+
+    # Category holding the values a capped CategorySketch no longer counts individually
+    OTHER_CATEGORY = "__other__"
+
+    # How datasets are summarized: "exact" reads each dataset into memory,
+    # "sketch" streams it in batches into mergeable sketches
+    BACKENDS = ("exact", "sketch")
+
+    def __init__(
+        self,
+        psi_bins: int = 10,
+        backend: str = "exact",
+        workers: int | None = None,
+        batch_size: int = 100_000,
+    ):
         """Initialize drift service.
 
         Args:
             psi_bins: Number of bins for PSI calculation
+            backend: "exact" or "sketch"
+            workers: Worker processes sketching a dataset (sketch backend)
+            batch_size: Rows held in memory per worker (sketch backend)
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown drift backend: {backend}. Supported: {', '.join(self.BACKENDS)}")
+
         self.psi_bins = psi_bins
+        self.backend = backend
+        self.workers = workers
+        self.batch_size = batch_size
 
     def compute_psi(
         self,
-        baseline: list[float],
-        current: list[float],
+        baseline: list[float] | np.ndarray,
+        current: list[float] | np.ndarray,
         bins: int | None = None,
     ) -> float:
         """Compute Population Stability Index (PSI).
@@ -152,7 +231,7 @@ class DriftService:
         Returns:
             PSI value
         """
-        if not baseline or not current:
+        if len(baseline) == 0 or len(current) == 0:
             return 0.0
 
         bins = bins or self.psi_bins
@@ -278,127 +357,434 @@ class DriftService:
         else:
             return DriftSeverity.HIGH
 
-    def detect_drift(
+    def build_profile(
         self,
-        baseline_path: Path,
-        current_path: Path,
-    ) -> DriftReport:
-        """Detect drift between two datasets.
+        df: pl.DataFrame,
+        source_path: str = "",
+        source_fingerprint: str | None = None,
+    ) -> DriftProfile:
+        """Profile a baseline dataset in one pass.
+
+        Numeric columns get psi_bins equal-width bins spanning the baseline
+        range; these edges are fixed for every later comparison, and
+        current values outside them fall into the first or last bin.
 
         Args:
-            baseline_path: Path to baseline dataset
-            current_path: Path to current dataset
+            df: Baseline data
+            source_path: Where the data came from, for reports
+            source_fingerprint: State of the source files, to detect a stale profile
 
         Returns:
-            DriftReport with all drift metrics
+            DriftProfile
         """
+        profile = DriftProfile(
+            generated_at=datetime.now(),
+            source_path=source_path,
+            source_fingerprint=source_fingerprint,
+            num_rows=len(df),
+            bins=self.psi_bins,
+        )
+
+        numeric_columns = [col for col, dtype in df.schema.items() if dtype in self.NUMERIC_DTYPES]
+        stats = self._column_stats(df, numeric_columns)
+        numeric_columns = [col for col in numeric_columns if stats[col]["count"] > 0]
+        for batch in self._batches(numeric_columns, len(df)):
+            edges = np.array([self._bin_edges(stats[col]["min"], stats[col]["max"]) for col in batch])
+            counts = self._histograms(df, batch, edges[:, 0], edges[:, -1], self.psi_bins)
+            for index, col in enumerate(batch):
+                profile.numeric[col] = {
+                    "edges": edges[index].tolist(),
+                    "counts": counts[index].astype(np.int64).tolist(),
+                    **stats[col],
+                }
+
+        string_columns = [col for col, dtype in df.schema.items() if dtype == pl.Utf8]
+        for col, counts in self._category_counts(df, string_columns).items():
+            profile.categorical[col] = {"counts": counts, "count": sum(counts.values())}
+
+        return profile
+
+    def build_profile_from_sketch(
+        self,
+        sketch: DatasetSketch,
+        source_path: str = "",
+        source_fingerprint: str | None = None,
+    ) -> DriftProfile:
+        """Profile a baseline from its sketch.
+
+        Bin counts are exact for columns the sketch was given edges for
+        (see sketch_dataset), and estimated from the quantile sketch
+        otherwise.
+
+        Args:
+            sketch: Baseline DatasetSketch
+            source_path: Where the data came from, for reports
+            source_fingerprint: State of the source files, to detect a stale profile
+
+        Returns:
+            DriftProfile
+        """
+        profile = DriftProfile(
+            generated_at=datetime.now(),
+            source_path=source_path,
+            source_fingerprint=source_fingerprint,
+            num_rows=sketch.num_rows,
+            bins=self.psi_bins,
+        )
+
+        for col, column in sketch.numeric.items():
+            if column.count == 0:
+                continue
+            edges = self._bin_edges(column.min, column.max)
+            counts = sketch.histograms[col] if col in sketch.histograms else column.histogram(edges)
+            profile.numeric[col] = {
+                "edges": edges.tolist(),
+                "counts": counts.tolist(),
+                **self._sketch_stats(column),
+            }
+
+        for col, column in sketch.categorical.items():
+            counts = dict(column.counts)
+            if column.other:
+                counts[self.OTHER_CATEGORY] = column.other
+            profile.categorical[col] = {"counts": counts, "count": column.count}
+
+        return profile
+
+    def profile_dataset(self, baseline_path: Path, save: bool = True) -> DriftProfile:
+        """Load the stored profile of a baseline dataset, building it if needed.
+
+        A directory's profile lives in PROFILE_FILE inside it, and is
+        reused while the data files it was built from are unchanged and
+        its bin count matches. A new profile is saved only for
+        build directories (those with a manifest.yaml). A path to a
+        profile file itself is loaded as is.
+
+        Args:
+            baseline_path: Baseline dataset file or directory, or a profile file
+            save: Write a rebuilt profile next to the build's manifest
+
+        Returns:
+            DriftProfile
+        """
+        from mldata.core.cache import ValidationCache
         from mldata.core.normalize import NormalizeService
 
+        if self.is_profile_file(baseline_path):
+            return DriftProfile.from_json(baseline_path)
+
         normalize = NormalizeService()
+        data_files = normalize.find_data_files(baseline_path)
+        if not data_files:
+            raise ValueError(f"No data files found in {baseline_path}")
+
+        fingerprints = ValidationCache()
+        source_fingerprint = ";".join(f"{path}={fingerprints.fingerprint(path)}" for path in data_files)
+
+        profile_file = baseline_path / self.PROFILE_FILE if baseline_path.is_dir() else None
+        if profile_file is not None and profile_file.is_file():
+            profile = DriftProfile.from_json(profile_file)
+            if profile.source_fingerprint == source_fingerprint and profile.bins == self.psi_bins:
+                return profile
 
-        # Read data
-        baseline_df = normalize.read_data(baseline_path)
-        current_df = normalize.read_data(current_path)
+        if self.backend == "sketch":
+            profile = self.build_profile_from_sketch(self.sketch_dataset(data_files), str(baseline_path), source_fingerprint)
+        else:
+            profile = self.build_profile(normalize.read_dataset(data_files), str(baseline_path), source_fingerprint)
+        if save and profile_file is not None and (baseline_path / "manifest.yaml").is_file():
+            profile.to_json(profile_file)
+        return profile
+
+    def is_profile_file(self, path: Path) -> bool:
+        """Whether path is a stored profile rather than data."""
+        return path.is_file() and path.name.endswith(self.PROFILE_FILE)
+
+    def compare(self, profile: DriftProfile, df: pl.DataFrame, current_path: str = "") -> DriftReport:
+        """Measure drift of a dataset against a baseline profile in one pass.
+
+        Args:
+            profile: Baseline profile
+            df: Current data
+            current_path: Where the current data came from, for reports
+
+        Returns:
+            DriftReport
+        """
+        numeric_columns = [col for col in profile.numeric if df.schema.get(col) in self.NUMERIC_DTYPES]
+        stats = self._column_stats(df, numeric_columns)
+        numeric_columns = [col for col in numeric_columns if stats[col]["count"] > 0]
 
+        # Values are histogrammed a batch of columns at a time against the baseline edges
+        counts = {}
+        for batch in self._batches(numeric_columns, len(df)):
+            low = np.array([profile.numeric[col]["edges"][0] for col in batch])
+            high = np.array([profile.numeric[col]["edges"][-1] for col in batch])
+            counts.update(zip(batch, self._histograms(df, batch, low, high, profile.bins)))
+
+        string_columns = [col for col in profile.categorical if df.schema.get(col) == pl.Utf8]
+        categories = self._category_counts(df, string_columns)
+
+        return self._drift_report(profile, current_path, len(df), counts, stats, categories)
+
+    def compare_sketch(self, profile: DriftProfile, sketch: DatasetSketch, current_path: str = "") -> DriftReport:
+        """Measure drift of a sketched dataset against a baseline profile.
+
+        Bin counts are exact when the sketch was built with the profile's
+        edges, and estimated from the quantile sketches otherwise.
+
+        Args:
+            profile: Baseline profile
+            sketch: DatasetSketch of the current data
+            current_path: Where the current data came from, for reports
+
+        Returns:
+            DriftReport
+        """
+        numeric_columns = [col for col in profile.numeric if col in sketch.numeric and sketch.numeric[col].count > 0]
+        counts = {}
+        for col in numeric_columns:
+            if col in sketch.histograms:
+                counts[col] = sketch.histograms[col]
+            else:
+                counts[col] = sketch.numeric[col].histogram(np.asarray(profile.numeric[col]["edges"]))
+        stats = {col: self._sketch_stats(sketch.numeric[col]) for col in numeric_columns}
+
+        categories = {}
+        for col in profile.categorical:
+            if col in sketch.categorical:
+                categories[col] = dict(sketch.categorical[col].counts)
+                if sketch.categorical[col].other:
+                    categories[col][self.OTHER_CATEGORY] = sketch.categorical[col].other
+
+        return self._drift_report(profile, current_path, sketch.num_rows, counts, stats, categories)
+
+    def _drift_report(
+        self,
+        profile: DriftProfile,
+        current_path: str,
+        current_rows: int,
+        numeric_counts: dict[str, np.ndarray],
+        numeric_stats: dict[str, dict[str, float]],
+        category_counts: dict[str, dict[str, int]],
+    ) -> DriftReport:
+        """Assemble a drift report from current bin and category counts."""
         report = DriftReport(
             generated_at=datetime.now(),
-            baseline_path=str(baseline_path),
-            current_path=str(current_path),
-            baseline_samples=len(baseline_df),
-            current_samples=len(current_df),
+            baseline_path=profile.source_path,
+            current_path=current_path,
+            baseline_samples=profile.num_rows,
+            current_samples=current_rows,
         )
 
-        numeric_dtypes = {
-            pl.Float64,
-            pl.Float32,
-            pl.Int64,
-            pl.Int32,
-            pl.Int16,
-            pl.Int8,
-            pl.UInt64,
-            pl.UInt32,
-            pl.UInt16,
-            pl.UInt8,
-        }
+        # PSI and KL of all numeric columns as array operations
+        columns = list(numeric_counts)
+        if columns:
+            baseline_pct = np.array([profile.numeric[col]["counts"] for col in columns], dtype=np.float64)
+            current_pct = np.array([numeric_counts[col] for col in columns], dtype=np.float64)
+            baseline_pct /= baseline_pct.sum(axis=1, keepdims=True)
+            current_pct /= current_pct.sum(axis=1, keepdims=True)
+            baseline_pct = np.clip(baseline_pct, 1e-10, 1.0)
+            current_pct = np.clip(current_pct, 1e-10, 1.0)
+
+            psi = np.sum((current_pct - baseline_pct) * np.log(current_pct / baseline_pct), axis=1)
+            kl = np.sum(baseline_pct * np.log(baseline_pct / current_pct), axis=1)
+
+            for index, col in enumerate(columns):
+                column_psi = float(psi[index])
+                report.numeric_drift[col] = {
+                    "psi": column_psi,
+                    "kl_divergence": float(kl[index]),
+                    "drift_detected": column_psi >= self.PSI_THRESHOLD_MEDIUM,
+                    "severity": self._psi_to_severity(column_psi).value,
+                    "baseline_stats": {key: profile.numeric[col][key] for key in ("mean", "std", "min", "max")},
+                    "current_stats": {key: numeric_stats[col][key] for key in ("mean", "std", "min", "max")},
+                }
+
+        for col, current in category_counts.items():
+            baseline = profile.categorical[col]["counts"]
+            if not baseline or not current:
+                continue
+
+            # Align categories; ones new in the current data have a baseline count of 0
+            categories = list(baseline) + [category for category in current if category not in baseline]
+            baseline_counts = np.array([baseline.get(category, 0) for category in categories], dtype=np.float64)
+            counts = np.array([current.get(category, 0) for category in categories], dtype=np.float64)
+            chi_sq = self.compute_chi_squared(baseline_counts, counts)
+
+            p_baseline = np.clip(baseline_counts / baseline_counts.sum(), 1e-10, 1.0)
+            p_current = np.clip(counts / counts.sum(), 1e-10, 1.0)
+            psi = abs(float(np.sum((p_current - p_baseline) * np.log(p_current / p_baseline))))
+
+            report.categorical_drift[col] = {
+                "psi": psi,
+                "chi_squared": chi_sq,
+                "drift_detected": psi >= self.PSI_THRESHOLD_MEDIUM,
+                "severity": self._psi_to_severity(psi).value,
+            }
 
         severity_counts = {"low": 0, "medium": 0, "high": 0}
-        any_drift = False
-
-        # Check numeric columns
-        for col in baseline_df.columns:
-            baseline_col = baseline_df[col]
-            current_col = current_df[col]
-
-            if baseline_col.dtype in numeric_dtypes:
-                baseline_vals = baseline_col.drop_nulls().to_list()
-                current_vals = current_col.drop_nulls().to_list()
-
-                if len(baseline_vals) > 0 and len(current_vals) > 0:
-                    psi = self.compute_psi(baseline_vals, current_vals)
-                    severity = self._psi_to_severity(float(psi))
-                    drift_detected = psi >= self.PSI_THRESHOLD_MEDIUM
-
-                    if drift_detected:
-                        any_drift = True
-                        severity_counts[severity.value] += 1
-
-                    report.numeric_drift[col] = {
-                        "psi": psi,
-                        "drift_detected": drift_detected,
-                        "severity": severity.value,
-                        "baseline_stats": {
-                            "mean": float(np.mean(baseline_vals)),
-                            "std": float(np.std(baseline_vals)) if len(baseline_vals) > 1 else 0,
-                            "min": float(np.min(baseline_vals)),
-                            "max": float(np.max(baseline_vals)),
-                        },
-                        "current_stats": {
-                            "mean": float(np.mean(current_vals)),
-                            "std": float(np.std(current_vals)) if len(current_vals) > 1 else 0,
-                            "min": float(np.min(current_vals)),
-                            "max": float(np.max(current_vals)),
-                        },
-                    }
-
-        # Check categorical columns
-        for col in baseline_df.columns:
-            baseline_col = baseline_df[col]
-            current_col = current_df[col]
-
-            if baseline_col.dtype == pl.Utf8:
-                baseline_counts = baseline_col.value_counts()["count"].to_list()
-                current_counts = current_col.value_counts()["count"].to_list()
-
-                # Pad to same length if needed
-                max_len = max(len(baseline_counts), len(current_counts))
-                baseline_counts.extend([0] * (max_len - len(baseline_counts)))
-                current_counts.extend([0] * (max_len - len(current_counts)))
-
-                if sum(baseline_counts) > 0 and sum(current_counts) > 0:
-                    chi_sq = self.compute_chi_squared(np.array(baseline_counts), np.array(current_counts))
-
-                    # Normalize to get approximate PSI-like metric
-                    p_baseline = np.array(baseline_counts) / sum(baseline_counts)
-                    p_current = np.array(current_counts) / sum(current_counts)
-                    p_baseline = np.clip(p_baseline, 1e-10, 1.0)
-                    p_current = np.clip(p_current, 1e-10, 1.0)
-                    psi = np.sum((p_current - p_baseline) * np.log(p_current / p_baseline))
-
-                    severity = self._psi_to_severity(abs(psi))
-                    drift_detected = abs(psi) >= self.PSI_THRESHOLD_MEDIUM
-
-                    if drift_detected:
-                        any_drift = True
-                        severity_counts[severity.value] += 1
-
-                    report.categorical_drift[col] = {
-                        "psi": abs(psi),
-                        "chi_squared": chi_sq,
-                        "drift_detected": drift_detected,
-                        "severity": severity.value,
-                    }
-
-        report.overall_drift_detected = any_drift
+        for drift in [*report.numeric_drift.values(), *report.categorical_drift.values()]:
+            if drift["drift_detected"]:
+                severity_counts[drift["severity"]] += 1
+        report.overall_drift_detected = sum(severity_counts.values()) > 0
         report.severity_summary = severity_counts
 
         return report
+
+    def numeric_drift(
+        self,
+        baseline_df: pl.DataFrame,
+        current_df: pl.DataFrame,
+        columns: list[str],
+    ) -> dict[str, dict]:
+        """Compute PSI, KL divergence and summary stats for many numeric columns.
+
+        Args:
+            baseline_df: Baseline data
+            current_df: Current data
+            columns: Numeric columns present in both
+
+        Returns:
+            Drift metrics per column, for columns with values in both datasets
+        """
+        profile = self.build_profile(baseline_df.select(columns))
+        return self.compare(profile, current_df.select(columns)).numeric_drift
+
+    def sketch_dataset(self, source: Path | list[Path], profile: DriftProfile | None = None) -> DatasetSketch:
+        """Sketch a dataset in bounded memory, with exact bin counts.
+
+        Bin edges come from the profile when given. Otherwise a streaming
+        min/max scan fixes them first, as build_profile would. The sketch
+        pass then counts values into those bins exactly, batch by batch
+        on worker processes.
+
+        Args:
+            source: Dataset file, directory of shards, or explicit list of shards
+            profile: Baseline profile whose edges to count against
+
+        Returns:
+            DatasetSketch
+        """
+        from mldata.core.normalize import NormalizeService
+
+        if profile is not None:
+            edges = {col: column["edges"] for col, column in profile.numeric.items()}
+        else:
+            lf = NormalizeService().scan_dataset(source)
+            columns = [col for col, dtype in lf.collect_schema().items() if dtype in self.NUMERIC_DTYPES]
+            values = pl.col(columns).cast(pl.Float64).fill_nan(None)
+            row = (
+                lf.select(values.min().name.prefix("min:"), values.max().name.prefix("max:"))
+                .collect(engine="streaming")
+                .row(0, named=True)
+            )
+            edges = {
+                col: self._bin_edges(row[f"min:{col}"], row[f"max:{col}"]).tolist()
+                for col in columns
+                if row[f"min:{col}"] is not None
+            }
+
+        return SketchService(batch_size=self.batch_size, workers=self.workers, edges=edges).sketch_dataset(source)
+
+    def _bin_edges(self, low: float, high: float) -> np.ndarray:
+        """psi_bins equal-width bin edges over [low, high]; a constant gets a unit-wide range."""
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        return np.linspace(low, high, self.psi_bins + 1)
+
+    def _sketch_stats(self, sketch: QuantileSketch) -> dict[str, float]:
+        """Count and moments tracked by a quantile sketch."""
+        return {"count": sketch.count, "mean": sketch.mean, "std": sketch.std, "min": sketch.min, "max": sketch.max}
+
+    def _batches(self, columns: list[str], num_rows: int) -> list[list[str]]:
+        """Split columns into batches of at most HISTOGRAM_BATCH_VALUES values."""
+        batch_size = max(1, self.HISTOGRAM_BATCH_VALUES // max(num_rows, 1))
+        return [columns[start : start + batch_size] for start in range(0, len(columns), batch_size)]
+
+    def _column_stats(self, df: pl.DataFrame, columns: list[str]) -> dict[str, dict[str, float]]:
+        """Count, mean, std, min and max of non-missing values, for all columns in one select."""
+        if not columns:
+            return {}
+
+        values = pl.col(columns).cast(pl.Float64).fill_nan(None)
+        row = df.select(
+            values.count().name.prefix("count:"),
+            values.mean().name.prefix("mean:"),
+            values.std(ddof=0).name.prefix("std:"),
+            values.min().name.prefix("min:"),
+            values.max().name.prefix("max:"),
+        ).row(0, named=True)
+
+        stats = {}
+        for col in columns:
+            count = row[f"count:{col}"]
+            stats[col] = {
+                "count": count,
+                "mean": row[f"mean:{col}"],
+                "std": row[f"std:{col}"] if count > 1 else 0,
+                "min": row[f"min:{col}"],
+                "max": row[f"max:{col}"],
+            }
+        return stats
+
+    def _histograms(self, df: pl.DataFrame, columns: list[str], low: np.ndarray, high: np.ndarray, bins: int) -> np.ndarray:
+        """Counts of each column's values in equal-width bins over [low, high].
+
+        Each batch is exported once as a 2-D float array and binned in
+        place. NaN counts as missing, like null.
+
+        Returns:
+            Float array of shape (len(columns), bins)
+        """
+        values = df.select(pl.col(columns).cast(pl.Float64).fill_nan(None)).to_numpy(writable=True)
+        return bin_counts(values, low, high, bins)
+
+    def _category_counts(self, df: pl.DataFrame, columns: list[str]) -> dict[str, dict[str, int]]:
+        """Non-null value counts of each string column, in one select."""
+        if not columns:
+            return {}
+
+        row = df.select(
+            pl.col(col).drop_nulls().value_counts(sort=True).implode().alias(f"counts:{col}") for col in columns
+        ).row(0, named=True)
+        return {col: {item[col]: item["count"] for item in row[f"counts:{col}"]} for col in columns}
+
+    def detect_drift(
+        self,
+        baseline_path: Path,
+        current_path: Path,
+        use_profile: bool = True,
+    ) -> DriftReport:
+        """Detect drift between two datasets.
+
+        The baseline is summarized as a DriftProfile; with use_profile, a
+        stored profile is reused (and a build's profile saved), so only the
+        current dataset is read. The sketch backend streams each dataset
+        in batches on worker processes instead of reading it into memory.
+
+        Args:
+            baseline_path: Baseline dataset file or directory of shards, or a profile file
+            current_path: Path to current dataset file or directory of shards
+            use_profile: Reuse and store the baseline profile next to the manifest
+
+        Returns:
+            DriftReport with all drift metrics
+        """
+        from mldata.core.normalize import NormalizeService
+
+        normalize = NormalizeService()
+
+        if use_profile:
+            profile = self.profile_dataset(baseline_path)
+        elif self.backend == "sketch":
+            profile = self.build_profile_from_sketch(self.sketch_dataset(baseline_path), str(baseline_path))
+        else:
+            profile = self.build_profile(normalize.read_dataset(baseline_path), str(baseline_path))
+
+        if self.backend == "sketch":
+            return self.compare_sketch(profile, self.sketch_dataset(current_path, profile), str(current_path))
+
+        # Read data (all shards of the current dataset)
+        current_df = normalize.read_dataset(current_path)
+
+        return self.compare(profile, current_df, str(current_path))
@@ -63,7 +63,7 @@ class ExportService:
     }
 
     # Supported formats
-    SUPPORTED_FORMATS = {"parquet", "csv", "json", "jsonl"}
+    SUPPORTED_FORMATS = {"parquet", "csv", "json", "jsonl", "arrow"}
 
     def __init__(self):
         """Initialize export service."""
@@ -124,7 +124,7 @@ class ExportService:
         Args:
             df: Polars DataFrame
             output_path: Output file path
-            format: Output format (parquet, csv, json, jsonl)
+            format: Output format (parquet, csv, json, jsonl, arrow)
             compression: Compression type with optional level (e.g., "gzip:6", "zstd:3")
 
         Returns:
@@ -156,6 +156,12 @@ class ExportService:
         elif format == "jsonl":
             df.write_ndjson(output_path)
 
+        elif format == "arrow":
+            # Arrow IPC only supports lz4 and zstd; anything else stays uncompressed and memory-mappable
+            comp_options = self.parse_compression(compression)
+            ipc_compression = comp_options.type if comp_options.type in ("lz4", "zstd") else "uncompressed"
+            df.write_ipc(output_path, compression=ipc_compression)
+
         else:
             raise ValueError(f"Unsupported format: {format}")
 
@@ -72,7 +72,7 @@ class IncrementalService:
             Dict mapping relative file paths to hashes
         """
         hashes = {}
-        extensions = {".csv", ".parquet", ".jsonl", ".json", ".arrow"}
+        extensions = {".csv", ".parquet", ".jsonl", ".json", ".arrow", ".arff"}
 
         for ext in extensions:
             for file_path in dir_path.rglob(f"*{ext}"):
@@ -142,6 +142,9 @@ class ManifestService:
         for file_path in output_dir.rglob("*"):
             if file_path.is_file():
                 rel_path = file_path.relative_to(output_dir)
+                # intermediate/ only holds caches rebuilt from the artifacts
+                if rel_path.parts[0] == "intermediate":
+                    continue
                 artifact_name = str(rel_path)
                 file_hash = self._compute_file_hash(file_path)
                 hashes[artifact_name] = file_hash
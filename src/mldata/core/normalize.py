@@ -1,17 +1,43 @@
 """Normalization service for format conversion and schema handling."""
 
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+from mldata.core.arff import scan_arff
+
 
 class NormalizeService:
     """Service for normalizing datasets to standard formats."""
 
-    def __init__(self):
-        """Initialize normalization service."""
-        pass
+    # Data file formats picked up when a directory is read as one dataset,
+    # in order of preference when the same shard exists in several formats
+    DATASET_FORMATS = ["parquet", "arrow", "jsonl", "csv", "arff"]
+
+    # Formats Polars can scan lazily and sink without materializing the table
+    STREAMING_FORMATS = {"csv", "jsonl", "parquet", "arrow"}
+
+    # Input-only formats that can still be scanned lazily
+    SCAN_ONLY_FORMATS = {"arff"}
+
+    # Rows sampled to estimate the in-memory width of a row
+    ROW_WIDTH_SAMPLE = 1000
+
+    # Memory-mappable cache of the normalized table, under a build's intermediate/ directory
+    INTERMEDIATE_FILE = "data.arrow"
+
+    def __init__(self, row_group_size: int | None = None, memory_budget_mb: int | None = None):
+        """Initialize normalization service.
+
+        Args:
+            row_group_size: Rows per Parquet row group when sinking (default: Polars default)
+            memory_budget_mb: Approximate memory cap for streaming writes; batch and
+                row group sizes are derived from it when set
+        """
+        self.row_group_size = row_group_size
+        self.memory_budget_mb = memory_budget_mb
 
     def detect_format(self, file_path: Path) -> str:
         """Detect the format of a data file.
@@ -20,7 +46,7 @@ class NormalizeService:
             file_path: Path to data file
 
         Returns:
-            Detected format (csv, json, jsonl, parquet)
+            Detected format (csv, json, jsonl, parquet, arrow, arff)
         """
         suffix = file_path.suffix.lower()
 
@@ -30,6 +56,9 @@ class NormalizeService:
             ".jsonl": "jsonl",
             ".parquet": "parquet",
             ".arrow": "arrow",
+            ".feather": "arrow",
+            ".ipc": "arrow",
+            ".arff": "arff",
         }
 
         return format_map.get(suffix, "unknown")
@@ -53,9 +82,240 @@ class NormalizeService:
             return pl.read_ndjson(file_path)
         elif format_type == "parquet":
             return pl.read_parquet(file_path)
+        elif format_type == "arrow":
+            # Uncompressed IPC files are mapped zero-copy instead of read into memory
+            return pl.read_ipc(file_path, memory_map=True)
+        elif format_type == "arff":
+            return scan_arff(file_path).collect()
+        else:
+            raise ValueError(f"Unsupported format: {format_type}")
+
+    def scan_data(self, file_path: Path) -> pl.LazyFrame:
+        """Lazily scan data file into a Polars LazyFrame.
+
+        Nothing is read until the returned frame is collected or sunk, so
+        downstream steps can be chained into a single streaming plan.
+
+        Args:
+            file_path: Path to data file
+
+        Returns:
+            Polars LazyFrame
+        """
+        format_type = self.detect_format(file_path)
+
+        if format_type == "csv":
+            return pl.scan_csv(file_path)
+        elif format_type == "jsonl":
+            return pl.scan_ndjson(file_path)
+        elif format_type == "parquet":
+            return pl.scan_parquet(file_path)
+        elif format_type == "arrow":
+            return pl.scan_ipc(file_path, memory_map=True)
+        elif format_type == "arff":
+            return scan_arff(file_path)
+        elif format_type == "json":
+            # Plain JSON is a single document and cannot be scanned incrementally
+            return pl.read_json(file_path).lazy()
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
+    def sink_data(
+        self,
+        lf: pl.LazyFrame,
+        output_path: Path,
+        target_format: str,
+        compression: str | None = None,
+    ) -> Path:
+        """Write a LazyFrame to disk with the streaming engine.
+
+        Args:
+            lf: Polars LazyFrame
+            output_path: Output file path
+            target_format: Target format (csv, json, jsonl, parquet, arrow)
+            compression: Compression type for parquet or arrow output
+
+        Returns:
+            Path to written file
+        """
+        return self.sink_many({output_path: lf}, target_format, compression)[0]
+
+    def sink_many(
+        self,
+        frames: dict[Path, pl.LazyFrame],
+        target_format: str,
+        compression: str | None = None,
+    ) -> list[Path]:
+        """Write several LazyFrames in a single streaming query.
+
+        All sinks run together, so frames derived from the same scan (for
+        example one filter per split) read the source once, and no frame is
+        ever collected in full.
+
+        Args:
+            frames: Mapping of output file path to LazyFrame
+            target_format: Target format (csv, json, jsonl, parquet, arrow)
+            compression: Compression type for parquet or arrow output
+
+        Returns:
+            List of written paths
+        """
+        budget_rows = self._budget_rows(next(iter(frames.values())))
+        chunk_config = pl.Config(streaming_chunk_size=budget_rows) if budget_rows else nullcontext()
+
+        with chunk_config:
+            if target_format == "json":
+                # Plain JSON is a single document and has no sink
+                for output_path, lf in frames.items():
+                    lf.collect(engine="streaming").write_json(output_path)
+            else:
+                sinks = [
+                    self._lazy_sink(lf, output_path, target_format, compression, budget_rows)
+                    for output_path, lf in frames.items()
+                ]
+                pl.collect_all(sinks, engine="streaming")
+
+        return list(frames)
+
+    def _lazy_sink(
+        self,
+        lf: pl.LazyFrame,
+        output_path: Path,
+        target_format: str,
+        compression: str | None,
+        budget_rows: int | None,
+    ) -> pl.LazyFrame:
+        """Build a deferred sink of a LazyFrame to one file."""
+        if target_format == "csv":
+            return lf.sink_csv(output_path, lazy=True)
+        elif target_format == "jsonl":
+            return lf.sink_ndjson(output_path, lazy=True)
+        elif target_format == "parquet":
+            compression_map = {
+                "snappy": "snappy",
+                "gzip": "gzip",
+                "zstd": "zstd",
+            }
+            comp = compression_map.get(compression, "snappy")
+            return lf.sink_parquet(output_path, compression=comp, row_group_size=self.row_group_size or budget_rows, lazy=True)
+        elif target_format == "arrow":
+            return lf.sink_ipc(output_path, compression=self._ipc_compression(compression), lazy=True)
+        else:
+            raise ValueError(f"Unsupported format: {target_format}")
+
+    def _ipc_compression(self, compression: str | None) -> str:
+        """Map a compression name to an Arrow IPC codec.
+
+        Arrow files are left uncompressed unless lz4 or zstd is requested,
+        since compressed buffers cannot be memory-mapped zero-copy.
+        """
+        compression_map = {
+            "lz4": "lz4",
+            "zstd": "zstd",
+        }
+        return compression_map.get(compression, "uncompressed")
+
+    def _budget_rows(self, lf: pl.LazyFrame) -> int | None:
+        """Estimate how many rows fit in one streaming batch under the memory budget.
+
+        The budget is shared by one in-flight batch per worker thread plus the
+        buffered output row group, and row width is estimated from a small sample.
+        """
+        if self.memory_budget_mb is None:
+            return None
+
+        sample = lf.head(self.ROW_WIDTH_SAMPLE).collect()
+        row_bytes = max(1, sample.estimated_size() // max(1, sample.height))
+        budget_bytes = self.memory_budget_mb * 1024**2
+
+        return max(1, budget_bytes // (row_bytes * (pl.thread_pool_size() + 1)))
+
+    def find_data_files(self, path: Path) -> list[Path]:
+        """Find all data shards that make up a dataset.
+
+        A build directory resolves to its memory-mapped ``intermediate/``
+        cache when that is at least as new as the artifacts, otherwise to its
+        normalized ``artifacts/`` files; any other directory contributes every
+        data file below it. When the same shard exists in several formats only
+        the preferred one is kept.
+
+        Args:
+            path: Data file or directory
+
+        Returns:
+            Sorted list of data file paths
+        """
+        if path.is_file():
+            return [path] if self.detect_format(path) != "unknown" else []
+
+        artifacts_dir = path / "artifacts"
+        cache_file = path / "intermediate" / self.INTERMEDIATE_FILE
+        if cache_file.is_file() and artifacts_dir.is_dir():
+            artifact_mtimes = [f.stat().st_mtime_ns for f in artifacts_dir.rglob("*") if f.is_file()]
+            if artifact_mtimes and cache_file.stat().st_mtime_ns >= max(artifact_mtimes):
+                return [cache_file]
+
+        search_dir = artifacts_dir if artifacts_dir.is_dir() and self.find_data_files(artifacts_dir) else path
+
+        shards: dict[Path, Path] = {}
+        for format_type in reversed(self.DATASET_FORMATS):
+            for file_path in search_dir.rglob(f"*.{format_type}"):
+                shards[file_path.with_suffix("")] = file_path
+
+        return sorted(shards.values())
+
+    def scan_dataset(self, source: Path | list[Path]) -> pl.LazyFrame:
+        """Lazily scan all shards of a dataset as one logical table.
+
+        Shards are concatenated diagonally with relaxed dtypes, so columns
+        missing from a shard are filled with nulls and compatible types are
+        upcast to a common supertype. Polars scans the shards in parallel.
+
+        Args:
+            source: Data file, dataset directory, or explicit list of shards
+
+        Returns:
+            Polars LazyFrame over all shards
+        """
+        files = source if isinstance(source, list) else self.find_data_files(source)
+        if not files:
+            raise ValueError(f"No data files found in {source}")
+
+        frames = [self.scan_data(file_path) for file_path in files]
+        if len(frames) == 1:
+            return frames[0]
+
+        return pl.concat(frames, how="diagonal_relaxed", parallel=True)
+
+    def read_dataset(self, source: Path | list[Path]) -> pl.DataFrame:
+        """Read all shards of a dataset into one Polars DataFrame.
+
+        Args:
+            source: Data file, dataset directory, or explicit list of shards
+
+        Returns:
+            Polars DataFrame
+        """
+        return self.scan_dataset(source).collect()
+
+    def cache_intermediate(self, source: Path | list[Path], output_dir: Path) -> Path:
+        """Write an uncompressed Arrow IPC copy of a dataset under ``intermediate/``.
+
+        Later steps open the cache with a memory map, so re-reading a built
+        dataset costs no decoding and no copy into process memory.
+
+        Args:
+            source: Data file, dataset directory, or explicit list of shards
+            output_dir: Build output directory
+
+        Returns:
+            Path to the cache file
+        """
+        intermediate_dir = output_dir / "intermediate"
+        intermediate_dir.mkdir(parents=True, exist_ok=True)
+
+        return self.sink_data(self.scan_dataset(source), intermediate_dir / self.INTERMEDIATE_FILE, "arrow")
+
     def convert_format(
         self,
         input_path: Path,
@@ -65,15 +325,23 @@ class NormalizeService:
     ) -> Path:
         """Convert data to target format.
 
+        CSV, JSONL, Parquet, Arrow and ARFF are converted by streaming batches
+        from a lazy scan into a sink, so the table is never fully held in memory.
+        Plain JSON cannot be streamed and is converted in memory.
+
         Args:
             input_path: Input file path
             output_path: Output file path
-            target_format: Target format (csv, json, jsonl, parquet)
+            target_format: Target format (csv, json, jsonl, parquet, arrow)
             compression: Compression type for output
 
         Returns:
             Path to converted file
         """
+        input_format = self.detect_format(input_path)
+        if input_format in self.STREAMING_FORMATS | self.SCAN_ONLY_FORMATS and target_format in self.STREAMING_FORMATS:
+            return self.sink_data(self.scan_data(input_path), output_path, target_format, compression)
+
         df = self.read_data(input_path)
 
         if target_format == "csv":
@@ -90,6 +358,8 @@ class NormalizeService:
             }
             comp = compression_map.get(compression, "snappy")
             df.write_parquet(output_path, compression=comp)
+        elif target_format == "arrow":
+            df.write_ipc(output_path, compression=self._ipc_compression(compression))
         else:
             raise ValueError(f"Unsupported format: {target_format}")
 
@@ -0,0 +1,435 @@
+"""Mergeable per-column sketches for streaming drift detection."""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+
+def bin_counts(values: np.ndarray, low: np.ndarray, high: np.ndarray, bins: int) -> np.ndarray:
+    """Count each column's values in equal-width bins over [low, high].
+
+    The columns of a 2-D array are binned together: values are scaled to
+    bin units in place and counted with a single bincount. Values beyond
+    the edges join the end bins; NaN (missing) is not counted.
+
+    Args:
+        values: Writable float array of shape (rows, columns); overwritten
+        low: First edge per column
+        high: Last edge per column
+        bins: Bins per column
+
+    Returns:
+        Float array of shape (columns, bins)
+    """
+    columns = values.shape[1]
+    values -= low
+    values *= bins / (high - low)
+    np.clip(values, 0, bins - 1, out=values)
+    # Missing values go to an overflow bin that is dropped
+    values[np.isnan(values)] = bins
+    index = values.astype(np.int64, order="K")
+    index += np.arange(columns) * (bins + 1)
+
+    counts = np.bincount(index.ravel(order="K"), minlength=columns * (bins + 1))
+    return counts.reshape(columns, bins + 1)[:, :bins].astype(np.float64)
+
+
+class QuantileSketch:
+    """KLL-style quantile sketch of a numeric column, with exact moments.
+
+    Values are kept in levels of compactors; an item on level h stands for
+    2**h original values. A level holding more than k items is sorted and
+    every other item (from a random offset) is promoted to the next level,
+    so memory stays O(k log(n / k)) and ranks are accurate to roughly 1/k.
+    Count, mean, variance, min and max are tracked exactly. Sketches built
+    over disjoint data merge into the sketch of their union.
+    """
+
+    def __init__(self, k: int = 1024, seed: int = 0):
+        """Initialize an empty sketch.
+
+        Args:
+            k: Compactor capacity per level; larger is more accurate
+            seed: Seed of the compaction offsets, for reproducible sketches
+        """
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of values; NaN is ignored."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self._merge_moments(len(values), float(values.mean()), float(((values - values.mean()) ** 2).sum()))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one."""
+        if other.count == 0:
+            return
+
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for height, items in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self._compress()
+
+    def _merge_moments(self, count: int, mean: float, m2: float) -> None:
+        """Combine running moments with those of another batch (Chan et al.)."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+
+    def _compress(self) -> None:
+        """Compact every level over capacity into the level above."""
+        height = 0
+        while height < len(self.levels):
+            items = self.levels[height]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # An odd item out stays behind so weights are conserved
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[: len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2) :: 2]
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+                self.levels[height] = keep
+            height += 1
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.m2 / self.count) if self.count > 1 else 0.0
+
+    def cdf(self, points: np.ndarray) -> np.ndarray:
+        """Estimated fraction of values strictly below each point."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0**height) for height, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.concatenate([[0.0], np.cumsum(weights[order])])
+        return cumulative[np.searchsorted(items, points, side="left")] / cumulative[-1]
+
+    def histogram(self, edges: np.ndarray) -> np.ndarray:
+        """Estimated value counts per bin; values beyond the edges join the end bins."""
+        inner = self.cdf(np.asarray(edges[1:-1], dtype=np.float64))
+        return np.diff(np.concatenate([[0.0], inner, [1.0]])) * self.count
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state."""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+            "levels": [level.tolist() for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch from to_dict output."""
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.mean = data["mean"]
+        sketch.m2 = data["m2"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        sketch.levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]]
+        return sketch
+
+
+class CategorySketch:
+    """Capped exact counts of a string column.
+
+    Counts are exact while there are at most max_categories distinct
+    values; past that, the rarest are folded into one "other" count, so
+    the frequent categories that dominate drift stay exact.
+    """
+
+    def __init__(self, max_categories: int = 10_000):
+        """Initialize an empty sketch.
+
+        Args:
+            max_categories: Distinct values counted individually
+        """
+        self.max_categories = max_categories
+        self.counts: dict[str, int] = {}
+        self.other = 0
+
+    @property
+    def count(self) -> int:
+        """Non-null values seen."""
+        return sum(self.counts.values()) + self.other
+
+    def update(self, counts: dict[str, int]) -> None:
+        """Add value counts of a batch."""
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        self._cap()
+
+    def merge(self, other: "CategorySketch") -> None:
+        """Fold another sketch into this one."""
+        self.other += other.other
+        self.update(other.counts)
+
+    def _cap(self) -> None:
+        """Fold the rarest values into other when over capacity."""
+        if len(self.counts) <= self.max_categories:
+            return
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        self.other += sum(count for _, count in ranked[self.max_categories :])
+        self.counts = dict(ranked[: self.max_categories])
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state."""
+        return {"max_categories": self.max_categories, "counts": self.counts, "other": self.other}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CategorySketch":
+        """Rebuild a sketch from to_dict output."""
+        sketch = cls(max_categories=data["max_categories"])
+        sketch.counts = dict(data["counts"])
+        sketch.other = data["other"]
+        return sketch
+
+
+@dataclass
+class DatasetSketch:
+    """Sketches of every numeric and string column of a dataset."""
+
+    num_rows: int = 0
+    numeric: dict[str, QuantileSketch] = field(default_factory=dict)
+    categorical: dict[str, CategorySketch] = field(default_factory=dict)
+    histograms: dict[str, np.ndarray] = field(default_factory=dict)  # Exact counts on edges given up front
+
+    def merge(self, other: "DatasetSketch") -> None:
+        """Fold the sketch of other rows (another shard or row range) into this one."""
+        self.num_rows += other.num_rows
+        for col, counts in other.histograms.items():
+            self.histograms[col] = self.histograms[col] + counts if col in self.histograms else counts
+        for col, sketch in other.numeric.items():
+            if col in self.numeric:
+                self.numeric[col].merge(sketch)
+            else:
+                self.numeric[col] = sketch
+        for col, sketch in other.categorical.items():
+            if col in self.categorical:
+                self.categorical[col].merge(sketch)
+            else:
+                self.categorical[col] = sketch
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state."""
+        return {
+            "num_rows": self.num_rows,
+            "numeric": {col: sketch.to_dict() for col, sketch in self.numeric.items()},
+            "categorical": {col: sketch.to_dict() for col, sketch in self.categorical.items()},
+            "histograms": {col: counts.tolist() for col, counts in self.histograms.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DatasetSketch":
+        """Rebuild a sketch from to_dict output."""
+        return cls(
+            num_rows=data["num_rows"],
+            numeric={col: QuantileSketch.from_dict(sketch) for col, sketch in data["numeric"].items()},
+            categorical={col: CategorySketch.from_dict(sketch) for col, sketch in data["categorical"].items()},
+            histograms={col: np.asarray(counts, dtype=np.float64) for col, counts in data.get("histograms", {}).items()},
+        )
+
+
+class SketchService:
+    """Service for sketching datasets larger than memory."""
+
+    # Formats whose row ranges can be read without reading the rows before them
+    SLICEABLE_FORMATS = ("parquet", "arrow")
+
+    def __init__(
+        self,
+        batch_size: int = 100_000,
+        workers: int | None = None,
+        k: int = 1024,
+        max_categories: int = 10_000,
+        batches_per_task: int = 10,
+        edges: dict[str, list[float]] | None = None,
+    ):
+        """Initialize sketch service.
+
+        Args:
+            batch_size: Rows read into memory at a time
+            workers: Worker processes sketching row ranges in parallel. Defaults to CPU count.
+            k: Quantile sketch accuracy (compactor capacity)
+            max_categories: Distinct values counted exactly per string column
+            batches_per_task: Batches in the row range sent to a worker per task
+            edges: Equal-width bin edges per numeric column; these columns also
+                get exact, mergeable bin counts
+        """
+        import os
+
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+        self.k = k
+        self.max_categories = max_categories
+        self.batches_per_task = batches_per_task
+        self.edges = edges or {}
+
+    def sketch_frame(self, df: pl.DataFrame) -> DatasetSketch:
+        """Sketch an in-memory batch of rows.
+
+        Args:
+            df: Rows to sketch
+
+        Returns:
+            DatasetSketch of the rows
+        """
+        from mldata.core.drift import DriftService
+
+        sketch = DatasetSketch(num_rows=len(df))
+        numeric_columns = [col for col, dtype in df.schema.items() if dtype in DriftService.NUMERIC_DTYPES]
+        if numeric_columns:
+            values = df.select(pl.col(numeric_columns).cast(pl.Float64).fill_nan(None)).to_numpy(writable=True)
+            for index, col in enumerate(numeric_columns):
+                sketch.numeric[col] = QuantileSketch(k=self.k)
+                sketch.numeric[col].update(values[:, index])
+
+            binned = [index for index, col in enumerate(numeric_columns) if col in self.edges]
+            if binned:
+                edges = np.array([self.edges[numeric_columns[index]] for index in binned])
+                counts = bin_counts(values[:, binned], edges[:, 0], edges[:, -1], edges.shape[1] - 1)
+                sketch.histograms = {numeric_columns[index]: counts[row] for row, index in enumerate(binned)}
+
+        string_columns = [col for col, dtype in df.schema.items() if dtype == pl.Utf8]
+        if string_columns:
+            row = df.select(
+                pl.col(col).drop_nulls().value_counts().implode().alias(f"counts:{col}") for col in string_columns
+            ).row(0, named=True)
+            for col in string_columns:
+                sketch.categorical[col] = CategorySketch(max_categories=self.max_categories)
+                sketch.categorical[col].update({item[col]: item["count"] for item in row[f"counts:{col}"]})
+
+        return sketch
+
+    def sketch_range(self, path: Path, offset: int = 0, length: int | None = None) -> DatasetSketch:
+        """Sketch a row range of one data file, a batch at a time.
+
+        Parquet and Arrow files are scanned lazily and each batch is a
+        slice, so only the row groups it overlaps are read. Other formats
+        are read whole.
+
+        Args:
+            path: Data file
+            offset: First row of the range
+            length: Rows in the range (default: to the end of the file)
+
+        Returns:
+            DatasetSketch of the range
+        """
+        from mldata.core.normalize import NormalizeService
+
+        normalize = NormalizeService()
+        lf = normalize.scan_data(path)
+        if normalize.detect_format(path) not in self.SLICEABLE_FORMATS:
+            return self._sketch_batches(lf.collect().slice(offset, length).iter_slices(self.batch_size))
+
+        if length is None:
+            length = lf.select(pl.len()).collect().item() - offset
+        batches = (
+            lf.slice(start, min(self.batch_size, offset + length - start)).collect()
+            for start in range(offset, offset + length, self.batch_size)
+        )
+        return self._sketch_batches(batches)
+
+    def _sketch_batches(self, batches) -> DatasetSketch:
+        """Merge the sketches of a stream of batches."""
+        sketch = DatasetSketch()
+        for batch in batches:
+            sketch.merge(self.sketch_frame(batch))
+        return sketch
+
+    def sketch_dataset(self, source: Path | list[Path]) -> DatasetSketch:
+        """Sketch every shard of a dataset in bounded memory.
+
+        Parquet and Arrow shards are cut into row ranges of
+        batches_per_task batches, so even a single large file is spread
+        over the workers; other shards are one task each. Each worker
+        returns the sketch of its range and the sketches are merged as
+        they complete, with at most two tasks per worker in flight.
+
+        Args:
+            source: Dataset file, directory of shards, or explicit list of shards
+
+        Returns:
+            DatasetSketch of the whole dataset
+        """
+        from mldata.core.normalize import NormalizeService
+
+        normalize = NormalizeService()
+        files = source if isinstance(source, list) else normalize.find_data_files(source)
+        if not files:
+            raise ValueError(f"No data files found in {source}")
+
+        task_rows = self.batch_size * self.batches_per_task
+        tasks = []
+        for path in files:
+            if normalize.detect_format(path) in self.SLICEABLE_FORMATS:
+                num_rows = normalize.scan_data(path).select(pl.len()).collect().item()
+                tasks.extend((path, start, min(task_rows, num_rows - start)) for start in range(0, num_rows, task_rows))
+            else:
+                tasks.append((path, 0, None))
+
+        sketch = DatasetSketch()
+        if self.workers <= 1 or len(tasks) <= 1:
+            for path, offset, length in tasks:
+                sketch.merge(self.sketch_range(path, offset, length))
+            return sketch
+
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        # Workers run Polars, whose thread pool does not survive fork
+        options = self._options()
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = set()
+            for task in tasks:
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        sketch.merge(future.result())
+                pending.add(pool.submit(_sketch_range, *task, options))
+
+            for future in pending:
+                sketch.merge(future.result())
+
+        return sketch
+
+    def _options(self) -> dict[str, Any]:
+        """Settings passed to worker processes."""
+        return {"batch_size": self.batch_size, "k": self.k, "max_categories": self.max_categories, "edges": self.edges}
+
+
+def _sketch_range(path: Path, offset: int, length: int | None, options: dict[str, Any]) -> DatasetSketch:
+    """Sketch a row range of a file (runs in a worker process)."""
+    return SketchService(workers=1, **options).sketch_range(path, offset, length)
@@ -5,13 +5,38 @@ from pathlib import Path
 
 import polars as pl
 
+from mldata.core.dedup import DuplicateService, LeakageReport
+from mldata.core.normalize import NormalizeService
+
 
 class SplitService:
     """Service for splitting datasets."""
 
-    def __init__(self):
-        """Initialize split service."""
-        pass
+    # Column holding the split name in lazily assigned frames
+    SPLIT_COLUMN = "__split__"
+
+    # Column holding original row positions in split index files
+    INDEX_COLUMN = "row_index"
+
+    # Random number generators that can produce the shuffle permutation.
+    # "polars" and "numpy" build it as one native array; "python" reproduces
+    # splits made before the vectorized backends existed.
+    RNG_BACKENDS = ("polars", "numpy", "python")
+
+    # Multipliers of the MurmurHash3 64-bit finalizer used for integer split keys
+    _FMIX64_MULTIPLIERS = (0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53)
+
+    def __init__(self, rng_backend: str = "polars"):
+        """Initialize split service.
+
+        Args:
+            rng_backend: Generator for shuffled indices (polars, numpy, python).
+                A given seed gives reproducible splits within one backend, but
+                different backends give different splits.
+        """
+        if rng_backend not in self.RNG_BACKENDS:
+            raise ValueError(f"Unknown RNG backend: {rng_backend}. Supported: {', '.join(self.RNG_BACKENDS)}")
+        self.rng_backend = rng_backend
 
     def split(
         self,
@@ -19,6 +44,7 @@ class SplitService:
         ratios: list[float] | None = None,
         seed: int | None = None,
         stratify_column: str | None = None,
+        key_column: str | None = None,
     ) -> dict[str, pl.DataFrame]:
         """Split DataFrame into train/val/test sets.
 
@@ -27,10 +53,38 @@ class SplitService:
             ratios: Split ratios [train, val, test]
             seed: Random seed for reproducibility
             stratify_column: Column to stratify on
+            key_column: Assign rows by a stable hash of this column instead of
+                shuffling (see assign_splits)
 
         Returns:
             Dict with 'train', 'val', 'test' keys
         """
+        indices = self.split_indices(df, ratios=ratios, seed=seed, stratify_column=stratify_column, key_column=key_column)
+        return {name: df[split_indices] for name, split_indices in indices.items()}
+
+    def split_indices(
+        self,
+        df: pl.DataFrame,
+        ratios: list[float] | None = None,
+        seed: int | None = None,
+        stratify_column: str | None = None,
+        key_column: str | None = None,
+    ) -> dict[str, pl.Series]:
+        """Compute which original rows go to each split.
+
+        Takes the same arguments as split and returns, per split, the
+        positions of its rows in ``df`` in the order split would emit them.
+
+        Args:
+            df: Polars DataFrame
+            ratios: Split ratios [train, val, test]
+            seed: Random seed for reproducibility
+            stratify_column: Column to stratify on
+            key_column: Assign rows by a stable hash of this column
+
+        Returns:
+            Dict with 'train', 'val', 'test' keys mapping to row index Series
+        """
         if ratios is None:
             ratios = [0.8, 0.1, 0.1]
 
@@ -40,41 +94,169 @@ class SplitService:
         if abs(sum(ratios) - 1.0) > 0.001:
             raise ValueError("Ratios must sum to 1.0")
 
-        # Create shuffled indices
-        indices = list(range(len(df)))
-        if seed is not None:
-            random.seed(seed)
-
-        random.shuffle(indices)
-
-        # Calculate split points
-        n = len(df)
-        train_end = int(n * ratios[0])
-        val_end = train_end + int(n * ratios[1])
-
-        train_indices = indices[:train_end]
-        val_indices = indices[train_end:val_end]
-        test_indices = indices[val_end:]
+        if key_column:
+            if stratify_column:
+                raise ValueError("Cannot combine a split key with stratification")
+            keys = df.lazy().select(key_column).with_row_index(self.INDEX_COLUMN)
+            assigned = self.assign_splits(keys, ratios=ratios, seed=seed, key_column=key_column).collect()
+            train_indices, val_indices, test_indices = (
+                assigned.filter(pl.col(self.SPLIT_COLUMN) == name)[self.INDEX_COLUMN] for name in ("train", "val", "test")
+            )
 
         # Stratified split if needed
-        if stratify_column and stratify_column in df.columns:
+        elif stratify_column and stratify_column in df.columns:
             train_indices, val_indices, test_indices = self._stratified_split(df, stratify_column, ratios, seed)
+        else:
+            indices = self._permutation(len(df), seed)
+
+            # Calculate split points
+            n = len(df)
+            train_end = int(n * ratios[0])
+            val_end = train_end + int(n * ratios[1])
+
+            train_indices = indices[:train_end]
+            val_indices = indices[train_end:val_end]
+            test_indices = indices[val_end:]
 
         return {
-            "train": df[train_indices],
-            "val": df[val_indices],
-            "test": df[test_indices],
+            "train": train_indices,
+            "val": val_indices,
+            "test": test_indices,
         }
 
+    def _permutation(self, n: int, seed: int | None = None) -> pl.Series:
+        """Generate a random permutation of row indices with the configured backend.
+
+        Args:
+            n: Number of rows
+            seed: Random seed
+
+        Returns:
+            Series holding each index in 0..n-1 exactly once
+        """
+        if self.rng_backend == "numpy":
+            import numpy as np
+
+            return pl.Series("index", np.random.default_rng(seed).permutation(n))
+
+        if self.rng_backend == "python":
+            indices = list(range(n))
+            if seed is not None:
+                random.seed(seed)
+            random.shuffle(indices)
+            return pl.Series("index", indices, dtype=pl.Int64)
+
+        dtype = pl.UInt32 if n < 2**32 else pl.UInt64
+        return pl.int_range(0, n, dtype=dtype, eager=True).shuffle(seed=seed)
+
+    def assign_splits(
+        self,
+        lf: pl.LazyFrame,
+        ratios: list[float] | None = None,
+        seed: int | None = None,
+        key_column: str | None = None,
+    ) -> pl.LazyFrame:
+        """Lazily tag each row with its split name.
+
+        Each row is placed by a seeded hash of its row index, so the
+        assignment streams batch by batch and never needs the full table.
+        Split sizes follow the ratios in expectation rather than exactly.
+
+        With a key column, the hash is taken of the key instead and is
+        stable across processes and library versions, so a row keeps its
+        split when the dataset is appended to or rebuilt. The seed then
+        defaults to 0 rather than a random value.
+
+        Args:
+            lf: Polars LazyFrame
+            ratios: Split ratios [train, val, test]
+            seed: Random seed for reproducibility
+            key_column: Column identifying each row across builds
+
+        Returns:
+            LazyFrame with an added SPLIT_COLUMN
+        """
+        if ratios is None:
+            ratios = [0.8, 0.1, 0.1]
+
+        if len(ratios) != 3:
+            raise ValueError("Must provide exactly 3 ratios (train, val, test)")
+
+        if abs(sum(ratios) - 1.0) > 0.001:
+            raise ValueError("Ratios must sum to 1.0")
+
+        if key_column:
+            key_hash = self._key_hash(key_column, lf.collect_schema()[key_column], seed or 0)
+            return lf.with_columns(self._split_expr(key_hash, ratios).alias(self.SPLIT_COLUMN))
+
+        if seed is None:
+            seed = random.getrandbits(32)
+
+        row_index = "__row_index__"
+        split_expr = self._split_expr(pl.col(row_index).hash(seed), ratios)
+
+        return lf.with_row_index(row_index).with_columns(split_expr.alias(self.SPLIT_COLUMN)).drop(row_index)
+
+    def _split_expr(self, row_hash: pl.Expr, ratios: list[float]) -> pl.Expr:
+        """Map a uniform 64-bit hash to a split name by the cumulative ratios."""
+        fraction = row_hash.cast(pl.Float64) / 2.0**64
+        return (
+            pl.when(fraction < ratios[0])
+            .then(pl.lit("train"))
+            .when(fraction < ratios[0] + ratios[1])
+            .then(pl.lit("val"))
+            .otherwise(pl.lit("test"))
+        )
+
+    def _key_hash(self, key_column: str, dtype: pl.DataType, seed: int) -> pl.Expr:
+        """Stable 64-bit hash of a key column.
+
+        Polars' own hash may change between releases, so integer keys go
+        through the MurmurHash3 finalizer written out as column arithmetic,
+        and other keys through xxHash3 of their UTF-8 text. Null keys all
+        hash alike and land in the same split.
+
+        Args:
+            key_column: Column to hash
+            dtype: Data type of the column
+            seed: Hash seed
+
+        Returns:
+            UInt64 expression
+        """
+        key = pl.col(key_column)
+
+        if dtype.is_integer():
+            # Reinterpret the two's complement bits so negative ids hash too
+            value = key.cast(pl.Int64).reinterpret(signed=False).fill_null(0) ^ pl.lit(seed, dtype=pl.UInt64)
+            for multiplier in self._FMIX64_MULTIPLIERS:
+                value = (value ^ (value // 2**33)) * pl.lit(multiplier, dtype=pl.UInt64)
+            return value ^ (value // 2**33)
+
+        import xxhash
+
+        def _xxh3(values: pl.Series) -> pl.Series:
+            return pl.Series(
+                [xxhash.xxh3_64_intdigest(value.encode(), seed) for value in values.fill_null("").to_list()],
+                dtype=pl.UInt64,
+            )
+
+        return key.cast(pl.String).map_batches(_xxh3, return_dtype=pl.UInt64, is_elementwise=True)
+
     def _stratified_split(
         self,
         df: pl.DataFrame,
         stratify_column: str,
         ratios: list[float],
         seed: int | None = None,
-    ) -> tuple[list[int], list[int], list[int]]:
+    ) -> tuple[pl.Series, pl.Series, pl.Series]:
         """Perform stratified split preserving label distribution.
 
+        Every row gets a seeded random key and is ranked by it within its
+        label group; the rank against the group's cumulative ratio thresholds
+        picks the split. This is one multi-threaded window pass in Polars, so
+        it scales linearly with rows regardless of the number of labels.
+
         Args:
             df: Polars DataFrame
             stratify_column: Column to stratify on
@@ -84,30 +266,31 @@ class SplitService:
         Returns:
             Tuple of (train_indices, val_indices, test_indices)
         """
-        if seed is not None:
-            random.seed(seed)
-
-        train_indices = []
-        val_indices = []
-        test_indices = []
-
-        # Get unique labels and their indices
-        labels = df[stratify_column].to_list()
-        unique_labels = list(set(labels))
-
-        for label in unique_labels:
-            # Get indices for this label
-            label_indices = [i for i, lab in enumerate(labels) if lab == label]
-            n = len(label_indices)
-            train_end = int(n * ratios[0])
-            val_end = train_end + int(n * ratios[1])
-
-            random.shuffle(label_indices)
-
-            train_indices.extend(label_indices[:train_end])
-            val_indices.extend(label_indices[train_end:val_end])
-            test_indices.extend(label_indices[val_end:])
-
+        group_size = pl.len().over(stratify_column)
+        position = pl.col("__key__").rank("ordinal").over(stratify_column) - 1
+        train_end = (group_size * ratios[0]).floor()
+        val_end = train_end + (group_size * ratios[1]).floor()
+
+        assigned = (
+            df.select(pl.col(stratify_column))
+            .with_row_index("__row__")
+            .with_columns(self._permutation(len(df), seed).alias("__key__"))
+            .select(
+                pl.col("__row__"),
+                pl.col("__key__"),
+                pl.when(position < train_end)
+                .then(pl.lit("train"))
+                .when(position < val_end)
+                .then(pl.lit("val"))
+                .otherwise(pl.lit("test"))
+                .alias(self.SPLIT_COLUMN),
+            )
+            .sort("__key__")
+        )
+
+        train_indices, val_indices, test_indices = (
+            assigned.filter(pl.col(self.SPLIT_COLUMN) == name)["__row__"] for name in ("train", "val", "test")
+        )
         return train_indices, val_indices, test_indices
 
     def save_splits(
@@ -121,7 +304,7 @@ class SplitService:
         Args:
             splits: Dict of split name to DataFrame
             output_dir: Output directory
-            format: Output format (csv, parquet, jsonl)
+            format: Output format (csv, parquet, jsonl, arrow)
 
         Returns:
             Dict mapping split name to output path
@@ -132,43 +315,260 @@ class SplitService:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         for split_name, df in splits.items():
+            # A full write replaces any parts added by append_splits
+            for part in self.find_split_files(output_dir, split_name, format)[1:]:
+                part.unlink()
+
+            output_path = output_dir / f"{split_name}.{format}"
+            output_paths[split_name] = self._write_split(df, output_path, format)
+
+        return output_paths
+
+    def sink_splits(
+        self,
+        lf: pl.LazyFrame,
+        output_dir: Path,
+        format: str = "parquet",
+        ratios: list[float] | None = None,
+        seed: int | None = None,
+        key_column: str | None = None,
+        normalize: NormalizeService | None = None,
+        with_indices: bool = False,
+    ) -> dict[str, Path]:
+        """Assign and write splits without materializing them.
+
+        The split column is computed lazily by assign_splits and each split
+        is a filter over it; all three are sunk in one streaming query, so
+        peak memory is bounded by the batch size rather than the dataset.
+        With ``with_indices``, Parquet index files like those of
+        save_split_indices are written in the same pass.
+
+        Args:
+            lf: Polars LazyFrame
+            output_dir: Output directory
+            format: Output format (csv, parquet, jsonl, arrow)
+            ratios: Split ratios [train, val, test]
+            seed: Random seed for reproducibility
+            key_column: Column identifying each row across builds
+            normalize: Service whose row-group and memory settings are used for writing
+            with_indices: Also write ``<split>_indices.parquet`` files
+
+        Returns:
+            Dict mapping split name to output path
+        """
+        normalize = normalize or NormalizeService()
+        if with_indices:
+            lf = lf.with_row_index(self.INDEX_COLUMN)
+        assigned = self.assign_splits(lf, ratios=ratios, seed=seed, key_column=key_column)
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        frames = {}
+        index_frames = {}
+        output_paths = {}
+        for split_name in ("train", "val", "test"):
+            for part in self.find_split_files(output_dir, split_name, format)[1:]:
+                part.unlink()
+
+            split_lf = assigned.filter(pl.col(self.SPLIT_COLUMN) == split_name).drop(self.SPLIT_COLUMN)
             output_path = output_dir / f"{split_name}.{format}"
             output_paths[split_name] = output_path
 
-            if format == "csv":
-                df.write_csv(output_path)
-            elif format == "parquet":
-                df.write_parquet(output_path)
-            elif format == "jsonl":
-                df.write_ndjson(output_path)
+            if with_indices:
+                index_frames[output_dir / f"{split_name}_indices.parquet"] = split_lf.select(self.INDEX_COLUMN)
+                split_lf = split_lf.drop(self.INDEX_COLUMN)
+            frames[output_path] = split_lf
+
+        if index_frames and format == "parquet":
+            normalize.sink_many(frames | index_frames, format)
+        else:
+            normalize.sink_many(frames, format)
+            if index_frames:
+                normalize.sink_many(index_frames, "parquet")
 
         return output_paths
 
+    def append_splits(
+        self,
+        df: pl.DataFrame,
+        output_dir: Path,
+        key_column: str,
+        ratios: list[float] | None = None,
+        seed: int | None = None,
+        format: str = "parquet",
+    ) -> dict[str, Path]:
+        """Write only rows whose key is not yet in any split file.
+
+        Rows are assigned with the stable key hash of assign_splits, so
+        existing rows would land in the same splits anyway. New rows are
+        written as an extra part file per split (``train-00001.parquet``)
+        and existing files are left untouched.
+
+        Args:
+            df: Polars DataFrame with existing and new rows
+            output_dir: Directory holding the split files
+            key_column: Column identifying each row across builds
+            ratios: Split ratios [train, val, test]
+            seed: Hash seed; must match the one used for the existing splits
+            format: Output format (csv, parquet, jsonl, arrow)
+
+        Returns:
+            Dict mapping split name to the newly written file, for splits that got new rows
+        """
+        existing = {name: self.find_split_files(output_dir, name, format) for name in ("train", "val", "test")}
+        existing_files = [f for files in existing.values() for f in files]
+
+        if existing_files:
+            normalize = NormalizeService()
+            known_keys = pl.concat([normalize.scan_data(f).select(key_column) for f in existing_files]).unique()
+            df = df.lazy().join(known_keys, on=key_column, how="anti").collect()
+
+        splits = self.split(df, ratios=ratios, seed=seed, key_column=key_column)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        output_paths = {}
+        for split_name, split_df in splits.items():
+            parts = existing[split_name]
+            if parts and split_df.is_empty():
+                continue
+            file_name = f"{split_name}-{len(parts):05d}.{format}" if parts else f"{split_name}.{format}"
+            output_paths[split_name] = self._write_split(split_df, output_dir / file_name, format)
+
+        return output_paths
+
+    def find_split_files(self, output_dir: Path, split_name: str, format: str) -> list[Path]:
+        """List the files of one split, including parts added by append_splits.
+
+        Args:
+            output_dir: Directory holding the split files
+            split_name: Split name (train, val, test)
+            format: File format
+
+        Returns:
+            Sorted list of split file paths
+        """
+        base_file = output_dir / f"{split_name}.{format}"
+        parts = sorted(output_dir.glob(f"{split_name}-[0-9]*.{format}"))
+        return ([base_file] if base_file.exists() else []) + parts
+
+    def check_leakage(
+        self,
+        output_dir: Path,
+        format: str,
+        columns: list[str] | None = None,
+        split_names: tuple[str, ...] = ("train", "val", "test"),
+    ) -> LeakageReport:
+        """Verify that saved splits are disjoint in content.
+
+        Split files are scanned lazily and every row is fingerprinted by
+        hashing, so identical rows that landed in two splits (for example
+        duplicates in the source) are counted without loading any split.
+
+        Args:
+            output_dir: Directory holding the split files
+            format: File format of the splits
+            columns: Columns that define a row's content, e.g. the features only (None for all)
+            split_names: Splits to compare; missing ones are ignored
+
+        Returns:
+            LeakageReport with shared row counts per pair of splits
+        """
+        normalize = NormalizeService()
+        splits = {}
+        for name in split_names:
+            files = self.find_split_files(output_dir, name, format)
+            if files:
+                splits[name] = normalize.scan_dataset(files)
+
+        return DuplicateService().find_leakage(splits, columns)
+
+    def _write_split(self, df: pl.DataFrame, output_path: Path, format: str) -> Path:
+        """Write one split DataFrame in the given format."""
+        if format == "csv":
+            df.write_csv(output_path)
+        elif format == "parquet":
+            df.write_parquet(output_path)
+        elif format == "jsonl":
+            df.write_ndjson(output_path)
+        elif format == "arrow":
+            # Uncompressed so the split can be memory-mapped by loaders
+            df.write_ipc(output_path, compression="uncompressed")
+
+        return output_path
+
     def save_split_indices(
         self,
-        splits: dict[str, pl.DataFrame],
+        indices: dict[str, pl.Series],
         output_dir: Path,
+        format: str = "parquet",
         base_indices: list[int] | None = None,
     ) -> dict[str, Path]:
         """Save split assignments as index files.
 
+        Each file holds the sorted original row positions of one split as
+        UInt32 (UInt64 for tables past 2**32 rows), so a split can be
+        rebuilt from the single normalized artifact with load_split.
+
         Args:
-            splits: Dict of split name to DataFrame
+            indices: Dict of split name to row indices, as returned by split_indices
             output_dir: Output directory
+            format: Index file format (parquet, npy, csv)
             base_indices: Base indices if using non-contiguous indexing
 
         Returns:
             Dict mapping split name to output path
         """
         output_paths = {}
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        for split_name, df in splits.items():
-            output_path = output_dir / f"{split_name}_indices.csv"
+        for split_name, split_indices in indices.items():
+            output_path = output_dir / f"{split_name}_indices.{format}"
             output_paths[split_name] = output_path
 
-            # Create index file with actual indices
-            indices = list(range(len(df)))
-            index_df = pl.DataFrame({"row_index": indices, "split": [split_name] * len(indices)})
-            index_df.write_csv(output_path)
+            row_ids = split_indices if base_indices is None else pl.Series(base_indices)[split_indices]
+            dtype = pl.UInt32 if (row_ids.max() or 0) < 2**32 else pl.UInt64
+            row_ids = row_ids.cast(dtype).sort().alias(self.INDEX_COLUMN)
+
+            if format == "parquet":
+                row_ids.to_frame().write_parquet(output_path)
+            elif format == "npy":
+                import numpy as np
+
+                np.save(output_path, row_ids.to_numpy())
+            elif format == "csv":
+                row_ids.to_frame().write_csv(output_path)
+            else:
+                raise ValueError(f"Unsupported index format: {format}")
 
         return output_paths
+
+    def load_split(self, data_path: Path, index_path: Path) -> pl.DataFrame:
+        """Rebuild one split from the normalized artifact and its index file.
+
+        ``.npy`` index files are memory-mapped, and the artifact is scanned
+        lazily so only the selected rows are kept.
+
+        Args:
+            data_path: Normalized data file the indices refer to
+            index_path: Index file written by save_split_indices
+
+        Returns:
+            Polars DataFrame with the split's rows in original order
+        """
+        normalize = NormalizeService()
+
+        if index_path.suffix == ".npy":
+            import numpy as np
+
+            row_ids = pl.Series(self.INDEX_COLUMN, np.load(index_path, mmap_mode="r"))
+        else:
+            row_ids = normalize.read_data(index_path)[self.INDEX_COLUMN]
+
+        row_index = "__row_index__"
+        return (
+            normalize.scan_data(data_path)
+            .with_row_index(row_index)
+            .filter(pl.col(row_index).is_in(row_ids.cast(pl.get_index_type()).implode()))
+            .drop(row_index)
+            .collect(engine="streaming")
+        )
@@ -1,11 +1,22 @@
 """Validation service for quality checks."""
 
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+from mldata.core.cache import ValidationCache
+from mldata.core.dedup import (
+    IMAGE_HASH_METHODS,
+    DuplicateService,
+    ImageDuplicateReport,
+    ImageDuplicateService,
+    perceptual_hash,
+)
+
 
 @dataclass
 class FileCheckResult:
@@ -31,9 +42,92 @@ class FileIntegrityService:
     # Supported audio formats
     AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg", ".m4a", ".aac"}
 
-    def __init__(self):
-        """Initialize file integrity service."""
-        pass
+    # Pools that run_checks can spread work over
+    EXECUTORS = ("process", "thread")
+
+    # Validation depth: "header" parses containers only, "sample" fully decodes
+    # a fraction of the files, "full" decodes every file
+    LEVELS = ("header", "sample", "full")
+
+    # Bytes every complete file of these formats ends with
+    TRAILERS = {".jpg": b"\xff\xd9", ".jpeg": b"\xff\xd9", ".png": b"IEND\xaeB`\x82"}
+
+    def __init__(
+        self,
+        hash_method: str | None = "dhash",
+        workers: int | None = None,
+        executor: str = "process",
+        chunk_size: int = 64,
+        level: str = "full",
+        decode_fraction: float = 0.1,
+        cache: ValidationCache | None = None,
+    ):
+        """Initialize file integrity service.
+
+        Args:
+            hash_method: Perceptual hash computed while decoding images (dhash, phash),
+                or None to skip hashing
+            workers: Parallel workers for run_checks. Defaults to CPU count.
+            executor: "process" decodes in worker processes, free of the GIL;
+                "thread" overlaps decoding in threads of this process
+            chunk_size: Files sent to a worker per task
+            level: Validation depth (header, sample, full)
+            decode_fraction: Fraction of files fully decoded at the "sample" level
+            cache: Persistent result cache; unchanged files are not validated again
+        """
+        import os
+
+        if hash_method is not None and hash_method not in IMAGE_HASH_METHODS:
+            raise ValueError(f"Unknown image hash method: {hash_method}. Supported: {', '.join(IMAGE_HASH_METHODS)}")
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}. Supported: {', '.join(self.EXECUTORS)}")
+        if level not in self.LEVELS:
+            raise ValueError(f"Unknown validation level: {level}. Supported: {', '.join(self.LEVELS)}")
+
+        self.hash_method = hash_method
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.level = level
+        self.decode_fraction = decode_fraction
+        self.cache = cache
+
+    def should_decode(self, path: Path) -> bool:
+        """Whether a file is fully decoded at the configured level.
+
+        At the "sample" level the choice is a hash of the path, so the same
+        files are decoded on every run and in every worker.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            True if the file's content is decoded, False if only its header is parsed
+        """
+        import zlib
+
+        if self.level == "full":
+            return True
+        if self.level == "header":
+            return False
+        return zlib.crc32(str(path).encode("utf-8")) < self.decode_fraction * 2**32
+
+    def _check_trailer(self, path: Path) -> str | None:
+        """Cheap truncation check: the error if a JPEG/PNG file lacks its end marker."""
+        trailer = self.TRAILERS.get(path.suffix.lower())
+        if trailer is None:
+            return None
+
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - 64))
+            tail = f.read()
+
+        # JPEG writers may pad after the end-of-image marker
+        if trailer not in tail.rstrip(b"\x00"):
+            return "File is truncated (missing end marker)"
+        return None
 
     def detect_file_type(self, path: Path) -> str:
         """Detect the type of a file.
@@ -50,7 +144,7 @@ class FileIntegrityService:
             return "image"
         elif suffix in self.AUDIO_EXTENSIONS:
             return "audio"
-        elif suffix in {".csv", ".parquet", ".json", ".jsonl", ".arrow"}:
+        elif suffix in {".csv", ".parquet", ".json", ".jsonl", ".arrow", ".arff"}:
             return "tabular"
         else:
             return "unknown"
@@ -81,19 +175,33 @@ class FileIntegrityService:
                         details={"width": width, "height": height},
                     )
 
-                # Try to load the image data
-                img.load()
+                details = {
+                    "width": width,
+                    "height": height,
+                    "format": format_name,
+                    "mode": img.mode,
+                }
+
+                if self.should_decode(path):
+                    # Try to load the image data
+                    img.load()
+                    details["level"] = "full"
+
+                    # Hash the pixels already decoded for validation
+                    if self.hash_method:
+                        details["perceptual_hash"] = f"{perceptual_hash(img, self.hash_method):016x}"
+                else:
+                    # Header only: the container parsed, so check the file is complete
+                    details["level"] = "header"
+                    error = self._check_trailer(path)
+                    if error:
+                        return FileCheckResult(path=path, file_type="image", is_valid=False, error=error, details=details)
 
                 return FileCheckResult(
                     path=path,
                     file_type="image",
                     is_valid=True,
-                    details={
-                        "width": width,
-                        "height": height,
-                        "format": format_name,
-                        "mode": img.mode,
-                    },
+                    details=details,
                 )
 
         except Exception as e:
@@ -122,8 +230,10 @@ class FileIntegrityService:
             sample_rate = info.samplerate
             channels = info.channels
 
-            # Verify we can read the file
-            signal, sr = audiofile.read(path, duration=0.1)  # Read 100ms sample
+            # Verify we can decode the whole stream; the header level stops at the info
+            decode = self.should_decode(path)
+            if decode:
+                signal, sr = audiofile.read(path)
 
             return FileCheckResult(
                 path=path,
@@ -133,6 +243,7 @@ class FileIntegrityService:
                     "duration": duration,
                     "sample_rate": sample_rate,
                     "channels": channels,
+                    "level": "full" if decode else "header",
                 },
             )
 
@@ -189,17 +300,17 @@ class FileIntegrityService:
     ) -> list[FileCheckResult]:
         """Run file integrity checks on multiple files.
 
+        Files are validated in parallel on the configured pool of workers.
+
         Args:
             paths: List of file paths to check
             sample_percent: Percentage of files to check (for large datasets)
 
         Returns:
-            List of FileCheckResult objects
+            List of FileCheckResult objects, in the order of paths
         """
         import math
 
-        results = []
-
         # If sampling, select files
         if sample_percent < 100.0:
             sample_count = max(1, math.ceil(len(paths) * sample_percent / 100))
@@ -207,48 +318,430 @@ class FileIntegrityService:
 
             paths = random.sample(paths, min(sample_count, len(paths)))
 
-        for path in paths:
-            result = self.validate_file(path)
-            results.append(result)
+        results: list[FileCheckResult | None] = [None] * len(paths)
+        for index, result in self._iter_indexed(paths):
+            results[index] = result
 
         return results
 
+    def iter_checks(self, paths: list[Path]) -> Iterator[FileCheckResult]:
+        """Validate files in parallel, yielding results as they complete.
+
+        Args:
+            paths: List of file paths to check
+
+        Yields:
+            FileCheckResult for each file, in completion order
+        """
+        for _, result in self._iter_indexed(paths):
+            yield result
+
+    def _options(self) -> dict[str, Any]:
+        """Settings that affect a file's result, passed to workers and hashed into cache keys."""
+        return {"hash_method": self.hash_method, "level": self.level, "decode_fraction": self.decode_fraction}
+
+    def _iter_indexed(self, paths: list[Path]) -> Iterator[tuple[int, FileCheckResult]]:
+        """Yield (position, result) pairs, serving unchanged files from the cache."""
+        if self.cache is None:
+            yield from self._iter_validated(paths)
+            return
+
+        from dataclasses import replace
+
+        options = self._options()
+        misses = []
+        for index, path in enumerate(paths):
+            key = self.cache.key([path], options) if path.exists() else None
+            cached = self.cache.get(key) if key else None
+            if cached is not None:
+                yield index, replace(cached, path=path)
+            else:
+                misses.append((index, key))
+
+        for miss_index, result in self._iter_validated([paths[index] for index, _ in misses]):
+            index, key = misses[miss_index]
+            if key:
+                self.cache.set(key, result)
+            yield index, result
+
+    def _iter_validated(self, paths: list[Path]) -> Iterator[tuple[int, FileCheckResult]]:
+        """Validate files in chunks on a worker pool, yielding (position, result) pairs.
+
+        Chunks are submitted lazily with at most two per worker in flight, so
+        memory stays bounded however many files there are.
+        """
+        if self.workers <= 1 or len(paths) <= 1:
+            for index, path in enumerate(paths):
+                yield index, self.validate_file(path)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+        pool_class = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        options = self._options()
+        chunk_size = max(1, min(self.chunk_size, -(-len(paths) // self.workers)))
+
+        with pool_class(max_workers=self.workers) as pool:
+            pending = {}
+            for start in range(0, len(paths), chunk_size):
+                if len(pending) >= 2 * self.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        first = pending.pop(future)
+                        yield from enumerate(future.result(), start=first)
+
+                chunk = paths[start : start + chunk_size]
+                pending[pool.submit(_validate_chunk, chunk, options)] = start
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    first = pending.pop(future)
+                    yield from enumerate(future.result(), start=first)
+
+    def find_near_duplicate_images(
+        self,
+        results: list[FileCheckResult],
+        max_distance: int = 6,
+    ) -> ImageDuplicateReport:
+        """Find near-duplicate images among validated files.
+
+        Args:
+            results: Results of run_checks, carrying perceptual hashes for valid images
+            max_distance: Maximum Hamming distance between two near-duplicate hashes
+
+        Returns:
+            ImageDuplicateReport, including pairs that cross train/val/test splits
+        """
+        hashes = {
+            result.path: int(result.details["perceptual_hash"], 16)
+            for result in results
+            if result.is_valid and "perceptual_hash" in result.details
+        }
+        return ImageDuplicateService(max_distance=max_distance).find_near_duplicates(hashes)
+
+
+def _validate_chunk(paths: list[Path], options: dict[str, Any]) -> list[FileCheckResult]:
+    """Validate a chunk of files (runs in a worker process or thread)."""
+    service = FileIntegrityService(workers=1, **options)
+    return [service.validate_file(path) for path in paths]
+
+
+@dataclass
+class ValidationRun:
+    """Results of a fused validation pass."""
+
+    results: dict[str, dict[str, Any]]
+    timings_ms: dict[str, float]  # "scan" for the fused query, then one entry per check
+    num_rows: int = 0
+    cached: bool = False  # Results were served from the validation cache
+
 
 class ValidateService:
     """Service for validating dataset quality."""
 
-    def __init__(self):
-        """Initialize validation service."""
-        pass
+    # Checks the fused engine can evaluate, in report order
+    CHECKS = ("duplicates", "labels", "missing", "schema")
+
+    # Upper bound on row blocks read by run_sampled_checks
+    MAX_SAMPLE_BLOCKS = 64
+
+    def __init__(self, memory_budget_mb: int | None = None, cache: ValidationCache | None = None):
+        """Initialize validation service.
+
+        Args:
+            memory_budget_mb: Memory cap for duplicate detection; when set, duplicates
+                are found by the out-of-core DuplicateService instead of the fused scan
+            cache: Persistent result cache, used when run_checks is told the source files
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.cache = cache
+
+    def run_checks(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        checks: list[str] | None = None,
+        label_column: str = "label",
+        max_missing_ratio: float = 0.05,
+        imbalance_threshold: float = 0.1,
+        duplicate_columns: list[str] | None = None,
+        source_files: list[Path] | None = None,
+    ) -> ValidationRun:
+        """Run several checks in a single pass over the data.
+
+        The aggregates every enabled check needs (row count, distinct rows,
+        per-column null counts, label counts) are compiled into one Polars
+        select and evaluated in a single multi-threaded query. Each check
+        then only interprets its part of the one-row result; schema checks
+        read the schema and touch no data at all.
+
+        Args:
+            df: Polars DataFrame, or LazyFrame to check with the streaming engine
+            checks: Checks to run (default: all of CHECKS)
+            label_column: Column containing labels
+            max_missing_ratio: Maximum acceptable missing ratio per column
+            imbalance_threshold: Threshold for imbalance warning
+            duplicate_columns: Columns that define a duplicate row (None for all)
+            source_files: Files df was read from; with a cache configured, results
+                are reused without touching the data while these files are unchanged
+
+        Returns:
+            ValidationRun with per-check results and timings in milliseconds
+        """
+        checks = list(checks) if checks is not None else list(self.CHECKS)
+        unknown = [name for name in checks if name not in self.CHECKS]
+        if unknown:
+            raise ValueError(f"Unknown checks: {', '.join(unknown)}. Supported: {', '.join(self.CHECKS)}")
+
+        cache_key = None
+        if self.cache is not None and source_files:
+            config = {
+                "checks": sorted(checks),
+                "label_column": label_column,
+                "max_missing_ratio": max_missing_ratio,
+                "imbalance_threshold": imbalance_threshold,
+                "duplicate_columns": duplicate_columns,
+            }
+            cache_key = self.cache.key(source_files, config)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return ValidationRun(
+                    results=cached["results"],
+                    timings_ms={"scan": 0.0, **{name: 0.0 for name in checks}},
+                    num_rows=cached["num_rows"],
+                    cached=True,
+                )
+
+        lf = df.lazy()
+        schema = lf.collect_schema()
+        columns = schema.names()
+        has_labels = label_column in schema
+
+        exprs = [pl.len().alias("__rows__")]
+        if "duplicates" in checks and self.memory_budget_mb is None:
+            exprs.append(pl.struct(duplicate_columns or columns).n_unique().alias("__unique_rows__"))
+        if "missing" in checks:
+            exprs.extend(pl.col(name).null_count().alias(f"__nulls_{index}__") for index, name in enumerate(columns))
+        if "labels" in checks and has_labels:
+            exprs.append(pl.col(label_column).value_counts().implode().alias("__labels__"))
+
+        timings = {}
+        start = time.perf_counter()
+        row = lf.select(exprs).collect(engine="streaming").row(0, named=True)
+        timings["scan"] = (time.perf_counter() - start) * 1000
+
+        total_rows = row["__rows__"]
+        results = {}
+        for name in checks:
+            start = time.perf_counter()
+            if name == "duplicates" and self.memory_budget_mb is not None:
+                report = DuplicateService(self.memory_budget_mb).find_duplicates(lf, duplicate_columns)
+                results[name] = self._duplicates_result(report.total_rows, report.unique_rows)
+            elif name == "duplicates":
+                results[name] = self._duplicates_result(total_rows, row["__unique_rows__"])
+            elif name == "labels":
+                label_counts = [(item[label_column], item["count"]) for item in row["__labels__"]] if has_labels else None
+                results[name] = self._label_result(label_column, label_counts, imbalance_threshold)
+            elif name == "missing":
+                null_counts = {column: row[f"__nulls_{index}__"] for index, column in enumerate(columns)}
+                results[name] = self._missing_result(total_rows, null_counts, max_missing_ratio)
+            elif name == "schema":
+                results[name] = self._schema_result(schema)
+            timings[name] = (time.perf_counter() - start) * 1000
+
+        if cache_key is not None:
+            self.cache.set(cache_key, {"results": results, "num_rows": total_rows})
+
+        return ValidationRun(results=results, timings_ms=timings, num_rows=total_rows)
+
+    def run_sampled_checks(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        sample_percent: float,
+        checks: list[str] | None = None,
+        label_column: str = "label",
+        max_missing_ratio: float = 0.05,
+        imbalance_threshold: float = 0.1,
+        seed: int = 0,
+        block_rows: int = 1000,
+        confidence: float = 0.95,
+        duplicate_sampling: str = "blocks",
+    ) -> ValidationRun:
+        """Run checks on a random sample of row blocks and estimate table-wide ratios.
+
+        The sample is a set of randomly placed contiguous blocks, each read
+        with a lazy slice, so Parquet scans only decode the row groups
+        they touch. Checks run on the sample as usual; duplicate and missing
+        ratios also get confidence intervals from the between-block
+        variance (a cluster-sample ratio estimator).
+
+        Block samples only see duplicates whose copies fall in the sample,
+        so their duplicate ratio is a lower bound when copies lie far apart.
+        With duplicate_sampling="hash" rows are instead sampled by content
+        hash, so every copy of a sampled row is included; this gives an
+        unbiased table-wide estimate but streams over every row.
+
+        Args:
+            df: Polars DataFrame or LazyFrame
+            sample_percent: Share of rows to sample, in percent
+            checks: Checks to run (default: all of CHECKS)
+            label_column: Column containing labels
+            max_missing_ratio: Maximum acceptable missing ratio per column
+            imbalance_threshold: Threshold for imbalance warning
+            seed: Seed for block placement
+            block_rows: Rows per sampled block
+            confidence: Confidence level of the intervals
+            duplicate_sampling: How duplicates are estimated ("blocks" or "hash")
+
+        Returns:
+            ValidationRun over the sample, with estimates and intervals in its results
+        """
+        if duplicate_sampling not in ("blocks", "hash"):
+            raise ValueError(f"Unknown duplicate sampling: {duplicate_sampling}. Supported: blocks, hash")
+
+        import math
+        import random
+        from statistics import NormalDist
+
+        lf = df.lazy()
+        start = time.perf_counter()
+        total_rows = lf.select(pl.len()).collect(engine="streaming").item()
+        target_rows = total_rows * sample_percent / 100
+        # Each block is its own slice of the scan, so large samples use larger blocks
+        block_rows = max(block_rows, math.ceil(target_rows / self.MAX_SAMPLE_BLOCKS))
+        total_blocks = max(1, math.ceil(total_rows / block_rows))
+        sample_blocks = min(total_blocks, max(1, math.ceil(target_rows / block_rows)))
+        offsets = sorted(random.Random(seed).sample(range(total_blocks), sample_blocks))
+
+        sample = pl.concat(
+            [lf.slice(block * block_rows, block_rows).with_columns(pl.lit(block).alias("__block__")) for block in offsets]
+        ).collect()
+        sample_ms = (time.perf_counter() - start) * 1000
+
+        columns = [name for name in sample.columns if name != "__block__"]
+        run = self.run_checks(
+            sample.drop("__block__"),
+            checks,
+            label_column=label_column,
+            max_missing_ratio=max_missing_ratio,
+            imbalance_threshold=imbalance_threshold,
+        )
+        run.timings_ms["sample"] = sample_ms
+
+        # Per-block counts of each row-level indicator, for the interval estimates
+        indicators = [(~pl.struct(columns).is_first_distinct()).alias("__duplicate__")]
+        indicators += [pl.col(name).is_null().alias(f"__null_{index}__") for index, name in enumerate(columns)]
+        blocks = sample.select(pl.col("__block__"), *indicators).group_by("__block__").agg(pl.len().alias("rows"), pl.all().sum())
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        finite_correction = 1 - sample_blocks / total_blocks
+
+        if "duplicates" in run.results:
+            if duplicate_sampling == "hash":
+                ratio, interval = self._hash_sampled_duplicates(lf, columns, sample_percent / 100, total_rows, z)
+            else:
+                ratio, interval = self._block_ratio(blocks, "__duplicate__", z, finite_correction)
+            run.results["duplicates"].update(
+                {
+                    "duplicate_ratio": ratio,
+                    "duplicate_ratio_ci": interval,
+                    "estimated_duplicates": round(ratio * total_rows),
+                    "duplicate_sampling": duplicate_sampling,
+                }
+            )
+            run.results["duplicates"]["passed"] = run.results["duplicates"]["estimated_duplicates"] == 0
+        if "missing" in run.results:
+            estimates = {}
+            for index, name in enumerate(columns):
+                ratio, interval = self._block_ratio(blocks, f"__null_{index}__", z, finite_correction)
+                estimates[name] = {"missing_ratio": ratio, "missing_ratio_ci": interval}
+            run.results["missing"]["estimates"] = estimates
+
+        for result in run.results.values():
+            result.update({"sampled": True, "sample_rows": sample.height, "total_rows": total_rows, "confidence": confidence})
+
+        run.num_rows = total_rows
+        return run
 
-    def check_duplicates(self, df: pl.DataFrame, columns: list[str] | None = None) -> dict[str, Any]:
+    def _hash_sampled_duplicates(
+        self,
+        lf: pl.LazyFrame,
+        columns: list[str],
+        fraction: float,
+        total_rows: int,
+        z: float,
+    ) -> tuple[float, list[float]]:
+        """Duplicate ratio estimated from a sample of distinct rows chosen by content hash.
+
+        Each distinct row is kept with probability fraction together with
+        all its copies, so the duplicates among kept rows, divided by
+        fraction, estimate the table's duplicates without bias; the variance
+        of that sum over independently kept groups is (1 - f) / f^2 * sum((k - 1)^2).
+        """
+        dedup = DuplicateService()
+        hash_columns = list(dedup.HASH_COLUMNS)
+        buckets = 2**32
+        copies = (
+            lf.select(dedup.fingerprint(lf, columns))
+            .filter(pl.col(hash_columns[0]) % buckets < int(fraction * buckets))
+            .group_by(hash_columns)
+            .agg(pl.len().alias("copies"))
+            .select((pl.col("copies") - 1).alias("extra"))
+            .filter(pl.col("extra") > 0)
+            .collect(engine="streaming")["extra"]
+        )
+
+        if total_rows == 0 or fraction <= 0:
+            return 0.0, [0.0, 0.0]
+
+        estimate = copies.sum() / fraction
+        margin = z * ((1 - fraction) / fraction**2 * (copies**2).sum()) ** 0.5
+        ratio = estimate / total_rows
+        return float(ratio), [float(max(0.0, ratio - margin / total_rows)), float(min(1.0, ratio + margin / total_rows))]
+
+    def _block_ratio(self, blocks: pl.DataFrame, column: str, z: float, finite_correction: float) -> tuple[float, list[float]]:
+        """Ratio estimate and confidence interval of an indicator over sampled blocks."""
+        rows = blocks["rows"].to_numpy().astype(float)
+        hits = blocks[column].to_numpy().astype(float)
+        ratio = hits.sum() / rows.sum() if rows.sum() else 0.0
+
+        if len(rows) > 1:
+            mean_rows = rows.mean()
+            variance = ((hits - ratio * rows) ** 2).sum() / (len(rows) - 1) / (len(rows) * mean_rows**2)
+        else:
+            # A single block: fall back to the binomial variance
+            variance = ratio * (1 - ratio) / rows.sum() if rows.sum() else 0.0
+
+        margin = z * (max(0.0, finite_correction) * variance) ** 0.5
+        return float(ratio), [float(max(0.0, ratio - margin)), float(min(1.0, ratio + margin))]
+
+    def check_duplicates(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        columns: list[str] | None = None,
+        return_ids: bool = False,
+    ) -> dict[str, Any]:
         """Check for duplicate rows.
 
         Args:
-            df: Polars DataFrame
+            df: Polars DataFrame, or LazyFrame to check with the streaming engine
             columns: Columns to check (None for all)
+            return_ids: Include the row indices of duplicate rows as "duplicate_ids"
 
         Returns:
             Check result dict
         """
-        if columns is None:
-            columns = df.columns
-
-        # Exact duplicates
-        total_rows = len(df)
-        unique_rows = df.unique(subset=columns).height
-        exact_duplicates = total_rows - unique_rows
+        if return_ids:
+            report = DuplicateService(self.memory_budget_mb).find_duplicates(df, columns, return_ids=True)
+            result = self._duplicates_result(report.total_rows, report.unique_rows)
+            result["duplicate_ids"] = report.duplicate_ids.to_list()
+            return result
 
-        return {
-            "check_name": "duplicates",
-            "passed": exact_duplicates == 0,
-            "exact_duplicates": exact_duplicates,
-            "duplicate_ratio": exact_duplicates / total_rows if total_rows > 0 else 0,
-        }
+        return self.run_checks(df, ["duplicates"], duplicate_columns=columns).results["duplicates"]
 
     def check_label_distribution(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | pl.LazyFrame,
         label_column: str,
         imbalance_threshold: float = 0.1,
     ) -> dict[str, Any]:
@@ -262,15 +755,66 @@ class ValidateService:
         Returns:
             Check result dict
         """
-        if label_column not in df.columns:
+        run = self.run_checks(df, ["labels"], label_column=label_column, imbalance_threshold=imbalance_threshold)
+        return run.results["labels"]
+
+    def check_missing_values(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        max_missing_ratio: float = 0.05,
+    ) -> dict[str, Any]:
+        """Check for missing values.
+
+        Args:
+            df: Polars DataFrame, or LazyFrame to check with the streaming engine
+            max_missing_ratio: Maximum acceptable missing ratio per column
+
+        Returns:
+            Check result dict
+        """
+        return self.run_checks(df, ["missing"], max_missing_ratio=max_missing_ratio).results["missing"]
+
+    def check_schema_consistency(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+    ) -> dict[str, Any]:
+        """Check schema consistency.
+
+        Args:
+            df: Polars DataFrame
+
+        Returns:
+            Check result dict
+        """
+        return self._schema_result(df.lazy().collect_schema())
+
+    def _duplicates_result(self, total_rows: int, unique_rows: int) -> dict[str, Any]:
+        """Build the duplicates result from row counts."""
+        # Exact duplicates
+        exact_duplicates = total_rows - unique_rows
+
+        return {
+            "check_name": "duplicates",
+            "passed": exact_duplicates == 0,
+            "exact_duplicates": exact_duplicates,
+            "duplicate_ratio": exact_duplicates / total_rows if total_rows > 0 else 0,
+        }
+
+    def _label_result(
+        self,
+        label_column: str,
+        label_counts: list[tuple[Any, int]] | None,
+        imbalance_threshold: float,
+    ) -> dict[str, Any]:
+        """Build the label distribution result from per-label counts."""
+        if label_counts is None:
             return {
                 "check_name": "label_distribution",
                 "passed": True,
                 "message": f"Label column '{label_column}' not found",
             }
 
-        label_counts = df.group_by(label_column).agg(pl.len().alias("count"))
-        total = label_counts["count"].sum()
+        total = sum(count for _, count in label_counts)
 
         if total == 0:
             return {
@@ -281,12 +825,11 @@ class ValidateService:
 
         # Calculate distribution
         distribution = {}
-        for row in label_counts.rows():
-            label, count = row
+        for label, count in label_counts:
             distribution[str(label)] = count / total
 
         # Find imbalance ratio
-        counts = label_counts["count"].to_list()
+        counts = [count for _, count in label_counts]
         if counts:
             imbalance = (max(counts) - min(counts)) / total if max(counts) > min(counts) else 0
         else:
@@ -300,25 +843,16 @@ class ValidateService:
             "num_classes": len(counts),
         }
 
-    def check_missing_values(
+    def _missing_result(
         self,
-        df: pl.DataFrame,
-        max_missing_ratio: float = 0.05,
+        total_rows: int,
+        null_counts: dict[str, int],
+        max_missing_ratio: float,
     ) -> dict[str, Any]:
-        """Check for missing values.
-
-        Args:
-            df: Polars DataFrame
-            max_missing_ratio: Maximum acceptable missing ratio per column
-
-        Returns:
-            Check result dict
-        """
-        total_rows = len(df)
+        """Build the missing values result from per-column null counts."""
         issues = []
 
-        for col_name in df.columns:
-            missing_count = df[col_name].null_count()
+        for col_name, missing_count in null_counts.items():
             missing_ratio = missing_count / total_rows if total_rows > 0 else 0
 
             if missing_ratio > max_missing_ratio:
@@ -337,23 +871,12 @@ class ValidateService:
             "total_missing": sum(i["missing_count"] for i in issues),
         }
 
-    def check_schema_consistency(
-        self,
-        df: pl.DataFrame,
-    ) -> dict[str, Any]:
-        """Check schema consistency.
-
-        Args:
-            df: Polars DataFrame
-
-        Returns:
-            Check result dict
-        """
+    def _schema_result(self, schema: pl.Schema) -> dict[str, Any]:
+        """Build the schema consistency result from a schema."""
         # Check for type consistency
         type_issues = []
 
-        for col_name in df.columns:
-            col_dtype = df[col_name].dtype
+        for col_name, col_dtype in schema.items():
             # Check if column has mixed types
             if col_dtype == pl.Object:
                 type_issues.append(
@@ -367,5 +890,5 @@ class ValidateService:
             "check_name": "schema_consistency",
             "passed": len(type_issues) == 0,
             "issues": type_issues,
-            "num_columns": len(df.columns),
+            "num_columns": len(schema),
         }
@@ -35,6 +35,7 @@ class DataFormat(str, Enum):
     JSONL = "jsonl"
     PARQUET = "parquet"
     ARROW = "arrow"
+    ARFF = "arff"
     UNKNOWN = "unknown"
 
 
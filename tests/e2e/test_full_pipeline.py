@@ -65,6 +65,32 @@ class TestBuildPipelineE2E:
             assert val.height == 3  # 15%
             assert test.height == 3  # 15%
 
+    def test_streaming_build_cli(self, sample_data, runner, cli_app):
+        """Test build command in streaming mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "output"
+
+            result = runner.invoke(
+                cli_app,
+                [
+                    "build",
+                    str(sample_data),
+                    "-o",
+                    str(output_path),
+                    "--seed",
+                    "42",
+                    "--streaming",
+                    "--batch-size",
+                    "8",
+                    "--no-cache",
+                ],
+            )
+            assert result.exit_code == 0, result.output
+
+            assert (output_path / "artifacts" / "data.parquet").exists()
+            total = sum(pl.read_parquet(output_path / "splits" / f"{name}.parquet").height for name in ("train", "val", "test"))
+            assert total == 20
+
     def test_split_command_functionality(self, sample_data):
         """Test split command functionality."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -72,6 +98,7 @@ class TestBuildPipelineE2E:
             df = normalize.read_data(sample_data)
 
             split_service = SplitService()
+            indices = split_service.split_indices(df, ratios=[0.7, 0.15, 0.15], seed=42)
             splits = split_service.split(df, ratios=[0.7, 0.15, 0.15], seed=42)
 
             splits_dir = Path(tmpdir) / "splits"
@@ -82,9 +109,11 @@ class TestBuildPipelineE2E:
             assert (splits_dir / "val.csv").exists()
             assert (splits_dir / "test.csv").exists()
 
-            # Also test saving indices
-            split_service.save_split_indices(splits, splits_dir)
-            assert (splits_dir / "train_indices.csv").exists()
+            # Index files rebuild the splits from the original data
+            index_paths = split_service.save_split_indices(indices, splits_dir)
+            assert index_paths["train"] == splits_dir / "train_indices.parquet"
+            rebuilt = split_service.load_split(sample_data, index_paths["train"])
+            assert sorted(rebuilt["id"].to_list()) == sorted(splits["train"]["id"].to_list())
 
     def test_export_all_formats(self, sample_data):
         """Test exporting to all formats."""
@@ -1,10 +1,19 @@
 """Integration tests for data processing pipeline."""
 
+import os
+import random
 import tempfile
 from pathlib import Path
 
 import polars as pl
-
+import pytest
+
+from mldata.checks.base import BaseCheck, CheckResult, CheckStatus, DatasetHandle
+from mldata.checks.duplicates import DuplicateCheck
+from mldata.checks.leakage import LeakageCheck
+from mldata.checks.runner import CheckRunner, discover_checks
+from mldata.core.cache import ValidationCache
+from mldata.core.dedup import DuplicateService, NearDuplicateService
 from mldata.core.export import ExportService
 from mldata.core.manifest import ManifestService
 from mldata.core.normalize import NormalizeService
@@ -58,6 +67,158 @@ class TestNormalizeService:
         assert df.shape == (2, 2)
         path.unlink()
 
+    def test_scan_and_sink(self):
+        """Scan lazily and sink to another format."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "data.csv"
+            output_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).write_csv(input_path)
+
+            service = NormalizeService()
+            lf = service.scan_data(input_path)
+            assert isinstance(lf, pl.LazyFrame)
+
+            service.sink_data(lf, output_path, "parquet")
+            assert pl.read_parquet(output_path).shape == (3, 2)
+
+    def test_convert_format_streaming_row_groups(self):
+        """Stream CSV to Parquet with a fixed row-group size."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "data.csv"
+            output_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"id": list(range(100)), "text": ["row"] * 100}).write_csv(input_path)
+
+            service = NormalizeService(row_group_size=25, memory_budget_mb=1)
+            service.convert_format(input_path, output_path, "parquet")
+
+            assert pl.read_parquet(output_path).height == 100
+            assert pq.ParquetFile(output_path).num_row_groups == 4
+
+    def test_convert_format_json_fallback(self):
+        """Plain JSON converts through the in-memory path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "data.json"
+            output_path = Path(tmpdir) / "data.jsonl"
+            pl.DataFrame({"a": [1, 2, 3]}).write_json(input_path)
+
+            NormalizeService().convert_format(input_path, output_path, "jsonl")
+
+            assert pl.read_ndjson(output_path)["a"].to_list() == [1, 2, 3]
+
+    def test_scan_dataset_unifies_shards(self):
+        """Read sharded data as one table with schema unification."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            raw_dir = Path(tmpdir) / "raw"
+            (raw_dir / "train").mkdir(parents=True)
+            (raw_dir / "test").mkdir()
+            pl.DataFrame({"id": [1, 2], "score": [1, 2]}).write_parquet(raw_dir / "train" / "data.parquet")
+            pl.DataFrame({"id": [3], "score": [0.5], "extra": ["x"]}).write_csv(raw_dir / "test" / "data.csv")
+
+            service = NormalizeService()
+            assert len(service.find_data_files(raw_dir)) == 2
+
+            df = service.read_dataset(raw_dir)
+            assert df.height == 3
+            assert df.schema["score"] == pl.Float64
+            assert df["extra"].null_count() == 2
+
+    def test_convert_arff_to_parquet(self):
+        """Test streaming ARFF conversion with typed nominal columns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            arff_path = Path(tmpdir) / "data.arff"
+            arff_path.write_text(
+                "% OpenML export\n"
+                "@relation iris\n"
+                "@attribute sepallength numeric\n"
+                "@attribute count integer\n"
+                "@attribute 'class' {Iris-setosa,'Iris versicolor'}\n"
+                "@attribute note string\n"
+                "@data\n"
+                "5.1,3,Iris-setosa,'hello, world'\n"
+                "4.9,?,'Iris versicolor',plain\n"
+            )
+
+            service = NormalizeService()
+            output_path = Path(tmpdir) / "data.parquet"
+            service.convert_format(arff_path, output_path, "parquet")
+
+            df = pl.read_parquet(output_path)
+            assert df.columns == ["sepallength", "count", "class", "note"]
+            assert df.schema["count"] == pl.Int64
+            assert df.schema["class"] == pl.Categorical
+            assert df["class"].to_list() == ["Iris-setosa", "Iris versicolor"]
+            assert df["note"].to_list() == ["hello, world", "plain"]
+            assert df["count"].null_count() == 1
+
+    def test_scan_sparse_arff(self):
+        """Test sparse ARFF rows fill omitted attributes with zero."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            arff_path = Path(tmpdir) / "sparse.arff"
+            arff_path.write_text(
+                "@relation sparse\n"
+                "@attribute a numeric\n"
+                "@attribute b numeric\n"
+                "@attribute c {x,y}\n"
+                "@data\n"
+                "{0 1.5, 2 y}\n"
+                "{1 2}\n"
+            )
+
+            df = NormalizeService().scan_data(arff_path).collect()
+            assert df["a"].to_list() == [1.5, 0.0]
+            assert df["b"].to_list() == [0.0, 2.0]
+            assert df["c"].to_list() == ["y", "x"]
+
+    def test_arrow_round_trip(self):
+        """Test Arrow IPC conversion and memory-mapped reads."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "data.csv"
+            pl.DataFrame({"id": [1, 2, 3], "text": ["a", "b", "c"]}).write_csv(csv_path)
+
+            service = NormalizeService()
+            arrow_path = service.convert_format(csv_path, Path(tmpdir) / "data.arrow", "arrow")
+
+            assert service.read_data(arrow_path)["id"].to_list() == [1, 2, 3]
+            assert service.scan_data(arrow_path).select(pl.len()).collect().item() == 3
+
+    def test_intermediate_cache(self):
+        """Test build directories resolve to a fresh intermediate cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            build_dir = Path(tmpdir)
+            (build_dir / "artifacts").mkdir()
+            artifact = build_dir / "artifacts" / "data.parquet"
+            pl.DataFrame({"id": [1, 2]}).write_parquet(artifact)
+
+            service = NormalizeService()
+            cache_file = service.cache_intermediate(artifact, build_dir)
+
+            assert cache_file == build_dir / "intermediate" / "data.arrow"
+            assert service.find_data_files(build_dir) == [cache_file]
+            assert service.read_dataset(build_dir).height == 2
+
+            # A rewritten artifact makes the cache stale
+            pl.DataFrame({"id": [1, 2, 3]}).write_parquet(artifact)
+            os.utime(cache_file, ns=(0, 0))
+            assert service.find_data_files(build_dir) == [artifact]
+
+    def test_find_data_files_build_directory(self):
+        """Build directories resolve to their artifacts, one file per shard."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            build_dir = Path(tmpdir)
+            for sub in ("artifacts", "splits", "raw"):
+                (build_dir / sub).mkdir()
+            df = pl.DataFrame({"a": [1, 2, 3]})
+            df.write_parquet(build_dir / "artifacts" / "data.parquet")
+            df.write_csv(build_dir / "artifacts" / "data.csv")
+            df.write_parquet(build_dir / "splits" / "train.parquet")
+            df.write_csv(build_dir / "raw" / "source.csv")
+
+            files = NormalizeService().find_data_files(build_dir)
+
+            assert files == [build_dir / "artifacts" / "data.parquet"]
+
 
 class TestSplitService:
     """Integration tests for split service."""
@@ -90,6 +251,132 @@ class TestSplitService:
 
         assert splits1["train"]["id"].to_list() == splits2["train"]["id"].to_list()
 
+    @pytest.mark.parametrize("backend", SplitService.RNG_BACKENDS)
+    def test_rng_backends(self, backend):
+        """Test every RNG backend gives a reproducible partition of the rows."""
+        if backend == "numpy":
+            pytest.importorskip("numpy")
+        df = pl.DataFrame({"id": list(range(100))})
+
+        service = SplitService(rng_backend=backend)
+        splits1 = service.split(df, ratios=[0.8, 0.1, 0.1], seed=7)
+        splits2 = service.split(df, ratios=[0.8, 0.1, 0.1], seed=7)
+
+        assert [splits1[name].height for name in ("train", "val", "test")] == [80, 10, 10]
+        assert sorted(pl.concat(splits1.values())["id"].to_list()) == list(range(100))
+        assert splits1["test"]["id"].to_list() == splits2["test"]["id"].to_list()
+
+    @pytest.mark.parametrize("key", ["id", "name"])
+    def test_key_split_stable_under_appends(self, key):
+        """Test keyed rows keep their split when the dataset grows."""
+        df = pl.DataFrame({"id": list(range(200)), "name": [f"row-{i}" for i in range(200)]})
+
+        service = SplitService()
+        before = service.split(df.head(150), ratios=[0.8, 0.1, 0.1], key_column=key)
+        after = service.split(df, ratios=[0.8, 0.1, 0.1], key_column=key)
+
+        for name in ("train", "val", "test"):
+            assert set(before[name]["id"].to_list()) <= set(after[name]["id"].to_list())
+        assert after["train"].height > after["val"].height
+
+    def test_append_splits_writes_only_new_rows(self):
+        """Test incremental keyed splits add part files for unseen keys only."""
+        df = pl.DataFrame({"id": list(range(300))})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            service = SplitService()
+            service.save_splits(service.split(df.head(200), key_column="id"), output_dir, format="parquet")
+
+            written = service.append_splits(df, output_dir, "id", format="parquet")
+            assert written["train"] == output_dir / "train-00001.parquet"
+
+            new_ids = pl.concat([pl.read_parquet(path) for path in written.values()])["id"]
+            assert sorted(new_ids.to_list()) == list(range(200, 300))
+            assert service.append_splits(df, output_dir, "id", format="parquet") == {}
+
+    def test_sink_splits(self):
+        """Test splits are written straight from a lazy scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"id": list(range(500))}).write_parquet(input_path)
+
+            service = SplitService()
+            paths = service.sink_splits(pl.scan_parquet(input_path), Path(tmpdir) / "splits", seed=3)
+
+            ids = pl.concat([pl.read_parquet(paths[name]) for name in ("train", "val", "test")])["id"]
+            assert sorted(ids.to_list()) == list(range(500))
+            assert SplitService.SPLIT_COLUMN not in pl.read_parquet(paths["train"]).columns
+
+    @pytest.mark.parametrize("format", ["parquet", "npy"])
+    def test_split_index_files(self, format):
+        """Test index files hold sorted original row ids that rebuild each split."""
+        if format == "npy":
+            pytest.importorskip("numpy")
+        df = pl.DataFrame({"id": list(range(100, 200))})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "data.parquet"
+            df.write_parquet(data_path)
+
+            service = SplitService()
+            indices = service.split_indices(df, seed=1)
+            paths = service.save_split_indices(indices, Path(tmpdir), format=format)
+
+            for name, path in paths.items():
+                split = service.load_split(data_path, path)
+                assert split["id"].to_list() == sorted(df[indices[name]]["id"].to_list())
+
+            if format == "parquet":
+                stored = pl.read_parquet(paths["val"])
+                assert stored.schema["row_index"] == pl.UInt32
+                assert stored["row_index"].is_sorted()
+
+    def test_sink_splits_with_indices(self):
+        """Test streaming splits write index files in the same pass."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"id": list(range(300))}).write_parquet(data_path)
+
+            service = SplitService()
+            paths = service.sink_splits(pl.scan_parquet(data_path), Path(tmpdir), seed=5, with_indices=True)
+
+            for name, path in paths.items():
+                rebuilt = service.load_split(data_path, Path(tmpdir) / f"{name}_indices.parquet")
+                assert rebuilt["id"].to_list() == pl.read_parquet(path)["id"].to_list()
+
+    def test_check_leakage(self):
+        """Test rows shared between splits are counted per pair."""
+        df = pl.DataFrame(
+            {
+                "id": list(range(100)),
+                "text": [f"row {i % 90}" for i in range(100)],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            splits_dir = Path(tmpdir) / "splits"
+            service = SplitService()
+            splits = {"train": df[:60], "val": df[60:80], "test": df[80:]}
+            service.save_splits(splits, splits_dir, format="parquet")
+
+            # Rows 90-99 repeat the texts of rows 0-9, which sit in train
+            report = service.check_leakage(splits_dir, "parquet", columns=["text"])
+            assert report.split_rows == {"train": 60, "val": 20, "test": 20}
+            assert [pair["shared_rows"] for pair in report.pairs] == [0, 10, 0]
+            assert report.leaked_rows == 10
+
+            assert service.check_leakage(splits_dir, "parquet").leaked_rows == 0
+
+            result = LeakageCheck().run(Path(tmpdir), {"columns": ["text"]})
+            assert result.status == CheckStatus.FAILED
+            assert "train/test: 10" in result.message
+
+    def test_unknown_rng_backend(self):
+        """Test an unknown RNG backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown RNG backend"):
+            SplitService(rng_backend="mt19937")
+
     def test_save_splits(self):
         """Test saving splits to files."""
         df = pl.DataFrame({"id": [1, 2, 3, 4, 5], "label": ["a"] * 5})
@@ -131,6 +418,40 @@ class TestSplitService:
             # Skip if stratified split fails
             pass
 
+    def test_stratified_split_per_label_counts(self):
+        """Test each label is split by its own ratios and the split is reproducible."""
+        df = pl.DataFrame(
+            {
+                "id": list(range(300)),
+                "label": [f"class_{i % 30}" for i in range(300)],
+            }
+        )
+
+        service = SplitService()
+        splits = service.split(df, ratios=[0.8, 0.1, 0.1], seed=42, stratify_column="label")
+        again = service.split(df, ratios=[0.8, 0.1, 0.1], seed=42, stratify_column="label")
+
+        for name, expected in (("train", 8), ("val", 1), ("test", 1)):
+            counts = splits[name]["label"].value_counts()
+            assert counts.height == 30
+            assert counts["count"].to_list() == [expected] * 30
+            assert splits[name]["id"].to_list() == again[name]["id"].to_list()
+
+    def test_assign_splits_lazy(self):
+        """Test lazy split assignment covers every row deterministically."""
+        lf = pl.LazyFrame({"id": list(range(1000))})
+
+        service = SplitService()
+        assigned1 = service.assign_splits(lf, ratios=[0.8, 0.1, 0.1], seed=42).collect()
+        assigned2 = service.assign_splits(lf, ratios=[0.8, 0.1, 0.1], seed=42).collect()
+
+        assert assigned1.height == 1000
+        assert assigned1[SplitService.SPLIT_COLUMN].to_list() == assigned2[SplitService.SPLIT_COLUMN].to_list()
+
+        counts = dict(assigned1[SplitService.SPLIT_COLUMN].value_counts().rows())
+        assert set(counts) == {"train", "val", "test"}
+        assert 700 < counts["train"] < 900
+
 
 class TestValidateService:
     """Integration tests for validation service."""
@@ -150,6 +471,142 @@ class TestValidateService:
         assert result["passed"] is False
         assert result["exact_duplicates"] >= 1
 
+    def test_checks_on_lazyframe(self):
+        """Test duplicate and missing checks on a LazyFrame."""
+        lf = pl.LazyFrame(
+            {
+                "id": [1, 2, 2, None],
+                "text": ["a", "b", "b", "d"],
+            }
+        )
+
+        service = ValidateService()
+        dup_result = service.check_duplicates(lf)
+        missing_result = service.check_missing_values(lf)
+
+        assert dup_result["exact_duplicates"] == 1
+        assert missing_result["total_missing"] == 1
+
+    def test_run_checks_single_pass(self):
+        """Test the fused engine matches the individual checks and reports timings."""
+        df = pl.DataFrame(
+            {
+                "id": [1, 2, 2, None],
+                "label": ["a", "b", "b", "b"],
+            }
+        )
+
+        service = ValidateService()
+        run = service.run_checks(df)
+
+        assert set(run.results) == set(ValidateService.CHECKS)
+        assert set(run.timings_ms) == {"scan", *ValidateService.CHECKS}
+        assert run.results["duplicates"] == service.check_duplicates(df)
+        assert run.results["missing"]["total_missing"] == 1
+        assert run.results["labels"]["num_classes"] == 2
+        assert run.results["labels"]["distribution"] == {"a": 0.25, "b": 0.75}
+        assert run.results["schema"]["num_columns"] == 2
+
+        with pytest.raises(ValueError, match="Unknown checks"):
+            service.run_checks(df, ["spelling"])
+
+    def test_out_of_core_duplicates(self):
+        """Test spilled hash buckets give the same exact counts and row ids."""
+        df = pl.DataFrame(
+            {
+                "id": [i % 700 for i in range(1000)],
+                "text": [f"t{i % 700}" for i in range(1000)],
+            }
+        )
+
+        in_memory = DuplicateService().find_duplicates(df, return_ids=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spilling = DuplicateService(memory_budget_mb=1, spill_dir=Path(tmpdir))
+            spilling.BYTES_PER_ROW = 64 * 1024  # Force several buckets
+            spilled = spilling.find_duplicates(df.lazy(), return_ids=True)
+            assert list(Path(tmpdir).iterdir()) == []
+
+        assert spilled.partitions > 1
+        assert in_memory.duplicate_rows == spilled.duplicate_rows == 300
+        assert spilled.duplicate_ids.to_list() == list(range(700, 1000))
+        assert in_memory.duplicate_ids.to_list() == spilled.duplicate_ids.to_list()
+
+        result = ValidateService(memory_budget_mb=1).check_duplicates(df, columns=["id"], return_ids=True)
+        assert result["exact_duplicates"] == 300
+        assert result["duplicate_ids"][:2] == [700, 701]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_near_duplicates(self, workers):
+        """Test MinHash/LSH pairs lightly edited texts with their originals."""
+        rng = random.Random(0)
+        base = [" ".join(f"word{rng.randrange(5000)}" for _ in range(40)) for _ in range(200)]
+        edited = [text.replace(text.split()[3], "changed", 1) for text in base[:20]]
+        df = pl.DataFrame({"id": list(range(222)), "text": base + edited + [None, "  "]})
+
+        service = NearDuplicateService(threshold=0.8, workers=workers, batch_size=50)
+        report = service.find_near_duplicates(df, "text")
+
+        assert report.total_rows == 222
+        assert report.duplicate_ids.to_list() == list(range(200, 220))
+        assert report.pairs["duplicate_of"].to_list() == list(range(20))
+        assert report.pairs["similarity"].min() >= 0.8
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "data.parquet"
+            df.write_parquet(data_path)
+            result = DuplicateCheck().run(data_path, {"threshold": 0.8, "workers": 1})
+
+        assert result.details["exact_duplicates"] == 0
+        assert result.details["near_duplicates"] == 20
+        assert result.details["text_column"] == "text"
+
+    def test_validation_cache(self):
+        """Test unchanged source files reuse cached results and changed ones are rescanned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"id": [1, 1, 2], "label": ["a", "a", "b"]}).write_parquet(data_path)
+
+            cache = ValidationCache(Path(tmpdir) / "cache")
+            service = ValidateService(cache=cache)
+            first = service.run_checks(pl.scan_parquet(data_path), source_files=[data_path])
+            second = service.run_checks(pl.scan_parquet(data_path), source_files=[data_path])
+
+            assert not first.cached and second.cached
+            assert second.results == first.results
+            assert second.num_rows == 3
+            assert not service.run_checks(pl.scan_parquet(data_path), ["missing"], source_files=[data_path]).cached
+
+            pl.DataFrame({"id": [1, 2, 3, 4], "label": ["a", "b", "c", "d"]}).write_parquet(data_path)
+            changed = service.run_checks(pl.scan_parquet(data_path), source_files=[data_path])
+            assert not changed.cached
+            assert changed.results["duplicates"]["exact_duplicates"] == 0
+            cache.close()
+
+    def test_sampled_checks(self):
+        """Test sampled checks estimate table-wide ratios with confidence intervals."""
+        rng = random.Random(0)
+        n = 200_000
+        df = pl.DataFrame(
+            {
+                "key": [rng.randrange(150_000) for _ in range(n)],
+                "value": [None if i % 10 == 0 else i for i in range(n)],
+            }
+        )
+        true_duplicates = (n - df.select("key").n_unique()) / n
+
+        service = ValidateService()
+        run = service.run_sampled_checks(df.lazy().select("key"), 5, ["duplicates"], duplicate_sampling="hash")
+        low, high = run.results["duplicates"]["duplicate_ratio_ci"]
+        assert low <= true_duplicates <= high
+        assert run.num_rows == n
+        assert run.results["duplicates"]["sample_rows"] < n
+
+        run = service.run_sampled_checks(df.lazy(), 5, ["missing"], block_rows=500)
+        low, high = run.results["missing"]["estimates"]["value"]["missing_ratio_ci"]
+        assert low <= 0.1 <= high
+        assert run.results["missing"]["passed"] is False
+
     def test_check_missing_values(self):
         """Test missing value detection."""
         df = pl.DataFrame(
@@ -182,6 +639,53 @@ class TestValidateService:
         assert len(distribution) >= 1
 
 
+class TestCheckRunner:
+    """Integration tests for the check registry and runner."""
+
+    def test_discover_checks(self):
+        """Test built-in checks are discovered by name."""
+        checks = discover_checks()
+
+        assert checks["duplicates"] is DuplicateCheck
+        assert checks["leakage"] is LeakageCheck
+        assert BaseCheck not in checks.values()
+
+    def test_run_shares_dataset(self, monkeypatch):
+        """Test checks run on one shared read of the data and are all timed."""
+
+        # Not a BaseCheck subclass, so it does not leak into discover_checks()
+        class FailingCheck:
+            name = "failing"
+
+            def run_on(self, dataset: DatasetHandle, config: dict | None = None) -> CheckResult:
+                raise RuntimeError("boom")
+
+        reads = []
+        original = NormalizeService.read_dataset
+        monkeypatch.setattr(NormalizeService, "read_dataset", lambda self, source: reads.append(source) or original(self, source))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_path = Path(tmpdir) / "data.parquet"
+            pl.DataFrame({"id": [1, 1, 2], "label": ["a", "a", None]}).write_parquet(data_path)
+
+            runner = CheckRunner({**discover_checks(include_plugins=False), "failing": FailingCheck})
+            results = runner.run(
+                DatasetHandle(data_path),
+                ["duplicates", "missing_values", "label_distribution", "failing"],
+                {"missing_values": {"max_missing_ratio": 0.5}},
+            )
+
+        assert len(reads) == 1
+        assert [result.check_name for result in results] == ["duplicates", "missing_values", "label_distribution", "failing"]
+        assert results[0].details["exact_duplicates"] == 1
+        assert results[1].status == CheckStatus.PASSED
+        assert results[3].status == CheckStatus.ERROR
+        assert all(result.duration_ms is not None for result in results)
+
+        with pytest.raises(ValueError, match="Unknown checks"):
+            runner.run(Path("."), ["nope"])
+
+
 class TestExportService:
     """Integration tests for export service."""
 
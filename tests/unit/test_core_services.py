@@ -1,5 +1,6 @@
 """Unit tests for core services."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -367,6 +368,188 @@ class TestDriftService:
             baseline_path.unlink()
 
 
+    def test_numeric_drift_matches_per_column(self):
+        """Test batched numeric drift agrees with per-column PSI over the baseline range."""
+        import numpy as np
+        import polars as pl
+
+        from mldata.core.drift import DriftService
+
+        rng = np.random.default_rng(0)
+        baseline = pl.DataFrame(
+            {
+                "a": rng.normal(0, 1, 1000),
+                "b": rng.integers(0, 50, 1000),
+                "c": [None if i % 4 == 0 else float(i) for i in range(1000)],
+                "d": [float("nan")] * 10 + [1.0] * 990,
+            }
+        )
+        current = pl.DataFrame(
+            {
+                "a": rng.normal(1, 1, 1000),
+                "b": rng.integers(0, 60, 1000),
+                "c": [None if i % 3 == 0 else float(i) * 1.5 for i in range(1000)],
+                "d": [1.0] * 1000,
+            }
+        )
+
+        drift = DriftService()
+        # A small batch size exercises several histogram batches
+        drift.HISTOGRAM_BATCH_VALUES = 2000
+        results = drift.numeric_drift(baseline, current, baseline.columns)
+
+        for col in ("a", "b", "c"):
+            # Bin edges come from the baseline, so current values beyond them join the end bins
+            baseline_values = baseline[col].drop_nulls().to_numpy()
+            current_values = np.clip(current[col].drop_nulls().to_numpy(), baseline_values.min(), baseline_values.max())
+            expected = drift.compute_psi(baseline_values, current_values)
+            assert results[col]["psi"] == pytest.approx(expected)
+            assert results[col]["kl_divergence"] >= 0
+        assert results["a"]["drift_detected"]
+        assert results["c"]["baseline_stats"]["mean"] == pytest.approx(baseline["c"].mean())
+        assert results["d"]["psi"] == 0.0
+
+    def test_detect_drift_sharded_directories(self):
+        """Test drift detection reads every shard of each dataset."""
+        import polars as pl
+
+        from mldata.core.drift import DriftService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline_dir = Path(tmpdir) / "baseline"
+            current_dir = Path(tmpdir) / "current"
+            baseline_dir.mkdir()
+            current_dir.mkdir()
+            for i in range(3):
+                pl.DataFrame({"value": [float(x) for x in range(50)]}).write_parquet(baseline_dir / f"part-{i}.parquet")
+                pl.DataFrame({"value": [float(x) for x in range(50)]}).write_parquet(current_dir / f"part-{i}.parquet")
+
+            report = DriftService().detect_drift(baseline_dir, current_dir)
+
+            assert report.baseline_samples == 150
+            assert report.current_samples == 150
+            assert not report.overall_drift_detected
+
+
+    def test_drift_profile_reused(self, monkeypatch):
+        """Test a build's baseline profile is saved, reused while unchanged, and rebuilt when stale."""
+        import polars as pl
+
+        from mldata.core.drift import DriftProfile, DriftService
+        from mldata.core.normalize import NormalizeService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline_dir = Path(tmpdir) / "baseline"
+            (baseline_dir / "artifacts").mkdir(parents=True)
+            (baseline_dir / "manifest.yaml").write_text("dataset_id: baseline\n")
+            pl.DataFrame({"value": [float(x) for x in range(100)], "color": ["red", "blue"] * 50}).write_parquet(
+                baseline_dir / "artifacts" / "data.parquet"
+            )
+            current_path = Path(tmpdir) / "current.parquet"
+            current = pl.DataFrame({"value": [float(x) + 50 for x in range(100)], "color": ["blue", "green"] * 50})
+            current.write_parquet(current_path)
+
+            reads = []
+            original = NormalizeService.read_dataset
+            monkeypatch.setattr(
+                NormalizeService, "read_dataset", lambda self, source: reads.append(source) or original(self, source)
+            )
+
+            drift = DriftService()
+            first = drift.detect_drift(baseline_dir, current_path)
+            profile_file = baseline_dir / DriftService.PROFILE_FILE
+            assert profile_file.is_file()
+            assert len(reads) == 2
+
+            second = drift.detect_drift(baseline_dir, current_path)
+            assert len(reads) == 3  # Only the current data
+            assert second.numeric_drift == first.numeric_drift
+            assert second.numeric_drift["value"]["drift_detected"]
+            assert second.categorical_drift["color"]["drift_detected"]
+
+            from_file = drift.detect_drift(profile_file, current_path)
+            assert from_file.numeric_drift == first.numeric_drift
+
+            profile = DriftProfile.from_json(profile_file)
+            assert len(profile.numeric["value"]["edges"]) == drift.psi_bins + 1
+            assert sum(profile.numeric["value"]["counts"]) == 100
+            assert profile.categorical["color"]["counts"] == {"red": 50, "blue": 50}
+
+            pl.DataFrame({"value": [float(x) + 50 for x in range(100)], "color": ["blue"] * 100}).write_parquet(
+                baseline_dir / "artifacts" / "data.parquet"
+            )
+            os.utime(baseline_dir / "artifacts" / "data.parquet", ns=(0, 0))
+            assert not drift.detect_drift(baseline_dir, current_path).numeric_drift["value"]["drift_detected"]
+
+
+    def test_sketch_backend_matches_exact(self):
+        """Test the streaming sketch backend reports the same drift as reading the data."""
+        import numpy as np
+        import polars as pl
+
+        from mldata.core.drift import DriftService
+
+        rng = np.random.default_rng(0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline_path = Path(tmpdir) / "baseline.parquet"
+            current_dir = Path(tmpdir) / "current"
+            current_dir.mkdir()
+            pl.DataFrame({"value": rng.normal(0, 1, 5000), "color": rng.choice(["red", "blue"], 5000)}).write_parquet(
+                baseline_path, row_group_size=500
+            )
+            for i in range(2):
+                shard = pl.DataFrame({"value": rng.normal(0.5, 1, 2500), "color": rng.choice(["red", "blue", "green"], 2500)})
+                shard.write_parquet(current_dir / f"part-{i}.parquet", row_group_size=500)
+
+            exact = DriftService().detect_drift(baseline_path, current_dir)
+            sketched = DriftService(backend="sketch", workers=2, batch_size=700).detect_drift(baseline_path, current_dir)
+
+        assert sketched.current_samples == exact.current_samples == 5000
+        assert sketched.numeric_drift["value"]["psi"] == pytest.approx(exact.numeric_drift["value"]["psi"])
+        exact_std = exact.numeric_drift["value"]["current_stats"]["std"]
+        assert sketched.numeric_drift["value"]["current_stats"]["std"] == pytest.approx(exact_std)
+        assert sketched.categorical_drift == exact.categorical_drift
+
+
+class TestSketchService:
+    """Tests for mergeable drift sketches."""
+
+    def test_quantile_sketch_merge(self):
+        """Test merged quantile sketches track ranks and moments of the union."""
+        import numpy as np
+
+        from mldata.core.sketch import QuantileSketch
+
+        values = np.random.default_rng(0).normal(0, 1, 200_000)
+        left, right = QuantileSketch(k=512), QuantileSketch(k=512)
+        for start in range(0, 100_000, 10_000):
+            left.update(values[start : start + 10_000])
+        right.update(values[100_000:])
+        left.merge(QuantileSketch.from_dict(right.to_dict()))
+
+        points = np.array([-1.0, 0.0, 1.0])
+        expected = np.array([(values < point).mean() for point in points])
+        assert np.abs(left.cdf(points) - expected).max() < 0.01
+        assert left.count == 200_000
+        assert left.mean == pytest.approx(values.mean())
+        assert left.std == pytest.approx(values.std())
+        assert sum(len(level) for level in left.levels) < 5000
+
+    def test_category_sketch_cap(self):
+        """Test capped category counts fold the rarest values into other."""
+        from mldata.core.sketch import CategorySketch
+
+        sketch = CategorySketch(max_categories=2)
+        sketch.update({"a": 10, "b": 5})
+        other = CategorySketch(max_categories=2)
+        other.update({"c": 1, "a": 2})
+        sketch.merge(other)
+
+        assert sketch.counts == {"a": 12, "b": 5}
+        assert sketch.other == 1
+        assert sketch.count == 18
+
+
 class TestSchemaEvolutionService:
     """Tests for SchemaEvolutionService."""
 
@@ -952,6 +1135,140 @@ class TestFileIntegrityService:
                 shutil.rmtree(test_dir)
 
 
+    def test_near_duplicate_images(self):
+        """Test perceptual hashes pair resized copies and flag cross-split pairs."""
+        pytest.importorskip("PIL")
+
+        import random
+
+        from PIL import Image
+
+        from mldata.core.validate import FileIntegrityService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "train").mkdir()
+            (root / "test").mkdir()
+
+            def pattern(seed):
+                rng = random.Random(seed)
+                pixels = bytes(rng.randrange(256) for _ in range(64))
+                return Image.frombytes("L", (8, 8), pixels).resize((64, 64), Image.Resampling.BILINEAR).convert("RGB")
+
+            pattern(0).save(root / "train" / "a.png")
+            pattern(0).resize((48, 48)).save(root / "test" / "a_small.png")
+            pattern(1).save(root / "train" / "b.png")
+
+            for method in ("dhash", "phash"):
+                service = FileIntegrityService(hash_method=method, workers=2)
+                results = service.run_checks(sorted(root.rglob("*.png")))
+                report = service.find_near_duplicate_images(results)
+
+                assert all("perceptual_hash" in r.details for r in results)
+                assert len(report.pairs) == 1
+                assert {report.pairs[0]["path"].name, report.pairs[0]["duplicate_of"].name} == {"a.png", "a_small.png"}
+                assert len(report.cross_split_pairs) == 1
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_parallel_run_checks(self, executor):
+        """Test pooled checks keep input order and stream every result."""
+        pytest.importorskip("PIL")
+
+        from PIL import Image
+
+        from mldata.core.validate import FileIntegrityService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for index in range(10):
+                path = Path(tmpdir) / f"img{index}.png"
+                if index % 3 == 0:
+                    path.write_bytes(b"corrupt")
+                else:
+                    Image.new("RGB", (8 + index, 8), color="green").save(path)
+                paths.append(path)
+
+            service = FileIntegrityService(workers=2, executor=executor, chunk_size=3)
+            results = service.run_checks(paths)
+
+            assert [r.path for r in results] == paths
+            assert [r.is_valid for r in results] == [index % 3 != 0 for index in range(10)]
+            assert results[1].details["width"] == 9
+            assert sorted(r.path for r in service.iter_checks(paths)) == sorted(paths)
+
+        with pytest.raises(ValueError, match="Unknown executor"):
+            FileIntegrityService(executor="gpu")
+
+    def test_validation_levels(self):
+        """Test header-level checks skip decoding but still catch truncated files."""
+        pytest.importorskip("PIL")
+
+        from PIL import Image
+
+        from mldata.core.validate import FileIntegrityService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            complete = Path(tmpdir) / "complete.png"
+            truncated = Path(tmpdir) / "truncated.png"
+            Image.effect_noise((64, 64), 50).save(complete)
+            truncated.write_bytes(complete.read_bytes()[:-200])
+
+            header = FileIntegrityService(level="header")
+            assert header.validate_image(complete).details["level"] == "header"
+            assert "perceptual_hash" not in header.validate_image(complete).details
+            assert "truncated" in header.validate_image(truncated).error
+
+            full = FileIntegrityService(level="full")
+            assert full.validate_image(complete).details["level"] == "full"
+            assert not full.validate_image(truncated).is_valid
+
+            paths = [Path(tmpdir) / f"img{i}.png" for i in range(200)]
+            decoded = sum(FileIntegrityService(level="sample", decode_fraction=0.25).should_decode(p) for p in paths)
+            assert 25 < decoded < 75
+
+        with pytest.raises(ValueError, match="Unknown validation level"):
+            FileIntegrityService(level="deep")
+
+    def test_file_check_cache(self):
+        """Test cached file results are reused until the file changes."""
+        from mldata.core.cache import ValidationCache
+        from mldata.core.validate import FileIntegrityService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "broken.png"
+            path.write_bytes(b"not an image")
+
+            cache = ValidationCache(Path(tmpdir) / "cache", content_hash=True)
+            service = FileIntegrityService(workers=1, cache=cache)
+            first = service.run_checks([path])[0]
+
+            key = cache.key([path], service._options())
+            assert cache.get(key) == first
+            assert service.run_checks([path])[0] == first
+
+            path.write_bytes(b"still not an image, but different")
+            assert cache.get(cache.key([path], service._options())) is None
+            cache.close()
+
+    def test_bk_tree_search(self):
+        """Test BK-tree radius search matches a linear scan."""
+        import random
+
+        from mldata.core.dedup import BKTree
+
+        rng = random.Random(0)
+        values = [rng.getrandbits(64) for _ in range(300)]
+        values += [value ^ (1 << rng.randrange(64)) for value in values[:50]]
+
+        tree = BKTree()
+        for index, value in enumerate(values):
+            tree.add(value, index)
+
+        for value in values[:20]:
+            expected = sorted(i for i, other in enumerate(values) if bin(value ^ other).count("1") <= 3)
+            assert sorted(item for _, item in tree.search(value, 3)) == expected
+
+
 class TestDVCService:
     """Tests for DVCService."""
 
@@ -1322,11 +1639,12 @@ class TestMultiFormatExport:
             export = ExportService()
             results = export.export_all_formats(df, test_dir)
 
-            assert len(results) == 4  # parquet, csv, json, jsonl
+            assert len(results) == 5  # parquet, csv, json, jsonl, arrow
             assert (test_dir / "data.parquet").exists()
             assert (test_dir / "data.csv").exists()
             assert (test_dir / "data.json").exists()
             assert (test_dir / "data.jsonl").exists()
+            assert (test_dir / "data.arrow").exists()
         finally:
             import shutil
 